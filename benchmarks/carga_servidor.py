@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Prueba de Carga del Servidor de Cálculo
+=======================================
+
+Lanza varios clientes concurrentes contra `paquete.servidor` y reporta el
+rendimiento (peticiones por segundo) y la latencia p50/p99.
+
+Si no se indica un servidor, se inicia uno en el mismo proceso sobre un
+puerto libre.
+
+Uso:
+    python benchmarks/carga_servidor.py
+    python benchmarks/carga_servidor.py --peticiones 50000 --clientes 8
+    python benchmarks/carga_servidor.py --puerto 8765 --funcion es_primo
+
+Autor: Tu Nombre
+Fecha: 2024
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from paquete.servidor import ClienteCalculo, ServidorCalculo  # noqa: E402
+
+
+def percentil(valores, p):
+    """Devuelve el percentil p (0-100) de una lista ordenada."""
+    if not valores:
+        return 0.0
+    indice = min(int(len(valores) * p / 100), len(valores) - 1)
+    return valores[indice]
+
+
+def generar_argumentos(funcion, cantidad):
+    """Genera argumentos de prueba para la función indicada."""
+    if funcion in ("factorial",):
+        return [[random.randint(0, 300)] for _ in range(cantidad)]
+    if funcion in ("es_primo", "es_par"):
+        return [[random.randint(1, 10**12)] for _ in range(cantidad)]
+    if funcion == "raiz_cuadrada":
+        return [[random.uniform(0, 1e6)] for _ in range(cantidad)]
+    return [[random.uniform(-1e3, 1e3), random.uniform(1, 1e3)] for _ in range(cantidad)]
+
+
+async def cliente(host, puerto, funcion, argumentos, concurrencia, latencias):
+    """Envía las peticiones de un cliente manteniendo `concurrencia` en vuelo."""
+    async with ClienteCalculo(host, puerto) as conexion:
+        semaforo = asyncio.Semaphore(concurrencia)
+
+        async def una(args):
+            async with semaforo:
+                inicio = time.perf_counter()
+                try:
+                    await conexion.llamar(funcion, *args)
+                except Exception:
+                    pass
+                latencias.append(time.perf_counter() - inicio)
+
+        await asyncio.gather(*(una(args) for args in argumentos))
+
+
+async def ejecutar(opciones):
+    """Ejecuta la prueba de carga y muestra el resumen."""
+    servidor = None
+    puerto = opciones.puerto
+    if puerto is None:
+        servidor = ServidorCalculo("127.0.0.1", 0)
+        await servidor.iniciar()
+        puerto = servidor.puerto
+
+    por_cliente = opciones.peticiones // opciones.clientes
+    latencias = []
+    inicio = time.perf_counter()
+    try:
+        await asyncio.gather(*(
+            cliente(opciones.host, puerto, opciones.funcion,
+                    generar_argumentos(opciones.funcion, por_cliente),
+                    opciones.concurrencia, latencias)
+            for _ in range(opciones.clientes)
+        ))
+    finally:
+        duracion = time.perf_counter() - inicio
+        if servidor is not None:
+            await servidor.cerrar()
+
+    latencias.sort()
+    total = len(latencias)
+    print(f"Función:        {opciones.funcion}")
+    print(f"Peticiones:     {total}")
+    print(f"Clientes:       {opciones.clientes} (concurrencia {opciones.concurrencia} c/u)")
+    print(f"Duración:       {duracion:.3f} s")
+    print(f"Rendimiento:    {total / duracion:,.0f} peticiones/s")
+    print(f"Latencia p50:   {percentil(latencias, 50) * 1000:.3f} ms")
+    print(f"Latencia p99:   {percentil(latencias, 99) * 1000:.3f} ms")
+
+
+def main():
+    """Punto de entrada de la prueba de carga."""
+    parser = argparse.ArgumentParser(description="Prueba de carga del servidor de cálculo")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=None,
+                        help="Puerto de un servidor existente (por defecto inicia uno)")
+    parser.add_argument("--funcion", default="suma")
+    parser.add_argument("--peticiones", type=int, default=20000)
+    parser.add_argument("--clientes", type=int, default=4)
+    parser.add_argument("--concurrencia", type=int, default=64,
+                        help="Peticiones en vuelo por cliente")
+    asyncio.run(ejecutar(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Suite de Rendimiento
+====================
+
+Mide cada función pública de `paquete.operaciones` y `paquete.utilidades`
+con entradas pequeñas, medianas y enormes, usando solo `timeit`. Los
+resultados (segundos por llamada, el mínimo de varias repeticiones) se
+pueden guardar como línea base en JSON y comparar después: el modo de
+comparación termina con código 1 si alguna función empeoró más que el
+umbral indicado.
+
+Las funciones interactivas se miden con `input`, `os.system` y
+`time.sleep` reemplazados y con la salida descartada, así que la suite
+corre sin terminal y sin red.
+
+Uso:
+    python benchmarks/suite.py
+    python benchmarks/suite.py --guardar linea_base.json
+    python benchmarks/suite.py --comparar linea_base.json --umbral 0.25
+    python benchmarks/suite.py --filtro es_primo --tamanos enorme
+
+Autor: Tu Nombre
+Fecha: 2024
+"""
+
+import argparse
+import builtins
+import contextlib
+import inspect
+import io
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from paquete import entradas, operaciones, utilidades  # noqa: E402
+from paquete.factoriales import limpiar_puntos_control  # noqa: E402
+
+TAMANOS = ("pequeno", "mediano", "enorme")
+
+# Versión del formato del archivo de línea base
+VERSION_FORMATO = 1
+
+# Respuestas que recibe `input` mientras se mide, por función
+_RESPUESTAS = {
+    "obtener_nombre_usuario": "ana maría",
+    "obtener_numero": "3.5",
+    "pausar": "",
+    "confirmar": "s",
+    "obtener_opcion_menu": "2",
+}
+
+_FECHA = datetime(2024, 5, 17, 13, 45, 30)
+
+# Operandos enormes, construidos una sola vez fuera de la medición
+_ENTERO_A = 7 ** 5000
+_ENTERO_B = 3 ** 8000
+_DIEZ_300 = 10 ** 300
+_SIETE_300 = 7 ** 300
+_MERSENNE_127 = 2 ** 127 - 1
+_EMAIL_LARGO = "a" * 10_000 + "@" + "b" * 10_000 + ".com"
+_MENSAJE_LARGO = "x" * 100_000
+_OPCIONES_MENU = [f"opción {i}" for i in range(100)]
+_LINEAS_NUMEROS = {
+    cantidad: [" ".join(f"{i + j}.5" for j in range(10)) for i in range(0, cantidad, 10)]
+    for cantidad in (10, 1000, 100_000)
+}
+
+
+def _factorial_sin_cache(n):
+    """Factorial calculado desde cero, sin reutilizar puntos de control."""
+    def llamada():
+        limpiar_puntos_control()
+        return operaciones.factorial(n)
+    return llamada
+
+
+def _obtener_numeros(cantidad, tipo="float"):
+    """obtener_numeros leyendo `cantidad` números de una fuente en memoria."""
+    lineas = _LINEAS_NUMEROS[cantidad]
+
+    def llamada():
+        with entradas.usar_fuente(entradas.FuenteLineas(lineas)):
+            return utilidades.obtener_numeros(tipo)
+    return llamada
+
+
+# (módulo, función) -> {tamaño: llamada sin argumentos}
+CASOS = {
+    ("operaciones", "suma"): {
+        "pequeno": lambda: operaciones.suma(3, 4),
+        "mediano": lambda: operaciones.suma(1.5e10, 2.25e10),
+        "enorme": lambda: operaciones.suma(_ENTERO_A, _ENTERO_B),
+    },
+    ("operaciones", "resta"): {
+        "pequeno": lambda: operaciones.resta(10, 4),
+        "mediano": lambda: operaciones.resta(1.5e10, 2.25e10),
+        "enorme": lambda: operaciones.resta(_ENTERO_A, _ENTERO_B),
+    },
+    ("operaciones", "multiplicacion"): {
+        "pequeno": lambda: operaciones.multiplicacion(6, 7),
+        "mediano": lambda: operaciones.multiplicacion(123456789, 987654321),
+        "enorme": lambda: operaciones.multiplicacion(_ENTERO_A, _ENTERO_B),
+    },
+    ("operaciones", "division"): {
+        "pequeno": lambda: operaciones.division(10, 4),
+        "mediano": lambda: operaciones.division(1.5e10, 3.3e3),
+        "enorme": lambda: operaciones.division(_DIEZ_300, _SIETE_300),
+    },
+    ("operaciones", "potencia"): {
+        "pequeno": lambda: operaciones.potencia(2, 10),
+        "mediano": lambda: operaciones.potencia(1.0001, 1000.5),
+        "enorme": lambda: operaciones.potencia(3, 20000),
+    },
+    ("operaciones", "raiz_cuadrada"): {
+        "pequeno": lambda: operaciones.raiz_cuadrada(16),
+        "mediano": lambda: operaciones.raiz_cuadrada(1.5e10),
+        "enorme": lambda: operaciones.raiz_cuadrada(_DIEZ_300),
+    },
+    ("operaciones", "factorial"): {
+        "pequeno": _factorial_sin_cache(10),
+        "mediano": _factorial_sin_cache(500),
+        "enorme": _factorial_sin_cache(20000),
+    },
+    ("operaciones", "porcentaje"): {
+        "pequeno": lambda: operaciones.porcentaje(25, 200),
+        "mediano": lambda: operaciones.porcentaje(1.5e10, 7.5e10),
+        "enorme": lambda: operaciones.porcentaje(_DIEZ_300, 10 * _DIEZ_300),
+    },
+    ("operaciones", "redondear"): {
+        "pequeno": lambda: operaciones.redondear(3.14159),
+        "mediano": lambda: operaciones.redondear(123456.789123, 4),
+        "enorme": lambda: operaciones.redondear(1.23456789e300, 15),
+    },
+    ("operaciones", "es_par"): {
+        "pequeno": lambda: operaciones.es_par(42),
+        "mediano": lambda: operaciones.es_par(1_000_000_007),
+        "enorme": lambda: operaciones.es_par(_ENTERO_A),
+    },
+    ("operaciones", "es_primo"): {
+        "pequeno": lambda: operaciones.es_primo(97),
+        "mediano": lambda: operaciones.es_primo(1_000_003),
+        "enorme": lambda: operaciones.es_primo(_MERSENNE_127),
+    },
+    ("utilidades", "imprimir_mensaje"): {
+        "pequeno": lambda: utilidades.imprimir_mensaje("hola"),
+        "mediano": lambda: utilidades.imprimir_mensaje("x" * 1000, "warning"),
+        "enorme": lambda: utilidades.imprimir_mensaje(_MENSAJE_LARGO, "error"),
+    },
+    ("utilidades", "obtener_nombre_usuario"): {
+        "pequeno": utilidades.obtener_nombre_usuario,
+    },
+    ("utilidades", "obtener_numero"): {
+        "pequeno": lambda: utilidades.obtener_numero("Número"),
+        "mediano": lambda: utilidades.obtener_numero("Número", "float"),
+    },
+    ("utilidades", "obtener_numeros"): {
+        "pequeno": _obtener_numeros(10),
+        "mediano": _obtener_numeros(1000, "auto"),
+        "enorme": _obtener_numeros(100_000),
+    },
+    ("utilidades", "limpiar_pantalla"): {
+        "pequeno": utilidades.limpiar_pantalla,
+    },
+    ("utilidades", "pausar"): {
+        "pequeno": utilidades.pausar,
+    },
+    ("utilidades", "validar_email"): {
+        "pequeno": lambda: utilidades.validar_email("ana@ejemplo.com"),
+        "mediano": lambda: utilidades.validar_email("nombre.apellido+etiqueta@sub.dominio.ejemplo.org"),
+        "enorme": lambda: utilidades.validar_email(_EMAIL_LARGO),
+    },
+    ("utilidades", "formatear_fecha"): {
+        "pequeno": lambda: utilidades.formatear_fecha(_FECHA),
+        "mediano": lambda: utilidades.formatear_fecha(_FECHA, "%A %d de %B de %Y, %H:%M:%S.%f"),
+    },
+    ("utilidades", "generar_id"): {
+        "pequeno": utilidades.generar_id,
+        "mediano": lambda: utilidades.generar_id(32),
+        "enorme": lambda: utilidades.generar_id(4096),
+    },
+    ("utilidades", "mostrar_progreso"): {
+        "pequeno": lambda: utilidades.mostrar_progreso(5, 10),
+        "mediano": lambda: utilidades.mostrar_progreso(123_456, 1_000_000),
+    },
+    ("utilidades", "esperar"): {
+        "pequeno": lambda: utilidades.esperar(0, False),
+    },
+    ("utilidades", "confirmar"): {
+        "pequeno": utilidades.confirmar,
+    },
+    ("utilidades", "obtener_opcion_menu"): {
+        "pequeno": lambda: utilidades.obtener_opcion_menu(["a", "b", "c"]),
+        "mediano": lambda: utilidades.obtener_opcion_menu(_OPCIONES_MENU),
+    },
+    ("utilidades", "formatear_numero"): {
+        "pequeno": lambda: utilidades.formatear_numero(1234),
+        "mediano": lambda: utilidades.formatear_numero(1234567.891),
+        "enorme": lambda: utilidades.formatear_numero(_ENTERO_A),
+    },
+}
+
+
+def funciones_publicas():
+    """Devuelve (módulo, función) de cada función pública de los módulos medidos."""
+    nombres = []
+    for modulo in (operaciones, utilidades):
+        corto = modulo.__name__.rsplit(".", 1)[1]
+        for nombre, objeto in inspect.getmembers(modulo, inspect.isfunction):
+            if not nombre.startswith("_") and objeto.__module__ == modulo.__name__:
+                nombres.append((corto, nombre))
+    return sorted(nombres)
+
+
+@contextlib.contextmanager
+def entorno_silencioso(funcion):
+    """Reemplaza input, os.system y time.sleep y descarta la salida."""
+    respuesta = _RESPUESTAS.get(funcion, "")
+    originales = (builtins.input, os.system, time.sleep)
+    builtins.input = lambda mensaje="": respuesta
+    os.system = lambda comando: 0
+    time.sleep = lambda segundos: None
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        builtins.input, os.system, time.sleep = originales
+
+
+def medir(llamada, repeticiones, tiempo_minimo):
+    """
+    Mide una llamada con timeit.
+
+    Returns:
+        float: Segundos por llamada (mínimo de las repeticiones)
+    """
+    temporizador = timeit.Timer(llamada)
+    numero = 1
+    # Como Timer.autorange, pero con un tiempo mínimo configurable
+    while True:
+        if temporizador.timeit(numero) >= tiempo_minimo:
+            break
+        numero *= 2 if numero < 1000 else 10
+    tiempos = temporizador.repeat(repeticiones, numero)
+    return min(tiempos) / numero
+
+
+def ejecutar(filtro=None, tamanos=TAMANOS, repeticiones=5, tiempo_minimo=0.05):
+    """
+    Ejecuta los casos seleccionados.
+
+    Returns:
+        dict: 'modulo.funcion[tamaño]' -> segundos por llamada
+    """
+    resultados = {}
+    for (modulo, funcion), casos in sorted(CASOS.items()):
+        if filtro and filtro not in f"{modulo}.{funcion}":
+            continue
+        for tamano in tamanos:
+            if tamano not in casos:
+                continue
+            clave = f"{modulo}.{funcion}[{tamano}]"
+            with entorno_silencioso(funcion):
+                segundos = medir(casos[tamano], repeticiones, tiempo_minimo)
+            resultados[clave] = segundos
+            print(f"{clave:<48} {_formatear_tiempo(segundos):>12}", file=sys.stderr)
+    return resultados
+
+
+def _formatear_tiempo(segundos):
+    """Formatea una duración con la unidad más legible."""
+    for unidad, escala in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if segundos >= escala:
+            return f"{segundos / escala:.3f} {unidad}"
+    return f"{segundos / 1e-9:.1f} ns"
+
+
+def guardar(resultados, ruta):
+    """Guarda los resultados como línea base en JSON."""
+    datos = {
+        "version": VERSION_FORMATO,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "resultados": resultados,
+    }
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(datos, archivo, indent=2, ensure_ascii=False, sort_keys=True)
+        archivo.write("\n")
+
+
+def comparar(resultados, ruta, umbral):
+    """
+    Compara los resultados con una línea base.
+
+    Returns:
+        list: Claves de las funciones que empeoraron más que el umbral
+    """
+    with open(ruta, encoding="utf-8") as archivo:
+        datos = json.load(archivo)
+    if datos.get("version") != VERSION_FORMATO:
+        raise ValueError(f"Versión de línea base no soportada: {datos.get('version')!r}")
+    base = datos["resultados"]
+
+    regresiones = []
+    print(f"\n{'caso':<48} {'base':>12} {'actual':>12} {'cambio':>9}")
+    for clave, segundos in resultados.items():
+        if clave not in base:
+            print(f"{clave:<48} {'-':>12} {_formatear_tiempo(segundos):>12} {'nuevo':>9}")
+            continue
+        cambio = segundos / base[clave] - 1
+        marca = ""
+        if cambio > umbral:
+            regresiones.append(clave)
+            marca = "  REGRESIÓN"
+        print(f"{clave:<48} {_formatear_tiempo(base[clave]):>12} "
+              f"{_formatear_tiempo(segundos):>12} {cambio:>+8.1%}{marca}")
+    return regresiones
+
+
+def parsear_argumentos(argv=None):
+    """Parsea los argumentos de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Suite de rendimiento de paquete")
+    parser.add_argument("--guardar", metavar="ARCHIVO", help="guardar los resultados como línea base")
+    parser.add_argument("--comparar", metavar="ARCHIVO", help="comparar con una línea base")
+    parser.add_argument("--umbral", type=float, default=0.25,
+                        help="empeoramiento relativo tolerado al comparar (0.25 = 25%%)")
+    parser.add_argument("--filtro", help="medir solo las funciones cuyo nombre contiene este texto")
+    parser.add_argument("--tamanos", default=",".join(TAMANOS),
+                        help="tamaños a medir, separados por comas")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--tiempo-minimo", type=float, default=0.05,
+                        help="segundos mínimos de cada repetición")
+    opciones = parser.parse_args(argv)
+
+    opciones.tamanos = tuple(t for t in opciones.tamanos.split(",") if t)
+    desconocidos = set(opciones.tamanos) - set(TAMANOS)
+    if desconocidos:
+        parser.error(f"tamaños desconocidos: {', '.join(sorted(desconocidos))}")
+    if opciones.umbral < 0:
+        parser.error("el umbral no puede ser negativo")
+    return opciones
+
+
+def main(argv=None):
+    """Punto de entrada de la suite."""
+    opciones = parsear_argumentos(argv)
+
+    sin_casos = [f"{m}.{f}" for m, f in funciones_publicas() if (m, f) not in CASOS]
+    if sin_casos:
+        print(f"Funciones públicas sin casos: {', '.join(sin_casos)}", file=sys.stderr)
+
+    resultados = ejecutar(opciones.filtro, opciones.tamanos,
+                          opciones.repeticiones, opciones.tiempo_minimo)
+
+    if opciones.guardar:
+        guardar(resultados, opciones.guardar)
+        print(f"Línea base guardada en {opciones.guardar}", file=sys.stderr)
+
+    if opciones.comparar:
+        regresiones = comparar(resultados, opciones.comparar, opciones.umbral)
+        if regresiones:
+            print(f"\n{len(regresiones)} regresiones por encima de {opciones.umbral:.0%}")
+            return 1
+        print(f"\nSin regresiones por encima de {opciones.umbral:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tiempo de Importación del Paquete
+=================================
+
+Mide el costo de importar `paquete` con `python -X importtime` en
+procesos nuevos y reporta, para cada forma de importación, la mediana del
+tiempo acumulado de los módulos del paquete y de todos los módulos
+cargados.
+
+Uso:
+    python benchmarks/tiempo_importacion.py
+    python benchmarks/tiempo_importacion.py --repeticiones 20 --json importacion.json
+
+Autor: Tu Nombre
+Fecha: 2024
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Formas de importación a medir
+SENTENCIAS = [
+    "import paquete",
+    "from paquete import suma",
+    "from paquete import validar_email",
+    "from paquete import *",
+    "from paquete import operaciones, utilidades",
+]
+
+
+def medir(sentencia):
+    """
+    Ejecuta una sentencia en un proceso nuevo con -X importtime.
+
+    Returns:
+        dict: Microsegundos acumulados del paquete y del total, y la lista
+        de módulos importados
+    """
+    proceso = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", sentencia],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    )
+
+    paquete = total = 0
+    modulos = []
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        # Formato: "import time: <propio> | <acumulado> | <sangría><módulo>"
+        _, acumulado, nombre = linea.split("|")
+        nivel = len(nombre) - len(nombre.lstrip())
+        nombre = nombre.strip()
+        modulos.append(nombre)
+        acumulado = int(acumulado)
+        if nivel == 1:
+            # Módulos de primer nivel: su tiempo acumulado incluye a los anidados
+            total += acumulado
+            if nombre == "paquete" or nombre.startswith("paquete."):
+                paquete += acumulado
+    return {"paquete_us": paquete, "total_us": total, "modulos": modulos}
+
+
+def main():
+    """Punto de entrada del benchmark de importación."""
+    parser = argparse.ArgumentParser(description="Mide el tiempo de importación de paquete")
+    parser.add_argument("--repeticiones", type=int, default=10)
+    parser.add_argument("--json", metavar="ARCHIVO", help="Guardar los resultados en JSON")
+    opciones = parser.parse_args()
+
+    resultados = {}
+    print(f"{'Sentencia':<45} {'paquete (ms)':>13} {'total (ms)':>11} {'módulos':>8}")
+    for sentencia in SENTENCIAS:
+        muestras = [medir(sentencia) for _ in range(opciones.repeticiones)]
+        paquete = statistics.median(m["paquete_us"] for m in muestras)
+        total = statistics.median(m["total_us"] for m in muestras)
+        modulos = muestras[-1]["modulos"]
+        resultados[sentencia] = {
+            "paquete_us": paquete,
+            "total_us": total,
+            "modulos": len(modulos),
+            "modulos_paquete": sorted(m for m in modulos if m.startswith("paquete")),
+        }
+        print(f"{sentencia:<45} {paquete / 1000:>13.2f} {total / 1000:>11.2f} {len(modulos):>8}")
+
+    if opciones.json:
+        with open(opciones.json, "w", encoding="utf-8") as archivo:
+            json.dump({"python": sys.version.split()[0], "resultados": resultados},
+                      archivo, indent=2, ensure_ascii=False)
+        print(f"\nResultados guardados en {opciones.json}")
+
+
+if __name__ == "__main__":
+    main()
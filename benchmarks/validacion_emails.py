@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Rendimiento de la Validación de Emails
+======================================
+
+Compara el rendimiento de llamar a `utilidades.validar_email` en un bucle
+(y a `re.match` con el patrón como texto, como hacía la versión 1.0) con
+el de `correos.filtrar_emails` y `correos.validar_emails`, en un solo
+proceso y repartido entre varios procesos. `validar_emails` además
+calcula el motivo de cada rechazo.
+
+Cada variante se mide varias veces y se informa la mejor.
+
+Uso:
+    python benchmarks/validacion_emails.py
+    python benchmarks/validacion_emails.py --cantidad 2000000 --procesos 4 --repeticiones 5
+
+Autor: Tu Nombre
+Fecha: 2024
+"""
+
+import argparse
+import os
+import random
+import re
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from paquete.correos import PATRON_EMAIL, filtrar_emails, validar_emails  # noqa: E402
+from paquete.utilidades import validar_email  # noqa: E402
+
+
+def generar_emails(cantidad, semilla=42):
+    """Genera una mezcla de direcciones válidas e inválidas."""
+    aleatorio = random.Random(semilla)
+    letras = string.ascii_lowercase + string.digits
+    emails = []
+    for _ in range(cantidad):
+        usuario = "".join(aleatorio.choices(letras, k=aleatorio.randint(3, 12)))
+        dominio = "".join(aleatorio.choices(string.ascii_lowercase, k=aleatorio.randint(3, 10)))
+        tipo = aleatorio.random()
+        if tipo < 0.7:
+            emails.append(f"{usuario}@{dominio}.com")
+        elif tipo < 0.8:
+            emails.append(f"{usuario}{dominio}.com")
+        elif tipo < 0.9:
+            emails.append(f"{usuario}@{dominio}")
+        else:
+            emails.append(f"{usuario} @{dominio}.c")
+    return emails
+
+
+def medir(nombre, funcion, cantidad, repeticiones):
+    """Ejecuta una variante varias veces y muestra su mejor rendimiento."""
+    duracion = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        validos = funcion()
+        duracion = min(duracion, time.perf_counter() - inicio)
+    print(f"{nombre:<38} {duracion:>8.3f} s {cantidad / duracion:>14,.0f} emails/s  ({validos} válidos)")
+    return duracion
+
+
+def main():
+    """Punto de entrada del benchmark."""
+    parser = argparse.ArgumentParser(description="Compara la validación de emails")
+    parser.add_argument("--cantidad", type=int, default=500_000)
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    opciones = parser.parse_args()
+
+    emails = generar_emails(opciones.cantidad)
+    cantidad, repeticiones = opciones.cantidad, max(opciones.repeticiones, 1)
+    print(f"{cantidad:,} direcciones, mejor de {repeticiones} repeticiones\n")
+
+    patron = PATRON_EMAIL.pattern
+    medir("re.match(patrón en texto) en un bucle",
+          lambda: sum(1 for e in emails if re.match(patron, e)), cantidad, repeticiones)
+    base = medir("validar_email en un bucle",
+                 lambda: sum(1 for e in emails if validar_email(e)), cantidad, repeticiones)
+    filtrado = medir("filtrar_emails",
+                     lambda: sum(1 for _ in filtrar_emails(emails)), cantidad, repeticiones)
+    print(f"{'':<38} aceleración x{base / filtrado:.2f}")
+    unico = medir("validar_emails (1 proceso)",
+                  lambda: sum(ok for _, ok, _ in validar_emails(emails)), cantidad, repeticiones)
+    print(f"{'':<38} aceleración x{base / unico:.2f}")
+    if opciones.procesos > 1:
+        varios = medir(f"validar_emails ({opciones.procesos} procesos)",
+                       lambda: sum(ok for _, ok, _ in validar_emails(emails, opciones.procesos)),
+                       cantidad, repeticiones)
+        print(f"{'':<38} aceleración x{base / varios:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,88 +7,161 @@ Este es el archivo principal que demuestra el uso de los módulos
 del paquete personalizado. Incluye operaciones matemáticas básicas
 y utilidades de interacción con el usuario.
 
+Uso:
+    python main.py                      # Modo interactivo
+    python main.py --lote archivo.txt   # Modo por lotes desde un archivo
+    python main.py --lote - < datos     # Modo por lotes desde stdin
+    python main.py --lote ops.txt --formato columnar --salida res.col
+    python main.py --plugin mis_ops     # Registra operaciones de otro módulo
+    python main.py --respuestas r.txt   # Modo interactivo con respuestas de un archivo
+
 Autor: Tu Nombre
 Fecha: 2024
 Versión: 1.0
 """
 
+import argparse
+import importlib
+import json
 import sys
-from paquete import operaciones, utilidades
+from paquete import entradas, utilidades
+from paquete.columnas import EscritorColumnar
+from paquete.registro import buscar_operacion, obtener_operacion, operaciones_registradas
+
+
+def opciones_menu():
+    """
+    Asocia cada número del menú con su operación registrada.
+    
+    Returns:
+        dict: Opción ("1", "2", ...) -> nombre de la operación
+    """
+    return {str(i): op.nombre for i, op in enumerate(operaciones_registradas(), 1)}
+
+
+def opcion_salir():
+    """
+    Devuelve la opción del menú que termina el programa (la última).
+    
+    Returns:
+        str: El número de la opción de salida
+    """
+    return str(len(operaciones_registradas()) + 1)
 
 
 def mostrar_menu():
     """
-    Muestra el menú principal de opciones disponibles.
+    Muestra el menú principal, generado a partir del registro de operaciones.
     
     Returns:
         str: La opción seleccionada por el usuario
     """
+    operaciones = operaciones_registradas()
+    salir = len(operaciones) + 1
+    
     print("\n" + "="*50)
     print("        CALCULADORA INTERACTIVA")
     print("="*50)
-    print("1. Sumar dos números")
-    print("2. Restar dos números")
-    print("3. Multiplicar dos números")
-    print("4. Dividir dos números")
-    print("5. Calcular potencia")
-    print("6. Salir")
+    for i, operacion in enumerate(operaciones, 1):
+        print(f"{i}. {operacion.etiqueta}")
+    print(f"{salir}. Salir")
     print("="*50)
     
-    return input("Selecciona una opción (1-6): ")
+    return entradas.leer(f"Selecciona una opción (1-{salir}): ")
+
 
+# Ordinales usados al pedir los argumentos de una operación
+ORDINALES = ("primer", "segundo", "tercer", "cuarto", "quinto")
 
-def obtener_numeros():
+
+def obtener_argumentos(operacion):
     """
-    Solicita al usuario que ingrese dos números.
+    Solicita al usuario los argumentos de una operación registrada.
+    
+    Los parámetros enteros se leen como int y el resto como float.
     
+    Args:
+        operacion (Operacion): La operación del registro
+        
     Returns:
-        tuple: (numero1, numero2) o (None, None) si hay error
+        tuple: Los argumentos, o None si hay error
     """
+    argumentos = []
     try:
-        num1 = float(input("Ingresa el primer número: "))
-        num2 = float(input("Ingresa el segundo número: "))
-        return num1, num2
+        for i, tipo in enumerate(operacion.tipos):
+            if operacion.maximo == 1:
+                mensaje = "Ingresa el número: "
+            elif i < len(ORDINALES):
+                mensaje = f"Ingresa el {ORDINALES[i]} número: "
+            else:
+                mensaje = f"Ingresa {operacion.parametros[i]}: "
+            texto = entradas.leer(mensaje)
+            argumentos.append(int(texto) if tipo is int else float(texto))
     except ValueError:
         utilidades.imprimir_mensaje("❌ Error: Por favor ingresa números válidos.")
-        return None, None
+        return None
+    return tuple(argumentos)
+
+
+def _de(descripcion):
+    """Antepone 'de' a una descripción, contrayendo 'de el' en 'del'."""
+    if descripcion.startswith("el "):
+        return "del " + descripcion[3:]
+    return "de " + descripcion
+
+
+def calcular(opcion, *argumentos):
+    """
+    Calcula la operación seleccionada sin imprimir nada.
+    
+    Args:
+        opcion (str): La opción del menú ("1", "2", ...) o el nombre de la operación
+        *argumentos: Argumentos de la operación
+        
+    Returns:
+        tuple: (resultado, descripción de la operación, por ejemplo 'la suma')
+        
+    Raises:
+        ValueError: Si la opción no es válida o los argumentos no cumplen la validación
+        TypeError, ZeroDivisionError: Los errores propios de cada operación
+    """
+    operacion = buscar_operacion(opcion)
+    if operacion is None:
+        nombre = opciones_menu().get(opcion)
+        if nombre is None:
+            raise ValueError("Opción no válida")
+        operacion = obtener_operacion(nombre)
+    
+    return operacion(*argumentos), operacion.descripcion
 
 
-def ejecutar_operacion(opcion, num1, num2):
+def ejecutar_operacion(opcion, *argumentos):
     """
     Ejecuta la operación matemática seleccionada.
     
     Args:
         opcion (str): La opción del menú seleccionada
-        num1 (float): Primer número
-        num2 (float): Segundo número
+        *argumentos: Argumentos de la operación
         
     Returns:
-        float: Resultado de la operación o None si hay error
+        Resultado de la operación o None si hay error
     """
     try:
-        if opcion == "1":
-            resultado = operaciones.suma(num1, num2)
-            operacion = "suma"
-        elif opcion == "2":
-            resultado = operaciones.resta(num1, num2)
-            operacion = "resta"
-        elif opcion == "3":
-            resultado = operaciones.multiplicacion(num1, num2)
-            operacion = "multiplicación"
-        elif opcion == "4":
-            if num2 == 0:
-                utilidades.imprimir_mensaje("❌ Error: No se puede dividir por cero.")
-                return None
-            resultado = operaciones.division(num1, num2)
-            operacion = "división"
-        elif opcion == "5":
-            resultado = operaciones.potencia(num1, num2)
-            operacion = "potencia"
-        else:
+        nombre = opciones_menu().get(opcion)
+        if nombre is None:
             utilidades.imprimir_mensaje("❌ Opción no válida.")
             return None
+        
+        operacion = obtener_operacion(nombre)
+        try:
+            operacion.validar(argumentos)
+        except (ValueError, TypeError, ZeroDivisionError) as e:
+            utilidades.imprimir_mensaje(f"❌ Error: {e}.")
+            return None
+        
+        resultado = operacion.funcion(*argumentos)
             
-        utilidades.imprimir_mensaje(f"✅ El resultado de la {operacion} es: {resultado}")
+        utilidades.imprimir_mensaje(f"✅ El resultado {_de(operacion.descripcion)} es: {resultado}")
         return resultado
         
     except Exception as e:
@@ -96,6 +169,295 @@ def ejecutar_operacion(opcion, num1, num2):
         return None
 
 
+def _convertir_numero(texto):
+    """
+    Convierte un token de texto en int si es entero o en float si no lo es.
+    
+    Raises:
+        ValueError: Si el token no es un número
+    """
+    texto = texto.strip()
+    try:
+        return int(texto)
+    except ValueError:
+        return float(texto)
+
+
+def leer_registros(flujo):
+    """
+    Lee registros de operación de un flujo de texto, línea por línea.
+    
+    Cada línea puede tener uno de estos formatos:
+    - Texto: ``suma 3 4``
+    - CSV: ``suma,3,4``
+    - JSON: ``{"operacion": "suma", "argumentos": [3, 4]}``
+    
+    Las líneas vacías y las que empiezan con ``#`` se ignoran.
+    
+    Args:
+        flujo: Iterable de líneas (archivo, sys.stdin, lista...)
+        
+    Yields:
+        tuple: (numero_linea, operacion, argumentos, error) donde ``error``
+        es un mensaje si la línea no se pudo interpretar, o None
+    """
+    for numero_linea, linea in enumerate(flujo, 1):
+        linea = linea.strip()
+        if not linea or linea.startswith("#"):
+            continue
+        
+        try:
+            if linea.startswith("{"):
+                registro = json.loads(linea)
+                operacion = registro["operacion"]
+                argumentos = registro["argumentos"]
+                if not isinstance(argumentos, list):
+                    raise ValueError("'argumentos' debe ser una lista")
+            else:
+                partes = linea.split(",") if "," in linea else linea.split()
+                operacion = partes[0].strip()
+                argumentos = [_convertir_numero(p) for p in partes[1:]]
+        except (ValueError, KeyError, TypeError) as e:
+            yield numero_linea, None, None, f"Registro no válido: {e}"
+            continue
+        
+        yield numero_linea, str(operacion).lower(), argumentos, None
+
+
+def procesar_registros(registros):
+    """
+    Ejecuta cada registro con las operaciones del registro, igual que el menú.
+    
+    Los errores de cada línea se reportan en su resultado sin detener el
+    procesamiento del resto.
+    
+    Args:
+        registros: Iterable de tuplas producido por ``leer_registros``
+        
+    Yields:
+        dict: Resultado de cada registro con las claves ``linea``,
+        ``operacion``, ``argumentos`` y ``resultado`` o ``error``
+    """
+    for numero_linea, operacion, argumentos, error in registros:
+        salida = {"linea": numero_linea, "operacion": operacion, "argumentos": argumentos}
+        if error is None:
+            try:
+                salida["resultado"] = obtener_operacion(operacion)(*argumentos)
+            except Exception as e:
+                error = str(e)
+        if error is not None:
+            salida["error"] = error
+        yield salida
+
+
+# Bits a partir de los cuales un entero se escribe en hexadecimal (como en el servidor):
+# convertirlo a decimal es cuadrático y Python limita los enteros a 4300 dígitos
+_BITS_HEX = 4096
+
+
+def _codificar_entero(valor):
+    """Codifica los enteros enormes como en ``servidor.a_json``; el resto queda igual."""
+    if isinstance(valor, int) and not isinstance(valor, bool) and valor.bit_length() > _BITS_HEX:
+        return {"entero_hex": hex(valor)}
+    return valor
+
+
+def _linea_resultado(resultado, formato):
+    """
+    Serializa un resultado en una línea de salida.
+    
+    Raises:
+        ValueError, TypeError: Si el resultado no se puede serializar
+    """
+    if formato == "json":
+        if "resultado" in resultado:
+            resultado = dict(resultado, resultado=_codificar_entero(resultado["resultado"]))
+        return json.dumps(resultado, ensure_ascii=False) + "\n"
+    if "error" in resultado:
+        return f"línea {resultado['linea']}: error: {resultado['error']}\n"
+    argumentos = " ".join(str(a) for a in resultado["argumentos"])
+    valor = _codificar_entero(resultado["resultado"])
+    if isinstance(valor, dict):
+        valor = valor["entero_hex"]
+    return f"{resultado['operacion']} {argumentos} = {valor}\n"
+
+
+def escribir_resultados(resultados, destino, formato="texto", descargar_cada=1000):
+    """
+    Escribe los resultados de forma incremental.
+    
+    Los enteros de más de 4096 bits se escriben en hexadecimal (en JSON
+    como ``{"entero_hex": "0x..."}``, igual que el servidor). Un resultado
+    que no se puede serializar se reporta como error en su propia línea.
+    
+    Args:
+        resultados: Iterable de diccionarios producido por ``procesar_registros``
+        destino: Flujo de texto de salida
+        formato (str): 'texto' o 'json' (una línea JSON por resultado)
+        descargar_cada (int): Cada cuántas líneas forzar la escritura
+        
+    Returns:
+        tuple: (cantidad de resultados, cantidad de errores)
+    """
+    total = errores = 0
+    for resultado in resultados:
+        total += 1
+        try:
+            linea = _linea_resultado(resultado, formato)
+        except (ValueError, TypeError) as e:
+            resultado = {k: v for k, v in resultado.items() if k != "resultado"}
+            resultado["error"] = f"No se pudo escribir el resultado: {e}"
+            linea = _linea_resultado(resultado, formato)
+        if "error" in resultado:
+            errores += 1
+        destino.write(linea)
+        
+        if total % descargar_cada == 0:
+            destino.flush()
+    
+    destino.flush()
+    return total, errores
+
+
+# Columnas de los resultados en formato columnar
+COLUMNAS_RESULTADOS = [
+    ("linea", "int64"),
+    ("operacion", "texto"),
+    ("argumentos", "texto"),
+    ("resultado", "valor"),
+    ("error", "valor"),
+]
+
+
+def escribir_resultados_columnar(resultados, ruta, agregar=False):
+    """
+    Escribe los resultados en un archivo columnar de ``paquete.columnas``.
+    
+    Los argumentos se guardan como texto separado por espacios; el
+    resultado y el error quedan en None cuando no corresponden.
+    
+    Args:
+        resultados: Iterable de diccionarios producido por ``procesar_registros``
+        ruta (str): Archivo de salida
+        agregar (bool): Si True, agrega filas a un archivo existente
+        
+    Returns:
+        tuple: (cantidad de resultados, cantidad de errores)
+    """
+    total = errores = 0
+    with EscritorColumnar(ruta, COLUMNAS_RESULTADOS, agregar=agregar) as escritor:
+        for resultado in resultados:
+            total += 1
+            error = resultado.get("error")
+            if error is not None:
+                errores += 1
+            argumentos = resultado["argumentos"] or []
+            escritor.escribir_fila(
+                resultado["linea"],
+                resultado["operacion"] or "",
+                " ".join(str(a) for a in argumentos),
+                resultado.get("resultado"),
+                error,
+            )
+    return total, errores
+
+
+def ejecutar_lote(entrada, destino, formato="texto"):
+    """
+    Ejecuta el modo por lotes: lee, calcula y escribe en un solo flujo.
+    
+    Args:
+        entrada: Flujo de texto con un registro por línea
+        destino: Flujo de texto de salida
+        formato (str): 'texto' o 'json'
+        
+    Returns:
+        tuple: (cantidad de resultados, cantidad de errores)
+    """
+    return escribir_resultados(procesar_registros(leer_registros(entrada)), destino, formato)
+
+
+def parsear_argumentos(argv=None):
+    """
+    Interpreta los argumentos de línea de comandos.
+    
+    Args:
+        argv (list): Argumentos (por defecto sys.argv[1:])
+        
+    Returns:
+        argparse.Namespace: Opciones del programa
+    """
+    parser = argparse.ArgumentParser(description="Calculadora interactiva y por lotes")
+    parser.add_argument(
+        "--lote", metavar="ARCHIVO", nargs="?", const="-",
+        help="Modo no interactivo: lee operaciones de ARCHIVO o de stdin ('-')"
+    )
+    parser.add_argument(
+        "--salida", metavar="ARCHIVO", default="-",
+        help="Archivo donde escribir los resultados (por defecto stdout)"
+    )
+    parser.add_argument(
+        "--formato", choices=["texto", "json", "columnar"], default="texto",
+        help="Formato de los resultados en modo por lotes (columnar requiere --salida)"
+    )
+    parser.add_argument(
+        "--respuestas", metavar="ARCHIVO",
+        help="Modo interactivo leyendo las respuestas de ARCHIVO ('-' para stdin)"
+    )
+    parser.add_argument(
+        "--plugin", metavar="MODULO", action="append", default=[],
+        help="Importa un módulo que registra operaciones adicionales (repetible)"
+    )
+    return parser.parse_args(argv)
+
+
+def cargar_plugins(modulos):
+    """
+    Importa los módulos indicados para que registren sus operaciones.
+    
+    Args:
+        modulos (list): Nombres de módulos importables
+    """
+    for modulo in modulos:
+        importlib.import_module(modulo)
+
+
+def main_lote(opciones):
+    """
+    Punto de entrada del modo por lotes.
+    
+    Args:
+        opciones (argparse.Namespace): Opciones de ``parsear_argumentos``
+        
+    Returns:
+        int: Código de salida (0 si no hubo errores, 1 si algún registro falló,
+        2 si las opciones no son válidas)
+    """
+    if opciones.formato == "columnar" and opciones.salida == "-":
+        utilidades.imprimir_mensaje("❌ El formato columnar necesita un archivo de --salida")
+        return 2
+    
+    entrada = sys.stdin if opciones.lote == "-" else open(opciones.lote, encoding="utf-8")
+    if opciones.formato == "columnar":
+        try:
+            _, errores = escribir_resultados_columnar(
+                procesar_registros(leer_registros(entrada)), opciones.salida)
+        finally:
+            if entrada is not sys.stdin:
+                entrada.close()
+        return 1 if errores else 0
+    
+    destino = sys.stdout if opciones.salida == "-" else open(opciones.salida, "w", encoding="utf-8")
+    try:
+        _, errores = ejecutar_lote(entrada, destino, opciones.formato)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if destino is not sys.stdout:
+            destino.close()
+    return 1 if errores else 0
+
+
 def main():
     """
     Función principal del programa.
@@ -115,25 +477,26 @@ def main():
             opcion = mostrar_menu()
             
             # Verificar si el usuario quiere salir
-            if opcion == "6":
+            if opcion == opcion_salir():
                 utilidades.imprimir_mensaje(f"👋 ¡Gracias por usar la calculadora, {nombre}! ¡Hasta luego!")
                 break
             
             # Verificar si la opción es válida
-            if opcion not in ["1", "2", "3", "4", "5"]:
-                utilidades.imprimir_mensaje("❌ Opción no válida. Por favor selecciona 1-6.")
+            nombre_operacion = opciones_menu().get(opcion)
+            if nombre_operacion is None:
+                utilidades.imprimir_mensaje(f"❌ Opción no válida. Por favor selecciona 1-{opcion_salir()}.")
                 continue
             
-            # Obtener números del usuario
-            num1, num2 = obtener_numeros()
-            if num1 is None or num2 is None:
+            # Obtener los argumentos de la operación
+            argumentos = obtener_argumentos(obtener_operacion(nombre_operacion))
+            if argumentos is None:
                 continue
             
             # Ejecutar la operación seleccionada
-            ejecutar_operacion(opcion, num1, num2)
+            ejecutar_operacion(opcion, *argumentos)
             
             # Preguntar si quiere continuar
-            continuar = input("\n¿Deseas realizar otra operación? (s/n): ").lower()
+            continuar = entradas.leer("\n¿Deseas realizar otra operación? (s/n): ").lower()
             if continuar not in ['s', 'si', 'sí', 'y', 'yes']:
                 utilidades.imprimir_mensaje(f"👋 ¡Gracias por usar la calculadora, {nombre}! ¡Hasta luego!")
                 break
@@ -141,6 +504,10 @@ def main():
         except KeyboardInterrupt:
             utilidades.imprimir_mensaje(f"\n👋 ¡Hasta luego, {nombre}! Programa interrumpido por el usuario.")
             break
+        except EOFError:
+            # Fin de la entrada (stdin cerrado o archivo de respuestas agotado)
+            utilidades.imprimir_mensaje(f"\n👋 ¡Hasta luego, {nombre}! No hay más respuestas.")
+            break
         except Exception as e:
             utilidades.imprimir_mensaje(f"❌ Error inesperado: {str(e)}")
             utilidades.imprimir_mensaje("🔄 Reiniciando programa...")
@@ -153,9 +520,18 @@ if __name__ == "__main__":
     Solo se ejecuta si este archivo se ejecuta directamente.
     """
     try:
+        opciones = parsear_argumentos()
+        cargar_plugins(opciones.plugin)
+        if opciones.lote is not None:
+            sys.exit(main_lote(opciones))
+        if opciones.respuestas is not None:
+            entradas.configurar_entrada(entradas.FuenteArchivo(opciones.respuestas, eco=True))
         main()
-    except SystemExit:
+    except EOFError:
+        # La entrada terminó antes de conocer el nombre del usuario
         sys.exit(0)
+    except SystemExit as e:
+        sys.exit(e.code)
     except Exception as e:
         print(f"❌ Error crítico: {str(e)}")
         sys.exit(1)
\ No newline at end of file
@@ -8,42 +8,229 @@ y utilidades de interacción con el usuario.
 Módulos incluidos:
 - operaciones: Funciones matemáticas básicas y avanzadas
 - utilidades: Funciones de utilidad para interacción con el usuario
+- lotes: Variantes vectorizadas de las operaciones aritméticas
+- primos: Criba en caché y prueba de Miller-Rabin para números primos
+- factoriales: Factorial con puntos de control y factorial modular
+- cache: Memorización opcional con límites LRU y en bytes
+- capas: Cadena compartida de envolturas sobre las funciones de operaciones
+- paralelo: Map paralelo sobre un pool de procesos
+- servidor: Servicio asyncio local de operaciones y su cliente
+- correos: Validación masiva de direcciones de email
+- identificadores: Generación de IDs en bloque con os.urandom
+- salida: Destinos con buffer y filtro de nivel para imprimir_mensaje
+- progreso: Barra de progreso con redibujado limitado
+- instrumentacion: Contadores e histogramas de latencia opcionales para operaciones
+- registro: Registro central de operaciones con validadores precompilados
+- teoria_numeros: Aritmética modular, MCD/MCM por lotes y teorema chino del resto
+- raices: Raíces cuadradas exactas y raíces n-ésimas de enteros de cualquier tamaño
+- archivos: Lectura por bloques con mmap de archivos numéricos de texto y binarios
+- columnas: Formato binario columnar versionado para resultados
+- cache_disco: Caché persistente en sqlite compartida entre procesos
+- agregados: Agregación de flujos en una pasada con suma compensada
+- formato: Formateador de números compilado para columnas completas
+- fechas: Formateo de columnas de fechas y marcas de tiempo
+- entradas: Fuentes de entrada intercambiables para las funciones interactivas
 
 Autor: Tu Nombre
 Fecha: 2024
 Versión: 1.0
 """
 
-# Importar funciones principales para facilitar el acceso
-from .operaciones import (
-    suma,
-    resta,
-    multiplicacion,
-    division,
-    potencia,
-    raiz_cuadrada,
-    factorial,
-    porcentaje,
-    redondear,
-    es_par,
-    es_primo
-)
+import sys
 
-from .utilidades import (
-    imprimir_mensaje,
-    obtener_nombre_usuario,
-    obtener_numero,
-    limpiar_pantalla,
-    pausar,
-    validar_email,
-    formatear_fecha,
-    generar_id,
-    mostrar_progreso,
-    esperar,
-    confirmar,
-    obtener_opcion_menu,
-    formatear_numero
-)
+# Funciones exportadas por el paquete, agrupadas por el módulo que las define.
+# Los módulos se importan de forma perezosa la primera vez que se accede a
+# uno de sus nombres, de modo que `from paquete import suma` no carga
+# `utilidades` (ni re, datetime...).
+_EXPORTACIONES = {
+    # Operaciones matemáticas
+    'operaciones': (
+        'suma',
+        'resta',
+        'multiplicacion',
+        'division',
+        'potencia',
+        'raiz_cuadrada',
+        'factorial',
+        'porcentaje',
+        'redondear',
+        'es_par',
+        'es_primo',
+    ),
+    
+    # Utilidades
+    'utilidades': (
+        'imprimir_mensaje',
+        'obtener_nombre_usuario',
+        'obtener_numero',
+        'limpiar_pantalla',
+        'pausar',
+        'validar_email',
+        'formatear_fecha',
+        'generar_id',
+        'mostrar_progreso',
+        'esperar',
+        'confirmar',
+        'obtener_opcion_menu',
+        'formatear_numero',
+        'obtener_numeros',
+    ),
+    
+    # Operaciones por lotes
+    'lotes': (
+        'suma_lote',
+        'resta_lote',
+        'multiplicacion_lote',
+        'division_lote',
+        'potencia_lote',
+        'porcentaje_lote',
+        'porcentajes_columna',
+        'redondear_columna',
+    ),
+    
+    # Números primos
+    'primos': (
+        'es_primo_lote',
+        'primos_en_rango',
+    ),
+    
+    # Factoriales
+    'factoriales': (
+        'factorial_mod',
+    ),
+    
+    # Caché
+    'cache': (
+        'memorizar',
+        'activar_cache',
+        'desactivar_cache',
+        'estadisticas_cache',
+        'limpiar_caches',
+    ),
+    
+    # Ejecución en paralelo
+    'paralelo': (
+        'mapa_paralelo',
+    ),
+    
+    # Validación masiva de emails
+    'correos': (
+        'filtrar_emails',
+        'validar_emails',
+        'validar_archivo_emails',
+    ),
+    
+    # Identificadores
+    'identificadores': (
+        'generar_ids',
+        'GeneradorIds',
+    ),
+    
+    # Salida de mensajes
+    'salida': (
+        'configurar_salida',
+        'vaciar_salida',
+        'SumideroConsola',
+        'SumideroBuffer',
+    ),
+    
+    # Progreso
+    'progreso': (
+        'Progreso',
+        'con_progreso',
+    ),
+    
+    # Instrumentación
+    'instrumentacion': (
+        'activar_instrumentacion',
+        'desactivar_instrumentacion',
+        'metricas_instrumentacion',
+        'reiniciar_metricas',
+    ),
+    
+    # Registro de operaciones
+    'registro': (
+        'registrar_operacion',
+        'obtener_operacion',
+        'operaciones_registradas',
+    ),
+    
+    # Teoría de números
+    'teoria_numeros': (
+        'potencia_mod',
+        'inverso_mod',
+        'mcd_lote',
+        'mcm_lote',
+        'mcd_cruzado',
+        'resto_chino',
+    ),
+    
+    # Raíces
+    'raices': (
+        'raiz_cuadrada_exacta',
+        'raiz_n',
+        'raiz_n_entera',
+        'raiz_cuadrada_lote',
+        'raiz_n_lote',
+    ),
+    
+    # Archivos numéricos
+    'archivos': (
+        'leer_numeros',
+        'procesar_archivo',
+        'escribir_binario',
+    ),
+    
+    # Archivos columnares
+    'columnas': (
+        'EscritorColumnar',
+        'LectorColumnar',
+    ),
+    
+    # Caché en disco
+    'cache_disco': (
+        'CacheDisco',
+        'activar_cache_disco',
+        'desactivar_cache_disco',
+        'calentar_cache',
+    ),
+    
+    # Agregados
+    'agregados': (
+        'Agregador',
+        'agregar_flujo',
+        'combinar_agregadores',
+    ),
+    
+    # Formato de números
+    'formato': (
+        'FormateadorNumeros',
+    ),
+    
+    # Fechas
+    'fechas': (
+        'FormateadorFechas',
+        'formatear_fechas',
+    ),
+    
+    # Fuentes de entrada
+    'entradas': (
+        'FuenteLineas',
+        'FuenteArchivo',
+        'configurar_entrada',
+        'usar_fuente',
+    ),
+}
+
+# Nombre exportado -> módulo que lo define
+_MODULO_DE = {
+    nombre: modulo
+    for modulo, nombres in _EXPORTACIONES.items()
+    for nombre in nombres
+}
+
+# Submódulos accesibles como atributos (por ejemplo `paquete.utilidades`)
+_SUBMODULOS = frozenset(_EXPORTACIONES) | {'servidor'}
 
 # Información del paquete
 __version__ = "1.0.0"
@@ -51,32 +238,39 @@ __author__ = "Tu Nombre"
 __email__ = "tu.email@ejemplo.com"
 
 # Lista de todas las funciones disponibles
-__all__ = [
-    # Operaciones matemáticas
-    'suma',
-    'resta', 
-    'multiplicacion',
-    'division',
-    'potencia',
-    'raiz_cuadrada',
-    'factorial',
-    'porcentaje',
-    'redondear',
-    'es_par',
-    'es_primo',
+__all__ = [nombre for nombres in _EXPORTACIONES.values() for nombre in nombres]
+
+
+def _importar(modulo):
+    """Importa un submódulo del paquete (visible para `python -X importtime`)."""
+    nombre_completo = f"{__name__}.{modulo}"
+    __import__(nombre_completo)
+    return sys.modules[nombre_completo]
+
+
+def __getattr__(nombre):
+    """
+    Resuelve perezosamente los nombres exportados por el paquete.
     
-    # Utilidades
-    'imprimir_mensaje',
-    'obtener_nombre_usuario',
-    'obtener_numero',
-    'limpiar_pantalla',
-    'pausar',
-    'validar_email',
-    'formatear_fecha',
-    'generar_id',
-    'mostrar_progreso',
-    'esperar',
-    'confirmar',
-    'obtener_opcion_menu',
-    'formatear_numero'
-]
+    El valor se guarda en el espacio de nombres del paquete, así que cada
+    nombre solo pasa por aquí la primera vez. Las funciones de
+    `operaciones` son la excepción: la caché y la instrumentación las
+    reemplazan en su módulo, así que se buscan en cada acceso para devolver
+    la versión vigente. Los submódulos se registran solos como atributos
+    del paquete al importarse.
+    """
+    if nombre in _SUBMODULOS:
+        return _importar(nombre)
+    
+    modulo = _MODULO_DE.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    
+    valor = getattr(_importar(modulo), nombre)
+    if modulo != 'operaciones':
+        globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
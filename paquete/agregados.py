@@ -0,0 +1,368 @@
+"""
+Módulo de Agregados
+===================
+
+Este módulo contiene un agregador de flujos numéricos que calcula en una
+sola pasada la cantidad, la suma, la media, la varianza, el mínimo, el
+máximo y el porcentaje del total de cada grupo. Reemplaza el patrón de
+acumular con `operaciones.suma` y después recorrer de nuevo llamando a
+`operaciones.porcentaje` contra el total.
+
+La suma es compensada (Neumaier) y la media y la varianza se actualizan
+con el método de Welford, así que el error no crece con la cantidad de
+elementos. Los agregadores parciales se combinan (fórmula de Chan), de
+modo que cada bloque de un cálculo en paralelo puede producir el suyo.
+
+Si llega un valor infinito o NaN, o un paso de Welford desborda, la media
+pasa a calcularse como suma / cantidad y la varianza queda en NaN (hubo
+valores no finitos) o en infinito (solo desbordes); nunca es negativa.
+La suma se reescala por potencias de dos cuando valores finitos la
+desbordarían, así que `[1e308, 1e308, -1e308]` suma 1e308.
+
+`agregar_lote` consume iterables y generadores en tramos de tamaño fijo
+sin materializarlos: cada tramo se resume con `math.fsum`, `min` y `max`
+(en C) y se combina con lo acumulado.
+
+Funciones disponibles:
+- Agregador(): Agregador de un flujo numérico
+- agregar_flujo(valores): Agrega un iterable completo
+- combinar_agregadores(agregadores): Combina agregadores parciales
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import math
+from itertools import islice, repeat
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple, Union
+
+
+# Elementos que se resumen juntos en `agregar_lote`
+TAMANO_TRAMO = 65536
+
+_NUMERO = (int, float)
+
+
+def _sumar_compensado(suma: float, compensacion: float, valor: float) -> Tuple[float, float]:
+    """Un paso de la suma de Neumaier."""
+    total = suma + valor
+    if not math.isfinite(total):
+        # Como math.fsum: con infinitos la compensación daría inf - inf = nan
+        return total, compensacion
+    if abs(suma) >= abs(valor):
+        compensacion += (suma - total) + valor
+    else:
+        compensacion += (valor - total) + suma
+    return total, compensacion
+
+
+class Agregador:
+    """
+    Agregador de un flujo numérico en una sola pasada.
+
+        agregador = Agregador()
+        for fila in filas:
+            agregador.agregar(fila.monto, grupo=fila.region)
+        agregador.media, agregador.varianza(), agregador.porcentajes()
+
+    Los valores pueden asignarse a un grupo; `porcentajes()` da el
+    porcentaje del total de cada grupo sin una segunda pasada.
+    """
+
+    def __init__(self) -> None:
+        self.cantidad = 0
+        self.minimo: Optional[Union[int, float]] = None
+        self.maximo: Optional[Union[int, float]] = None
+        self._suma = 0.0
+        self._compensacion = 0.0
+        # La suma guardada es la real multiplicada por esta potencia de dos
+        self._escala = 1.0
+        self._media = 0.0
+        self._m2 = 0.0
+        # None mientras los momentos de Welford son válidos; si no, el m2
+        # que se informa: NaN si hubo valores no finitos, inf si desbordó
+        self._m2_desborde: Optional[float] = None
+        # grupo -> [suma, compensación]
+        self._grupos: Dict[Hashable, list] = {}
+
+    def agregar(self, valor: Union[int, float], grupo: Optional[Hashable] = None) -> None:
+        """
+        Agrega un valor.
+
+        Args:
+            valor: Número a agregar
+            grupo: Grupo opcional del valor, para `porcentajes()`
+
+        Raises:
+            TypeError: Si el valor no es un número
+        """
+        if not isinstance(valor, _NUMERO):
+            raise TypeError("Los argumentos deben ser números")
+
+        self.cantidad += 1
+        self._acumular(valor)
+        if self._m2_desborde is None:
+            delta = valor - self._media
+            media = self._media + delta / self.cantidad
+            m2 = self._m2 + delta * (valor - media)
+            if math.isfinite(media) and math.isfinite(m2):
+                self._media, self._m2 = media, m2
+            else:
+                self._m2_desborde = math.inf if math.isfinite(valor) else math.nan
+        elif not math.isfinite(valor):
+            self._m2_desborde = math.nan
+        if self.minimo is None or valor < self.minimo:
+            self.minimo = valor
+        if self.maximo is None or valor > self.maximo:
+            self.maximo = valor
+        if grupo is not None:
+            self._sumar_grupo(grupo, valor)
+
+    def agregar_lote(self, valores: Iterable[Union[int, float]], grupo: Optional[Hashable] = None,
+                     tamano_tramo: int = TAMANO_TRAMO) -> "Agregador":
+        """
+        Agrega todos los valores de un iterable, por tramos.
+
+        Args:
+            valores: Iterable de números (puede ser un generador)
+            grupo: Grupo opcional de todos los valores
+            tamano_tramo: Elementos resumidos juntos
+
+        Returns:
+            El mismo agregador, para encadenar llamadas
+
+        Raises:
+            TypeError: Si algún valor no es un número
+        """
+        iterador = iter(valores)
+        while True:
+            tramo = list(islice(iterador, tamano_tramo))
+            if not tramo:
+                return self
+            self._combinar_tramo(tramo, grupo)
+
+    def _combinar_tramo(self, tramo: list, grupo: Optional[Hashable]) -> None:
+        """Resume un tramo en memoria y lo combina con lo acumulado."""
+        try:
+            minimo, maximo = min(tramo), max(tramo)
+        except TypeError:
+            raise TypeError("Los argumentos deben ser números") from None
+        if not all(map(isinstance, tramo, repeat(_NUMERO))):
+            raise TypeError("Los argumentos deben ser números")
+        try:
+            suma = math.fsum(tramo)
+            if not math.isfinite(suma):
+                raise ValueError("valores no finitos")
+            media = suma / len(tramo)
+            m2 = math.fsum([d * d for d in (v - media for v in tramo)])
+        except (ValueError, OverflowError):
+            # Valores no finitos o desbordes intermedios de fsum: valor por
+            # valor se obtiene lo mismo que con `agregar`
+            for valor in tramo:
+                self.agregar(valor, grupo)
+            return
+        self._combinar(len(tramo), suma, 0.0, media, m2, minimo, maximo)
+        if grupo is not None:
+            self._sumar_grupo(grupo, suma)
+
+    def _sumar_grupo(self, grupo: Hashable, valor: float) -> None:
+        acumulado = self._grupos.get(grupo)
+        if acumulado is None:
+            self._grupos[grupo] = [float(valor), 0.0]
+        else:
+            acumulado[0], acumulado[1] = _sumar_compensado(acumulado[0], acumulado[1], valor)
+
+    def _acumular(self, valor: float, escala: float = 1.0) -> None:
+        """
+        Suma `valor / escala` a la suma compensada.
+
+        Si dos operandos finitos desbordan, la suma guardada y la escala se
+        dividen por dos (sin error de redondeo) hasta que el total cabe.
+        """
+        if escala < self._escala:
+            self._suma *= escala / self._escala
+            self._compensacion *= escala / self._escala
+            self._escala = escala
+        elif escala > self._escala:
+            valor *= self._escala / escala
+        while True:
+            total, compensacion = _sumar_compensado(self._suma, self._compensacion, valor)
+            if math.isfinite(total) or not (math.isfinite(valor) and math.isfinite(self._suma)):
+                self._suma, self._compensacion = total, compensacion
+                return
+            self._suma *= 0.5
+            self._compensacion *= 0.5
+            self._escala *= 0.5
+            valor *= 0.5
+
+    def _combinar(self, cantidad: int, suma: float, compensacion: float, media: float,
+                  m2: float, minimo: Any, maximo: Any, escala: float = 1.0,
+                  m2_desborde: Optional[float] = None) -> None:
+        """Combina los momentos de otra parte (fórmula de Chan)."""
+        if not cantidad:
+            return
+        total = self.cantidad + cantidad
+        if self._m2_desborde is None and m2_desborde is None:
+            delta = media - self._media
+            nuevo_m2 = self._m2 + m2 + delta * delta * self.cantidad * cantidad / total
+            nueva_media = self._media + delta * cantidad / total
+            if math.isfinite(nueva_media) and math.isfinite(nuevo_m2):
+                self._media, self._m2 = nueva_media, nuevo_m2
+            else:
+                self._m2_desborde = math.inf
+        elif math.isnan(self._m2_desborde or 0.0) or math.isnan(m2_desborde or 0.0):
+            self._m2_desborde = math.nan
+        else:
+            self._m2_desborde = math.inf
+        self.cantidad = total
+        self._acumular(suma, escala)
+        self._acumular(compensacion, escala)
+        if self.minimo is None or minimo < self.minimo:
+            self.minimo = minimo
+        if self.maximo is None or maximo > self.maximo:
+            self.maximo = maximo
+
+    def combinar(self, otro: "Agregador") -> "Agregador":
+        """
+        Incorpora los valores de otro agregador, como si se hubieran agregado aquí.
+
+        Args:
+            otro: Agregador parcial (por ejemplo, de otro bloque o proceso)
+
+        Returns:
+            El mismo agregador, para encadenar llamadas
+        """
+        self._combinar(otro.cantidad, otro._suma, otro._compensacion, otro._media,
+                       otro._m2, otro.minimo, otro.maximo, otro._escala, otro._m2_desborde)
+        for grupo, (suma, compensacion) in otro._grupos.items():
+            self._sumar_grupo(grupo, suma)
+            self._grupos[grupo][1] += compensacion
+        return self
+
+    @property
+    def suma(self) -> float:
+        """Suma compensada de los valores."""
+        return (self._suma + self._compensacion) / self._escala
+
+    @property
+    def media(self) -> float:
+        """
+        Media de los valores.
+
+        Raises:
+            ValueError: Si no se agregó ningún valor
+        """
+        if not self.cantidad:
+            raise ValueError("No hay valores agregados")
+        if self._m2_desborde is not None:
+            return (self._suma + self._compensacion) / self.cantidad / self._escala
+        return self._media
+
+    def varianza(self, muestral: bool = False) -> float:
+        """
+        Varianza de los valores.
+
+        Args:
+            muestral: Si True, divide por n - 1 en lugar de n
+
+        Raises:
+            ValueError: Si no hay suficientes valores
+        """
+        divisor = self.cantidad - 1 if muestral else self.cantidad
+        if divisor <= 0:
+            raise ValueError("No hay suficientes valores para calcular la varianza")
+        m2 = self._m2 if self._m2_desborde is None else self._m2_desborde
+        return m2 / divisor
+
+    def desviacion(self, muestral: bool = False) -> float:
+        """Desviación estándar de los valores."""
+        return math.sqrt(self.varianza(muestral))
+
+    def porcentaje(self, valor: Union[int, float]) -> float:
+        """
+        Porcentaje que representa un valor de la suma agregada.
+
+        Raises:
+            ValueError: Si la suma es cero
+        """
+        total = self.suma
+        if total == 0:
+            raise ValueError("El total no puede ser cero")
+        return (valor / total) * 100
+
+    def porcentajes(self) -> Dict[Hashable, float]:
+        """
+        Porcentaje del total de cada grupo.
+
+        Returns:
+            Diccionario grupo -> porcentaje, en orden de aparición
+
+        Raises:
+            ValueError: Si la suma es cero
+        """
+        total = self.suma
+        if total == 0:
+            raise ValueError("El total no puede ser cero")
+        return {grupo: ((suma + compensacion) / total) * 100
+                for grupo, (suma, compensacion) in self._grupos.items()}
+
+    def resultado(self) -> Dict[str, Any]:
+        """
+        Resumen del agregado.
+
+        Returns:
+            Diccionario con cantidad, suma, media, varianza, minimo y maximo
+            (media y varianza son NaN si no hay valores)
+        """
+        return {
+            "cantidad": self.cantidad,
+            "suma": self.suma,
+            "media": self.media if self.cantidad else math.nan,
+            "varianza": self.varianza() if self.cantidad else math.nan,
+            "minimo": self.minimo,
+            "maximo": self.maximo,
+        }
+
+    def __repr__(self) -> str:
+        return f"Agregador(cantidad={self.cantidad}, suma={self.suma!r})"
+
+
+def agregar_flujo(valores: Iterable[Union[int, float]],
+                  grupos: Optional[Iterable[Hashable]] = None) -> Agregador:
+    """
+    Agrega un iterable completo en una sola pasada.
+
+    Args:
+        valores: Iterable de números (puede ser un generador)
+        grupos: Iterable opcional con el grupo de cada valor, en paralelo
+            con `valores`
+
+    Returns:
+        El agregador resultante
+
+    Raises:
+        TypeError: Si algún valor no es un número
+    """
+    agregador = Agregador()
+    if grupos is None:
+        return agregador.agregar_lote(valores)
+    for valor, grupo in zip(valores, grupos):
+        agregador.agregar(valor, grupo)
+    return agregador
+
+
+def combinar_agregadores(agregadores: Iterable[Agregador]) -> Agregador:
+    """
+    Combina agregadores parciales en uno nuevo.
+
+    Args:
+        agregadores: Agregadores de bloques independientes del flujo
+
+    Returns:
+        Un agregador equivalente a haber agregado todos los valores
+    """
+    total = Agregador()
+    for agregador in agregadores:
+        total.combinar(agregador)
+    return total
@@ -0,0 +1,391 @@
+"""
+Módulo de Archivos Numéricos
+============================
+
+Este módulo contiene un lector de archivos numéricos grandes basado en
+`mmap`. Los archivos de texto se recorren en bloques de varios megabytes
+que se cortan en un separador y se convierten de una sola vez a
+`array.array`; los archivos binarios de enteros o decimales de 64 bits en
+little-endian se exponen como `memoryview` sobre el mapa, sin copiar.
+
+`procesar_archivo` aplica una operación a cada número como etapa de un
+flujo y escribe los resultados bloque a bloque, así que la memoria usada
+no depende del tamaño del archivo.
+
+Funciones disponibles:
+- leer_numeros(ruta, formato): Recorre los números de un archivo por bloques
+- procesar_archivo(entrada, salida, operacion): Aplica una operación a un archivo
+- escribir_binario(ruta, numeros, formato): Escribe números en binario de 64 bits
+
+Uso:
+    python -m paquete.archivos datos.txt raices.bin --operacion raiz_cuadrada --formato-salida float64
+    python -m paquete.archivos enteros.bin pares.txt --formato int64 --operacion es_par
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import argparse
+import mmap
+import os
+import sys
+from array import array
+from itertools import repeat
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .lotes import NAN, _validar_modo
+from .registro import obtener_operacion
+
+
+# Tamaño por defecto de cada bloque leído del archivo
+TAMANO_BLOQUE = 4 * 1024 * 1024
+
+# Formatos de archivo y su código de tipo en array/memoryview
+FORMATOS_BINARIOS = {"int64": "q", "float64": "d"}
+FORMATOS = ("texto",) + tuple(FORMATOS_BINARIOS)
+
+# Conversión de los tokens de texto
+TIPOS_TEXTO = ("float", "int", "auto")
+
+# Separadores de tokens en los archivos de texto (además de los espacios)
+_SEPARADORES = b" \t\n\r\x0b\x0c,;"
+_SEPARADORES_BYTES = tuple(bytes((s,)) for s in _SEPARADORES)
+_A_ESPACIOS = bytes.maketrans(b",;", b"  ")
+
+# Bytes finales de un bloque donde se busca primero el separador de corte
+_VENTANA_CORTE = 4096
+
+_NATIVO_LITTLE = sys.byteorder == "little"
+
+# Dígitos a partir de los cuales un entero se escribe en hexadecimal, porque
+# Python limita la conversión de enteros enormes a texto decimal
+_DIGITOS_HEX = 4000
+
+
+def _validar_formato(formato: str) -> None:
+    """Verifica que el formato de archivo sea válido."""
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no válido: {formato!r} (usa {FORMATOS})")
+
+
+def _convertir_auto(token: bytes) -> Union[int, float]:
+    """Convierte un token en int si es entero o en float si no lo es."""
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+_CONVERSORES = {"float": float, "int": int, "auto": _convertir_auto}
+
+
+def _ultimo_separador(mapa: mmap.mmap, inicio: int, fin: int) -> int:
+    """Posición del último separador en [inicio, fin), o -1."""
+    return max(mapa.rfind(separador, inicio, fin) for separador in _SEPARADORES_BYTES)
+
+
+def _cortes_texto(mapa: mmap.mmap, tamano: int) -> Iterator[bytes]:
+    """Divide el texto en bloques de unos `tamano` bytes que terminan en un separador."""
+    total = len(mapa)
+    inicio = 0
+    while inicio < total:
+        fin = inicio + tamano
+        if fin >= total:
+            yield mapa[inicio:total]
+            return
+        corte = _ultimo_separador(mapa, max(inicio, fin - _VENTANA_CORTE), fin)
+        if corte < 0:
+            corte = _ultimo_separador(mapa, inicio, fin)
+        if corte < 0:
+            # Un token más largo que el bloque: avanzar hasta el próximo separador
+            siguientes = [p for p in (mapa.find(s, fin) for s in _SEPARADORES_BYTES) if p >= 0]
+            corte = min(siguientes) if siguientes else total
+        yield mapa[inicio:corte]
+        inicio = corte + 1
+
+
+def _convertir_bloque(tokens: List[bytes], tipo: str, desplazamiento: int, errores: str,
+                      reporte: Optional[list]) -> Sequence[Union[int, float]]:
+    """Convierte los tokens de un bloque, primero de una sola vez y, si falla, uno por uno."""
+    conversor = _CONVERSORES[tipo]
+    try:
+        if tipo == "auto":
+            return [conversor(t) for t in tokens]
+        return array("d" if tipo == "float" else "q", map(conversor, tokens))
+    except (ValueError, OverflowError):
+        pass
+
+    valores = []
+    for indice, token in enumerate(tokens, desplazamiento):
+        try:
+            valor = conversor(token)
+            if tipo == "int" and not -2 ** 63 <= valor < 2 ** 63:
+                raise OverflowError("El entero no cabe en 64 bits")
+            valores.append(valor)
+        except (ValueError, OverflowError) as e:
+            mensaje = f"Token no numérico: {token[:40].decode('utf-8', 'replace')!r}" \
+                if isinstance(e, ValueError) else str(e)
+            if errores == "lanzar":
+                raise ValueError(f"{mensaje} (elemento {indice})") from None
+            if reporte is not None:
+                reporte.append((indice, mensaje))
+    if tipo == "auto":
+        return valores
+    return array("d" if tipo == "float" else "q", valores)
+
+
+def _leer_texto(mapa: mmap.mmap, tipo: str, tamano: int, errores: str,
+                reporte: Optional[list]) -> Iterator[Sequence[Union[int, float]]]:
+    """Recorre los números de un archivo de texto mapeado."""
+    leidos = 0
+    for bloque in _cortes_texto(mapa, tamano):
+        tokens = bloque.translate(_A_ESPACIOS).split()
+        if tokens:
+            yield _convertir_bloque(tokens, tipo, leidos, errores, reporte)
+            leidos += len(tokens)
+
+
+def _leer_binario(mapa: mmap.mmap, codigo: str, tamano: int) -> Iterator[Sequence[Union[int, float]]]:
+    """Recorre un archivo binario mapeado como memoryviews de 64 bits."""
+    if len(mapa) % 8:
+        raise ValueError("El tamaño del archivo no es múltiplo de 8 bytes")
+    paso = max(tamano // 8, 1) * 8
+    vista = memoryview(mapa)
+    try:
+        for inicio in range(0, len(mapa), paso):
+            porcion = vista[inicio:inicio + paso]
+            if _NATIVO_LITTLE:
+                yield porcion.cast(codigo)
+            else:
+                # En máquinas big-endian no hay vista sin copia posible
+                valores = array(codigo, porcion.tobytes())
+                valores.byteswap()
+                yield valores
+    finally:
+        vista.release()
+
+
+def leer_numeros(ruta: str, formato: str = "texto", tipo: str = "float",
+                 tamano_bloque: int = TAMANO_BLOQUE, errores: str = "omitir",
+                 reporte: Optional[list] = None) -> Iterator[Sequence[Union[int, float]]]:
+    """
+    Recorre los números de un archivo en bloques.
+
+    En texto, los números pueden estar separados por espacios, saltos de
+    línea, comas o punto y coma. En binario, el archivo es una secuencia de
+    enteros (`int64`) o decimales (`float64`) de 64 bits en little-endian y
+    cada bloque es una `memoryview` sobre el mapa del archivo, sin copia;
+    las vistas solo deben usarse mientras el generador no haya terminado.
+
+    Args:
+        ruta: Ruta del archivo
+        formato: 'texto', 'int64' o 'float64'
+        tipo: En texto, 'float', 'int' (ambos producen array.array) o
+            'auto' (lista con int o float según cada token)
+        tamano_bloque: Bytes aproximados de cada bloque
+        errores: 'omitir' descarta los tokens no numéricos; 'lanzar' lanza
+            ValueError en el primero
+        reporte: Lista opcional donde se agregan tuplas (indice, mensaje)
+            de los tokens descartados
+
+    Yields:
+        Bloques de números (array.array, lista o memoryview)
+
+    Raises:
+        ValueError: Si el formato, el tipo o el modo de errores no son
+            válidos, o si un archivo binario no tiene un tamaño múltiplo de 8
+    """
+    _validar_formato(formato)
+    if tipo not in TIPOS_TEXTO:
+        raise ValueError(f"Tipo no válido: {tipo!r} (usa {TIPOS_TEXTO})")
+    if errores not in ("omitir", "lanzar"):
+        raise ValueError(f"Modo de errores no válido: {errores!r} (usa ('omitir', 'lanzar'))")
+    if tamano_bloque <= 0:
+        raise ValueError("El tamaño de bloque debe ser positivo")
+
+    with open(ruta, "rb") as archivo:
+        if os.fstat(archivo.fileno()).st_size == 0:
+            return  # mmap no admite archivos vacíos
+        mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        if formato == "texto":
+            yield from _leer_texto(mapa, tipo, tamano_bloque, errores, reporte)
+        else:
+            yield from _leer_binario(mapa, FORMATOS_BINARIOS[formato], tamano_bloque)
+    finally:
+        try:
+            mapa.close()
+        except BufferError:
+            pass  # quedan vistas en uso; el mapa se cierra cuando se liberen
+
+
+def _a_texto(valor: Any) -> str:
+    """Convierte un resultado a texto (enteros enormes en hexadecimal)."""
+    if isinstance(valor, int) and not isinstance(valor, bool) and valor.bit_length() > _DIGITOS_HEX * 3:
+        return hex(valor)
+    return str(valor)
+
+
+def _a_binario(valores: List[Any], codigo: str) -> array:
+    """Empaqueta resultados en un array de 64 bits en little-endian."""
+    try:
+        datos = array(codigo, valores)
+    except (OverflowError, TypeError):
+        raise ValueError(f"Hay resultados que no caben en {'int64' if codigo == 'q' else 'float64'}; "
+                         "usa el formato de salida 'texto'") from None
+    if not _NATIVO_LITTLE:
+        datos.byteswap()
+    return datos
+
+
+def escribir_binario(ruta: str, numeros: Iterable[Sequence[Union[int, float]]],
+                     formato: str = "float64", agregar: bool = False) -> int:
+    """
+    Escribe bloques de números en un archivo binario de 64 bits en little-endian.
+
+    Args:
+        ruta: Ruta del archivo
+        numeros: Iterable de bloques (por ejemplo el de `leer_numeros`)
+        formato: 'int64' o 'float64'
+        agregar: Si True, agrega al final en lugar de sobrescribir
+
+    Returns:
+        La cantidad de números escritos
+
+    Raises:
+        ValueError: Si el formato no es binario o algún número no cabe
+    """
+    if formato not in FORMATOS_BINARIOS:
+        raise ValueError(f"Formato binario no válido: {formato!r} (usa {tuple(FORMATOS_BINARIOS)})")
+
+    escritos = 0
+    with open(ruta, "ab" if agregar else "wb") as archivo:
+        for bloque in numeros:
+            datos = _a_binario(list(bloque), FORMATOS_BINARIOS[formato])
+            datos.tofile(archivo)
+            escritos += len(datos)
+    return escritos
+
+
+def _aplicar_bloque(funcion: Callable, bloque: Sequence[Any], argumentos: tuple,
+                    desplazamiento: int, errores: str, reporte: Optional[list],
+                    mascara: Any) -> List[Any]:
+    """
+    Aplica la operación a un bloque enmascarando los elementos que fallan.
+
+    Un fallo no repite el bloque: se conservan los resultados ya calculados,
+    se enmascara el elemento que falló y se sigue desde el siguiente.
+    """
+    resultados = []
+    llamadas = map(funcion, bloque, *(repeat(a) for a in argumentos))
+    while True:
+        try:
+            # extend conserva los resultados agregados antes de la excepción
+            resultados.extend(llamadas)
+            return resultados
+        except (TypeError, ValueError, ZeroDivisionError, OverflowError) as e:
+            indice = desplazamiento + len(resultados)
+            if errores == "lanzar":
+                raise type(e)(f"{e} (elemento {indice})") from None
+            if reporte is not None:
+                reporte.append((indice, str(e)))
+            resultados.append(mascara)
+
+
+def procesar_archivo(entrada: str, salida: str, operacion: Union[str, Callable],
+                     *argumentos: Any, formato: str = "texto", tipo: str = "float",
+                     formato_salida: str = "texto", tamano_bloque: int = TAMANO_BLOQUE,
+                     errores: str = "mascara", reporte: Optional[list] = None) -> dict:
+    """
+    Aplica una operación a cada número de un archivo y escribe los resultados.
+
+    Cada número `x` produce `operacion(x, *argumentos)`; por ejemplo
+    `procesar_archivo("datos.txt", "cubos.txt", "potencia", 3)`. Los
+    resultados se escriben bloque a bloque, en el mismo orden.
+
+    Args:
+        entrada: Archivo de entrada
+        salida: Archivo de salida
+        operacion: Nombre de una operación registrada (ver `paquete.registro`)
+            o una función de un argumento más `argumentos`
+        *argumentos: Argumentos adicionales de la operación
+        formato: Formato de entrada: 'texto', 'int64' o 'float64'
+        tipo: En texto, cómo convertir los tokens: 'float', 'int' o 'auto'
+        formato_salida: 'texto' (un resultado por línea; enteros enormes en
+            hexadecimal), 'int64' o 'float64'
+        tamano_bloque: Bytes aproximados de cada bloque de entrada
+        errores: 'mascara' escribe NaN (0 en 'int64', que no tiene NaN) en
+            los elementos en que falla la operación y omite los tokens no
+            numéricos de la entrada; 'lanzar' aborta en el primer error
+        reporte: Lista opcional donde se agregan tuplas (indice, mensaje);
+            el índice es la posición del token en la entrada para los
+            tokens no numéricos y la posición del resultado para los
+            fallos de la operación
+
+    Returns:
+        Diccionario con 'elementos' (resultados escritos) y 'errores'
+
+    Raises:
+        ValueError: Si algún parámetro no es válido, la operación no existe
+            o un resultado no cabe en el formato binario de salida
+    """
+    _validar_formato(formato)
+    _validar_formato(formato_salida)
+    _validar_modo(errores)
+    funcion = obtener_operacion(operacion).funcion if isinstance(operacion, str) else operacion
+
+    fallos = [] if reporte is None else reporte
+    fallos_previos = len(fallos)
+    codigo = FORMATOS_BINARIOS.get(formato_salida)
+    mascara = 0 if codigo == "q" else NAN
+
+    escritos = 0
+    lectura = leer_numeros(entrada, formato, tipo, tamano_bloque,
+                           "lanzar" if errores == "lanzar" else "omitir", fallos)
+    with open(salida, "w" if codigo is None else "wb",
+              **({"encoding": "utf-8"} if codigo is None else {})) as destino:
+        for bloque in lectura:
+            resultados = _aplicar_bloque(funcion, bloque, argumentos, escritos,
+                                         errores, fallos, mascara)
+            if codigo is None:
+                destino.write("\n".join(map(_a_texto, resultados)) + "\n")
+            else:
+                _a_binario(resultados, codigo).tofile(destino)
+            escritos += len(resultados)
+    return {"elementos": escritos, "errores": len(fallos) - fallos_previos}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de línea de comandos.
+
+    Args:
+        argv: Argumentos (por defecto sys.argv[1:])
+
+    Returns:
+        Código de salida (0 si no hubo errores, 1 si algún elemento falló)
+    """
+    parser = argparse.ArgumentParser(description="Aplica una operación a un archivo numérico")
+    parser.add_argument("entrada", help="Archivo de entrada")
+    parser.add_argument("salida", help="Archivo de salida")
+    parser.add_argument("--operacion", required=True, help="Operación registrada (por ejemplo raiz_cuadrada)")
+    parser.add_argument("--argumento", action="append", default=[], type=float,
+                        help="Argumento adicional de la operación (repetible)")
+    parser.add_argument("--formato", choices=FORMATOS, default="texto")
+    parser.add_argument("--tipo", choices=TIPOS_TEXTO, default="float")
+    parser.add_argument("--formato-salida", choices=FORMATOS, default="texto")
+    parser.add_argument("--tamano-bloque", type=int, default=TAMANO_BLOQUE)
+    opciones = parser.parse_args(argv)
+
+    argumentos = [int(a) if a.is_integer() else a for a in opciones.argumento]
+    resumen = procesar_archivo(
+        opciones.entrada, opciones.salida, opciones.operacion, *argumentos,
+        formato=opciones.formato, tipo=opciones.tipo, formato_salida=opciones.formato_salida,
+        tamano_bloque=opciones.tamano_bloque)
+    print(f"{resumen['elementos']} resultados, {resumen['errores']} errores", file=sys.stderr)
+    return 1 if resumen["errores"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""
+Módulo de Caché
+===============
+
+Este módulo contiene una capa de memorización opcional para las funciones
+puras de `operaciones`. Cada función se configura por separado con un
+límite de entradas (LRU) y, opcionalmente, un límite de memoria en bytes
+para que resultados enormes (por ejemplo factoriales grandes) no agoten
+la memoria.
+
+Las operaciones de consulta, invalidación y limpieza están protegidas con
+un candado, por lo que pueden llamarse desde varios hilos.
+
+La caché de `operaciones` es una capa de `capas`: convive con la
+instrumentación y la caché en disco, y desactivarla no quita esas capas.
+
+Funciones disponibles:
+- memorizar(funcion): Decorador que memoriza una función pura
+- activar_cache(nombre): Memoriza una función de `operaciones`
+- desactivar_cache(nombre): Restaura la función original
+- estadisticas_cache(): Aciertos, fallos y desalojos por función
+- limpiar_caches(): Vacía todas las cachés activas
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import functools
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from . import capas
+
+
+class CacheLRU:
+    """
+    Caché LRU acotada por cantidad de entradas y por tamaño en bytes.
+
+    Args:
+        max_entradas: Cantidad máxima de resultados guardados (None = sin límite)
+        max_bytes: Tamaño máximo total de los resultados (None = sin límite)
+    """
+
+    def __init__(self, max_entradas: Optional[int] = 128,
+                 max_bytes: Optional[int] = None) -> None:
+        if max_entradas is not None and max_entradas <= 0:
+            raise ValueError("La cantidad máxima de entradas debe ser positiva")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("El tamaño máximo en bytes debe ser positivo")
+
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._datos = OrderedDict()
+        self._bytes = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def obtener(self, clave: Hashable, defecto: Any = None) -> Any:
+        """Devuelve el valor guardado para `clave` o `defecto` si no existe."""
+        with self._lock:
+            try:
+                valor, _ = self._datos[clave]
+            except KeyError:
+                self.fallos += 1
+                return defecto
+            self._datos.move_to_end(clave)
+            self.aciertos += 1
+            return valor
+
+    def guardar(self, clave: Hashable, valor: Any) -> None:
+        """Guarda un valor desalojando los menos usados si se exceden los límites."""
+        tamano = sys.getsizeof(valor)
+        if self.max_bytes is not None and tamano > self.max_bytes:
+            return  # nunca cabría: no desalojar todo por un único valor
+
+        with self._lock:
+            anterior = self._datos.pop(clave, None)
+            if anterior is not None:
+                self._bytes -= anterior[1]
+            self._datos[clave] = (valor, tamano)
+            self._bytes += tamano
+            while (self.max_entradas is not None and len(self._datos) > self.max_entradas
+                   or self.max_bytes is not None and self._bytes > self.max_bytes):
+                _, (_, liberado) = self._datos.popitem(last=False)
+                self._bytes -= liberado
+                self.desalojos += 1
+
+    def invalidar(self, clave: Hashable) -> bool:
+        """Elimina una entrada. Devuelve True si existía."""
+        with self._lock:
+            anterior = self._datos.pop(clave, None)
+            if anterior is None:
+                return False
+            self._bytes -= anterior[1]
+            return True
+
+    def limpiar(self) -> None:
+        """Vacía la caché y reinicia sus estadísticas."""
+        with self._lock:
+            self._datos.clear()
+            self._bytes = 0
+            self.aciertos = 0
+            self.fallos = 0
+            self.desalojos = 0
+
+    def estadisticas(self) -> Dict[str, int]:
+        """Devuelve aciertos, fallos, desalojos, entradas y bytes ocupados."""
+        with self._lock:
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+                "entradas": len(self._datos),
+                "bytes": self._bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._datos)
+
+
+_FALTANTE = object()
+
+
+def clave_argumentos(args: tuple, kwargs: dict) -> Hashable:
+    """
+    Construye la clave de caché de una llamada.
+
+    Incluye el tipo de cada argumento para que `suma(1, 2)` y
+    `suma(1.0, 2)` no compartan resultado.
+    """
+    clave = tuple((type(a), a) for a in args)
+    if kwargs:
+        clave += tuple((k, type(v), v) for k, v in sorted(kwargs.items()))
+    return clave
+
+
+def memorizar(funcion: Optional[Callable] = None, *, max_entradas: Optional[int] = 128,
+              max_bytes: Optional[int] = None) -> Callable:
+    """
+    Decorador que memoriza los resultados de una función pura.
+
+    Las excepciones no se memorizan. La función envuelta expone la caché
+    en el atributo `cache` y la original en `__wrapped__`.
+
+    Args:
+        funcion: Función a memorizar (permite usar el decorador sin paréntesis)
+        max_entradas: Cantidad máxima de resultados guardados
+        max_bytes: Tamaño máximo total de los resultados en bytes
+
+    Returns:
+        La función envuelta
+    """
+    def decorador(original: Callable) -> Callable:
+        return _memorizar_con(original, CacheLRU(max_entradas, max_bytes))
+
+    if funcion is not None:
+        return decorador(funcion)
+    return decorador
+
+
+def _memorizar_con(original: Callable, cache: CacheLRU) -> Callable:
+    """Envuelve una función pura guardando sus resultados en `cache`."""
+    @functools.wraps(original)
+    def envoltura(*args, **kwargs):
+        try:
+            clave = clave_argumentos(args, kwargs)
+            hash(clave)
+        except TypeError:
+            return original(*args, **kwargs)  # argumentos no hashables
+
+        valor = cache.obtener(clave, _FALTANTE)
+        if valor is _FALTANTE:
+            valor = original(*args, **kwargs)
+            cache.guardar(clave, valor)
+        return valor
+
+    envoltura.cache = cache
+    envoltura.invalidar = lambda *args, **kwargs: cache.invalidar(
+        clave_argumentos(args, kwargs))
+    envoltura.limpiar = cache.limpiar
+    envoltura.estadisticas = cache.estadisticas
+    return envoltura
+
+
+# Nombre de la capa de esta caché en `capas`
+CAPA = "cache"
+
+# Funciones de `operaciones` actualmente memorizadas: nombre -> caché
+_activas: Dict[str, CacheLRU] = {}
+_lock_activas = threading.Lock()
+
+
+def activar_cache(nombre: str, max_entradas: Optional[int] = 128,
+                  max_bytes: Optional[int] = None) -> CacheLRU:
+    """
+    Memoriza una función de `operaciones` reemplazándola en el módulo.
+
+    Si la función ya estaba memorizada, su caché se reemplaza por una nueva
+    con la configuración indicada. Las demás capas de la función (por
+    ejemplo la instrumentación) se conservan.
+
+    Args:
+        nombre: Nombre de la función en `operaciones` (por ejemplo 'factorial')
+        max_entradas: Cantidad máxima de resultados guardados
+        max_bytes: Tamaño máximo total de los resultados en bytes
+
+    Returns:
+        La caché asociada a la función
+
+    Raises:
+        ValueError: Si `operaciones` no tiene una función con ese nombre
+    """
+    cache = CacheLRU(max_entradas, max_bytes)
+    with _lock_activas:
+        capas.envolver(nombre, CAPA, lambda funcion: _memorizar_con(funcion, cache))
+        _activas[nombre] = cache
+        return cache
+
+
+def desactivar_cache(nombre: Optional[str] = None) -> None:
+    """
+    Quita la memorización de una función de `operaciones` y descarta su caché.
+
+    Solo se quita la capa de esta caché; las demás capas de la función se
+    conservan.
+
+    Args:
+        nombre: Nombre de la función, o None para desactivar todas
+
+    Returns:
+        None
+    """
+    with _lock_activas:
+        nombres = list(_activas) if nombre is None else [nombre]
+        for n in nombres:
+            cache = _activas.pop(n, None)
+            if cache is not None:
+                cache.limpiar()
+                capas.quitar(n, CAPA)
+
+
+def estadisticas_cache() -> Dict[str, Dict[str, int]]:
+    """
+    Devuelve las estadísticas de cada función memorizada.
+
+    Returns:
+        Diccionario nombre -> {aciertos, fallos, desalojos, entradas, bytes}
+    """
+    with _lock_activas:
+        return {n: cache.estadisticas() for n, cache in _activas.items()}
+
+
+def limpiar_caches() -> None:
+    """
+    Vacía todas las cachés activas sin desactivarlas.
+
+    Returns:
+        None
+    """
+    with _lock_activas:
+        for cache in _activas.values():
+            cache.limpiar()
@@ -0,0 +1,509 @@
+"""
+Módulo de Caché en Disco
+========================
+
+Este módulo contiene una caché persistente de resultados para las
+funciones costosas de `operaciones` (por defecto `factorial`, `es_primo`
+y `potencia`), de modo que un proceso que se reinicia no vuelve a
+calcular los mismos factoriales grandes ni las mismas pruebas de
+primalidad.
+
+Los resultados se guardan en una base `sqlite3` en modo WAL, con la
+clave formada por el nombre de la función y los argumentos (con su tipo).
+Varios procesos del mismo equipo pueden compartir el archivo: sqlite
+serializa las escrituras y cada hilo usa su propia conexión. El tamaño
+total se acota desalojando las entradas usadas hace más tiempo (LRU), y
+los valores grandes se comprimen con zlib.
+
+Solo se guardan los resultados que tardaron al menos `umbral_segundos`
+en calcularse; los de las llamadas baratas se recalculan, porque
+consultarlos en disco cuesta más.
+
+Se activa con `activar_cache_disco()` o con la variable de entorno
+`PAQUETE_CACHE_DISCO` (ruta del archivo) antes de importar el paquete.
+Es una capa de `capas`, así que convive con la caché en memoria y la
+instrumentación.
+
+Funciones disponibles:
+- CacheDisco(ruta): Caché persistente acotada por tamaño
+- activar_cache_disco(ruta, nombres): Envuelve funciones de `operaciones`
+- desactivar_cache_disco(nombres): Quita la caché en disco de las funciones
+- calentar_cache(cache, llamadas): Calcula y guarda resultados por adelantado
+
+Uso:
+    python -m paquete.cache_disco cache.db calentar factorial --rango 1000 5000
+    python -m paquete.cache_disco cache.db calentar --lote operaciones.txt
+    python -m paquete.cache_disco cache.db estadisticas
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import argparse
+import functools
+import inspect
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from . import capas, operaciones
+from .columnas import _codificar_valor, _decodificar_valor
+
+
+# Variable de entorno con la ruta de la caché a activar al importar el paquete
+VARIABLE_ENTORNO = "PAQUETE_CACHE_DISCO"
+
+# Funciones que se envuelven por defecto
+FUNCIONES_POR_DEFECTO = ("factorial", "es_primo", "potencia")
+
+# Tamaño máximo por defecto de los valores guardados
+MAX_BYTES = 256 * 1024 * 1024
+
+# Valores más grandes que esto se comprimen
+UMBRAL_COMPRESION = 1024
+
+# Resultados más rápidos que esto no se guardan
+UMBRAL_SEGUNDOS = 0.001
+
+# Resolución de la marca de último uso: una lectura solo la actualiza
+# (una escritura en disco) si es más vieja que esto
+_RESOLUCION_USO = 60.0
+
+# Encabezado de un byte de cada valor guardado
+_SIN_COMPRIMIR = b"-"
+_COMPRIMIDO = b"z"
+
+_FALTANTE = object()
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS resultados (
+    clave TEXT PRIMARY KEY,
+    valor BLOB NOT NULL,
+    tamano INTEGER NOT NULL,
+    usado REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS resultados_usado ON resultados (usado);
+"""
+
+
+def _texto_argumento(valor: Any) -> str:
+    """Representación exacta y sin límite de dígitos de un argumento."""
+    if isinstance(valor, bool) or valor is None:
+        return repr(valor)
+    if isinstance(valor, int):
+        return hex(valor)
+    if isinstance(valor, float):
+        return valor.hex()
+    if isinstance(valor, str):
+        return repr(valor)
+    raise TypeError(f"Argumento no soportado por la caché en disco: {type(valor).__name__}")
+
+
+def clave_disco(nombre: str, argumentos: Sequence[Any]) -> str:
+    """
+    Construye la clave de una llamada.
+
+    Incluye el tipo de cada argumento, como `cache.clave_argumentos`, para
+    que `potencia(2, 3)` y `potencia(2.0, 3)` no compartan resultado.
+
+    Raises:
+        TypeError: Si algún argumento no es None, bool, int, float o str
+    """
+    partes = ",".join(f"{type(a).__name__}:{_texto_argumento(a)}" for a in argumentos)
+    return f"{nombre}({partes})"
+
+
+def _empaquetar(valor: Any, umbral_compresion: int) -> bytes:
+    datos = _codificar_valor(valor)
+    if len(datos) > umbral_compresion:
+        comprimido = zlib.compress(datos, 1)
+        if len(comprimido) < len(datos):
+            return _COMPRIMIDO + comprimido
+    return _SIN_COMPRIMIR + datos
+
+
+def _desempaquetar(datos: bytes) -> Any:
+    cuerpo = datos[1:]
+    if datos[:1] == _COMPRIMIDO:
+        cuerpo = zlib.decompress(cuerpo)
+    return _decodificar_valor(cuerpo)
+
+
+class CacheDisco:
+    """
+    Caché persistente de resultados en un archivo sqlite.
+
+    Después de cada `guardar` el total del archivo respeta `max_bytes`,
+    también con varios procesos compartiendo el archivo: cada inserción
+    consulta el total compartido y desaloja si lo excede.
+
+    Args:
+        ruta: Ruta del archivo de la base de datos
+        max_bytes: Tamaño máximo total de los valores guardados
+        umbral_compresion: Bytes a partir de los cuales un valor se comprime
+        tiempo_espera: Segundos que se espera a que otro proceso libere la base
+    """
+
+    def __init__(self, ruta: str, max_bytes: int = MAX_BYTES,
+                 umbral_compresion: int = UMBRAL_COMPRESION, tiempo_espera: float = 30.0) -> None:
+        if max_bytes <= 0:
+            raise ValueError("El tamaño máximo en bytes debe ser positivo")
+        self.ruta = ruta
+        self.max_bytes = max_bytes
+        self.umbral_compresion = umbral_compresion
+        self.tiempo_espera = tiempo_espera
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self._conexion()  # crea el esquema y falla temprano si la ruta no es válida
+
+    def _conexion(self) -> sqlite3.Connection:
+        """Conexión del hilo actual (una nueva después de un fork)."""
+        conexion = getattr(self._local, "conexion", None)
+        if conexion is None or self._local.pid != os.getpid():
+            conexion = sqlite3.connect(self.ruta, timeout=self.tiempo_espera,
+                                       isolation_level=None)
+            conexion.execute("PRAGMA journal_mode=WAL")
+            conexion.execute("PRAGMA synchronous=NORMAL")
+            conexion.executescript(_ESQUEMA)
+            self._local.conexion = conexion
+            self._local.pid = os.getpid()
+        return conexion
+
+    def obtener(self, clave: str, defecto: Any = None) -> Any:
+        """Devuelve el valor guardado para `clave` o `defecto` si no existe."""
+        conexion = self._conexion()
+        fila = conexion.execute("SELECT valor, usado FROM resultados WHERE clave = ?",
+                                (clave,)).fetchone()
+        if fila is None:
+            with self._lock:
+                self.fallos += 1
+            return defecto
+        ahora = time.time()
+        if ahora - fila[1] > _RESOLUCION_USO:
+            conexion.execute("UPDATE resultados SET usado = ? WHERE clave = ?", (ahora, clave))
+        with self._lock:
+            self.aciertos += 1
+        return _desempaquetar(fila[0])
+
+    def guardar(self, clave: str, valor: Any) -> None:
+        """Guarda un valor desalojando los menos usados si se excede el tamaño máximo."""
+        datos = _empaquetar(valor, self.umbral_compresion)
+        if len(datos) > self.max_bytes:
+            return  # nunca cabría: no desalojar todo por un único valor
+
+        conexion = self._conexion()
+        conexion.execute("INSERT OR REPLACE INTO resultados (clave, valor, tamano, usado) "
+                         "VALUES (?, ?, ?, ?)", (clave, datos, len(datos), time.time()))
+        # El total es el del archivo, no el de este proceso: otros procesos
+        # que lo comparten también escriben
+        total = conexion.execute("SELECT COALESCE(SUM(tamano), 0) FROM resultados").fetchone()[0]
+        if total > self.max_bytes:
+            self.desalojar()
+
+    def desalojar(self) -> int:
+        """
+        Elimina las entradas menos usadas hasta respetar el tamaño máximo.
+
+        Returns:
+            Cantidad de entradas eliminadas
+        """
+        conexion = self._conexion()
+        conexion.execute("BEGIN IMMEDIATE")
+        try:
+            total = conexion.execute("SELECT COALESCE(SUM(tamano), 0) FROM resultados").fetchone()[0]
+            exceso = total - self.max_bytes
+            eliminar = []
+            if exceso > 0:
+                for clave, tamano in conexion.execute(
+                        "SELECT clave, tamano FROM resultados ORDER BY usado"):
+                    eliminar.append((clave,))
+                    exceso -= tamano
+                    if exceso <= 0:
+                        break
+                conexion.executemany("DELETE FROM resultados WHERE clave = ?", eliminar)
+            conexion.execute("COMMIT")
+        except BaseException:
+            conexion.execute("ROLLBACK")
+            raise
+        with self._lock:
+            self.desalojos += len(eliminar)
+        return len(eliminar)
+
+    def invalidar(self, clave: str) -> bool:
+        """Elimina una entrada. Devuelve True si existía."""
+        cursor = self._conexion().execute("DELETE FROM resultados WHERE clave = ?", (clave,))
+        return cursor.rowcount > 0
+
+    def limpiar(self) -> None:
+        """Vacía la caché y reinicia sus estadísticas."""
+        self._conexion().execute("DELETE FROM resultados")
+        with self._lock:
+            self.aciertos = self.fallos = self.desalojos = 0
+
+    def estadisticas(self) -> Dict[str, int]:
+        """Devuelve aciertos, fallos y desalojos de este proceso, y entradas y bytes del archivo."""
+        entradas, total = self._conexion().execute(
+            "SELECT COUNT(*), COALESCE(SUM(tamano), 0) FROM resultados").fetchone()
+        with self._lock:
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+                "entradas": entradas,
+                "bytes": total,
+            }
+
+    def __len__(self) -> int:
+        return self._conexion().execute("SELECT COUNT(*) FROM resultados").fetchone()[0]
+
+    def cerrar(self) -> None:
+        """Cierra la conexión del hilo actual."""
+        conexion = getattr(self._local, "conexion", None)
+        if conexion is not None:
+            conexion.close()
+            self._local.conexion = None
+
+
+def persistir(funcion: Callable, cache: CacheDisco, nombre: Optional[str] = None,
+              umbral_segundos: float = UMBRAL_SEGUNDOS) -> Callable:
+    """
+    Envuelve una función pura para que consulte y llene una caché en disco.
+
+    Las excepciones no se guardan, y las llamadas con argumentos no
+    soportados por la clave se ejecutan sin caché. La función envuelta
+    expone la caché en el atributo `cache_disco` y la original en
+    `__wrapped__`.
+
+    Args:
+        funcion: Función a envolver
+        cache: Caché donde guardar los resultados
+        nombre: Nombre usado en la clave (por defecto el de la función)
+        umbral_segundos: Tiempo mínimo de cálculo para guardar un resultado
+
+    Returns:
+        La función envuelta
+    """
+    nombre = nombre or funcion.__name__
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        if kwargs:
+            return funcion(*args, **kwargs)
+        try:
+            clave = clave_disco(nombre, args)
+        except TypeError:
+            return funcion(*args)
+
+        valor = cache.obtener(clave, _FALTANTE)
+        if valor is _FALTANTE:
+            inicio = time.perf_counter()
+            valor = funcion(*args)
+            if time.perf_counter() - inicio >= umbral_segundos:
+                cache.guardar(clave, valor)
+        return valor
+
+    envoltura.cache_disco = cache
+    return envoltura
+
+
+# Nombre de la capa de esta caché en `capas`
+CAPA = "cache_disco"
+
+# Funciones de `operaciones` actualmente envueltas: nombre -> caché
+_activas: Dict[str, CacheDisco] = {}
+_lock_activas = threading.Lock()
+
+
+def activar_cache_disco(ruta: str, nombres: Iterable[str] = FUNCIONES_POR_DEFECTO,
+                        max_bytes: int = MAX_BYTES,
+                        umbral_segundos: float = UMBRAL_SEGUNDOS) -> CacheDisco:
+    """
+    Envuelve funciones de `operaciones` con una caché en disco compartida.
+
+    Args:
+        ruta: Ruta del archivo de la caché
+        nombres: Nombres de las funciones de `operaciones` a envolver
+        max_bytes: Tamaño máximo total de los valores guardados
+        umbral_segundos: Tiempo mínimo de cálculo para guardar un resultado
+
+    Si ya hay una caché activa con la misma ruta, se reutiliza (con el
+    nuevo `max_bytes`). Las cachés que quedan sin funciones al ser
+    reemplazadas se cierran.
+
+    Returns:
+        La caché usada
+
+    Raises:
+        ValueError: Si algún nombre no es una función de `operaciones`
+    """
+    nombres = list(nombres)
+    with _lock_activas:
+        for nombre in nombres:
+            actual = getattr(operaciones, nombre, None)
+            if not inspect.isfunction(actual) or nombre.startswith("_"):
+                raise ValueError(f"'{nombre}' no es una función de operaciones")
+
+        cache = next((c for c in _activas.values() if c.ruta == ruta), None)
+        if cache is None:
+            cache = CacheDisco(ruta, max_bytes=max_bytes)
+        else:
+            cache.max_bytes = max_bytes
+
+        for nombre in nombres:
+            capas.envolver(nombre, CAPA, functools.partial(
+                persistir, cache=cache, nombre=nombre, umbral_segundos=umbral_segundos))
+            anterior = _activas.get(nombre)
+            _activas[nombre] = cache
+            _cerrar_si_libre(anterior)
+    return cache
+
+
+def _cerrar_si_libre(cache: Optional[CacheDisco]) -> None:
+    """Cierra una caché que ya no usa ninguna función; el llamador tiene el candado."""
+    if cache is not None and all(c is not cache for c in _activas.values()):
+        cache.cerrar()
+
+
+def desactivar_cache_disco(nombres: Optional[Iterable[str]] = None) -> None:
+    """
+    Quita la caché en disco de funciones de `operaciones`.
+
+    Solo se quita esta capa; las demás capas de cada función (por ejemplo
+    la caché en memoria) se conservan. El archivo de la caché se conserva;
+    su conexión se cierra cuando ya no la usa ninguna función.
+
+    Args:
+        nombres: Nombres de las funciones, o None para desactivar todas
+    """
+    with _lock_activas:
+        for nombre in list(_activas) if nombres is None else list(nombres):
+            cache = _activas.pop(nombre, None)
+            if cache is not None:
+                capas.quitar(nombre, CAPA)
+                _cerrar_si_libre(cache)
+
+
+def calentar_cache(cache: CacheDisco, llamadas: Iterable[Tuple[str, Sequence[Any]]],
+                   reporte: Optional[list] = None) -> int:
+    """
+    Calcula y guarda resultados por adelantado, sin importar cuánto tarden.
+
+    Las llamadas que ya están en la caché no se recalculan.
+
+    Args:
+        cache: Caché a llenar
+        llamadas: Iterable de tuplas (nombre de la función de `operaciones`,
+            argumentos); los argumentos de texto se convierten a int o
+            float, y si no son números la llamada se reporta como fallida
+        reporte: Lista opcional donde se agregan tuplas (indice, mensaje)
+            de las llamadas que fallaron
+
+    Returns:
+        Cantidad de resultados calculados y guardados
+    """
+    guardados = 0
+    for indice, (nombre, argumentos) in enumerate(llamadas):
+        try:
+            # La función sin capas: calentar no debe pasar por otras cachés ni métricas
+            funcion = capas.original(nombre)
+            argumentos = [_convertir_argumento(a) if isinstance(a, str) else a for a in argumentos]
+            clave = clave_disco(nombre, argumentos)
+            if cache.obtener(clave, _FALTANTE) is _FALTANTE:
+                cache.guardar(clave, funcion(*argumentos))
+                guardados += 1
+        except Exception as e:
+            if reporte is not None:
+                reporte.append((indice, str(e)))
+    return guardados
+
+
+def _activar_desde_entorno() -> None:
+    """Activa la caché en disco según la variable de entorno."""
+    ruta = os.environ.get(VARIABLE_ENTORNO, "").strip()
+    if ruta:
+        activar_cache_disco(ruta)
+
+
+def _convertir_argumento(texto: str) -> Union[int, float]:
+    """
+    Convierte un argumento de texto en int si es entero o en float si no lo es.
+
+    Raises:
+        ValueError: Si el texto no es un número
+    """
+    try:
+        return int(texto)
+    except ValueError:
+        pass
+    try:
+        return float(texto)
+    except ValueError:
+        raise ValueError(f"Argumento no numérico: {texto!r}") from None
+
+
+def _llamadas_de_lote(ruta: str) -> Iterable[Tuple[str, List[str]]]:
+    """
+    Llamadas de un archivo con una operación por línea ('factorial 500').
+
+    Los argumentos quedan como texto: `calentar_cache` los convierte dentro
+    del manejo de errores de cada llamada, así que una línea inválida se
+    reporta sin detener el resto del archivo.
+    """
+    with open(ruta, encoding="utf-8") as archivo:
+        for linea in archivo:
+            partes = linea.replace(",", " ").split()
+            if partes and not partes[0].startswith("#"):
+                yield partes[0], partes[1:]
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Caché en disco de resultados de operaciones")
+    parser.add_argument("ruta", help="Archivo de la caché")
+    parser.add_argument("--max-bytes", type=int, default=MAX_BYTES)
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    calentar = comandos.add_parser("calentar", help="Calcula y guarda resultados por adelantado")
+    calentar.add_argument("operacion", nargs="?", help="Función de operaciones para --rango")
+    calentar.add_argument("--rango", type=int, nargs=2, metavar=("DESDE", "HASTA"),
+                          help="Llama a OPERACION(n) para n en [DESDE, HASTA)")
+    calentar.add_argument("--lote", metavar="ARCHIVO",
+                          help="Archivo con una llamada por línea, por ejemplo 'potencia 2 1000'")
+    comandos.add_parser("estadisticas", help="Muestra entradas y bytes ocupados")
+    comandos.add_parser("limpiar", help="Vacía la caché")
+    opciones = parser.parse_args(argv)
+
+    cache = CacheDisco(opciones.ruta, max_bytes=opciones.max_bytes)
+    if opciones.comando == "calentar":
+        if opciones.lote:
+            llamadas = _llamadas_de_lote(opciones.lote)
+        elif opciones.operacion and opciones.rango:
+            desde, hasta = opciones.rango
+            llamadas = ((opciones.operacion, [n]) for n in range(desde, hasta))
+        else:
+            parser.error("calentar necesita OPERACION --rango DESDE HASTA o --lote ARCHIVO")
+        reporte = []
+        guardados = calentar_cache(cache, llamadas, reporte)
+        for indice, mensaje in reporte:
+            print(f"llamada {indice}: error: {mensaje}", file=sys.stderr)
+        print(f"{guardados} resultados guardados")
+        return 1 if reporte else 0
+    if opciones.comando == "limpiar":
+        cache.limpiar()
+        return 0
+
+    for clave, valor in cache.estadisticas().items():
+        print(f"{clave}: {valor}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Módulo de Capas
+===============
+
+Este módulo coordina las envolturas que otros módulos instalan sobre las
+funciones de `operaciones`: la caché en memoria (`cache`), la
+instrumentación (`instrumentacion`) y la caché en disco (`cache_disco`).
+
+Cada función tiene una cadena de capas con nombre, en orden de
+activación. Cada vez que se agrega o se quita una capa, la cadena se
+reconstruye sobre la función original: quitar una capa deja las demás
+como estaban, y volver a activar una capa la reemplaza en su lugar.
+
+Una capa se describe con una fábrica `fabrica(funcion) -> envoltura` que
+guarda su estado fuera de la envoltura (la caché, las métricas), así que
+reconstruir la cadena no lo pierde.
+
+Funciones disponibles:
+- envolver(nombre, capa, fabrica): Agrega o reemplaza una capa
+- quitar(nombre, capa): Quita una capa y deja las demás
+- original(nombre): La función de `operaciones` sin capas
+- capas_activas(nombre): Nombres de las capas de una función, de adentro hacia afuera
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import inspect
+import threading
+from typing import Callable, Dict, List
+
+from . import operaciones
+
+
+Fabrica = Callable[[Callable], Callable]
+
+_lock = threading.RLock()
+
+# Funciones originales de las funciones con alguna capa: nombre -> función
+_originales: Dict[str, Callable] = {}
+
+# Capas de cada función en orden de activación: nombre -> {capa: fábrica}
+_cadenas: Dict[str, Dict[str, Fabrica]] = {}
+
+
+def _validar_nombre(nombre: str) -> None:
+    """
+    Comprueba que `nombre` sea una función pública de `operaciones`.
+
+    Raises:
+        ValueError: Si `operaciones` no tiene una función pública con ese nombre
+    """
+    if not isinstance(nombre, str) or nombre.startswith("_") or \
+            not inspect.isfunction(getattr(operaciones, nombre, None)):
+        raise ValueError(f"'{nombre}' no es una función de operaciones")
+
+
+def _reconstruir(nombre: str) -> Dict[str, Callable]:
+    """Arma la cadena sobre la función original e instala la capa exterior."""
+    funcion = _originales[nombre]
+    envolturas = {}
+    for capa, fabrica in _cadenas[nombre].items():
+        funcion = fabrica(funcion)
+        envolturas[capa] = funcion
+    setattr(operaciones, nombre, funcion)
+    return envolturas
+
+
+def envolver(nombre: str, capa: str, fabrica: Fabrica) -> Callable:
+    """
+    Agrega una capa a una función de `operaciones`.
+
+    Si la función ya tenía una capa con ese nombre, se reemplaza en la
+    misma posición de la cadena.
+
+    Args:
+        nombre: Nombre de la función en `operaciones`
+        capa: Nombre de la capa (por ejemplo 'cache')
+        fabrica: Función que recibe la función interior y devuelve la envoltura
+
+    Returns:
+        La envoltura de esta capa
+
+    Raises:
+        ValueError: Si `operaciones` no tiene una función con ese nombre
+    """
+    with _lock:
+        _validar_nombre(nombre)
+        if nombre not in _cadenas:
+            _originales[nombre] = getattr(operaciones, nombre)
+            _cadenas[nombre] = {}
+        _cadenas[nombre][capa] = fabrica
+        return _reconstruir(nombre)[capa]
+
+
+def quitar(nombre: str, capa: str) -> bool:
+    """
+    Quita una capa de una función de `operaciones` y deja las demás.
+
+    Args:
+        nombre: Nombre de la función en `operaciones`
+        capa: Nombre de la capa
+
+    Returns:
+        True si la capa estaba activa
+    """
+    with _lock:
+        cadena = _cadenas.get(nombre)
+        if cadena is None or capa not in cadena:
+            return False
+        del cadena[capa]
+        if cadena:
+            _reconstruir(nombre)
+        else:
+            del _cadenas[nombre]
+            setattr(operaciones, nombre, _originales.pop(nombre))
+        return True
+
+
+def original(nombre: str) -> Callable:
+    """
+    Devuelve la función de `operaciones` sin ninguna capa.
+
+    Raises:
+        ValueError: Si `operaciones` no tiene una función con ese nombre
+    """
+    with _lock:
+        if nombre in _originales:
+            return _originales[nombre]
+        _validar_nombre(nombre)
+        return getattr(operaciones, nombre)
+
+
+def capas_activas(nombre: str) -> List[str]:
+    """Nombres de las capas de una función, de la más interior a la exterior."""
+    with _lock:
+        return list(_cadenas.get(nombre, ()))
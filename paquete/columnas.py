@@ -0,0 +1,530 @@
+"""
+Módulo de Archivos Columnares
+=============================
+
+Este módulo contiene un formato binario compacto para guardar resultados
+de cálculos masivos, de modo que se puedan volver a leer sin interpretar
+texto. El archivo tiene una cabecera versionada con el nombre y el tipo de
+cada columna, seguida de bloques de filas; dentro de cada bloque, cada
+columna se guarda contigua:
+
+- 'int64', 'float64' y 'bool': valores de ancho fijo en little-endian,
+  escritos y leídos con `array`.
+- 'entero': enteros de cualquier tamaño (por ejemplo factoriales) en
+  complemento a dos con la cantidad mínima de bytes.
+- 'texto': cadenas UTF-8.
+- 'valor': None, bool, int de cualquier tamaño, float o str, con una
+  etiqueta de un byte (para columnas de resultados de tipo mixto).
+
+Las columnas de largo variable llevan una tabla de desplazamientos, así
+que la fila i se lee directamente desde el `mmap` del archivo sin recorrer
+las anteriores. Agregar filas escribe bloques nuevos al final, sin
+reescribir lo existente; un bloque incompleto al final (por ejemplo, de un
+proceso interrumpido) se ignora al leer.
+
+Funciones disponibles:
+- EscritorColumnar(ruta, columnas): Escribe o agrega filas a un archivo
+- LectorColumnar(ruta): Lee filas y columnas con acceso aleatorio
+- TIPOS_COLUMNA: Tipos de columna soportados
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+
+# Versión del formato; los lectores aceptan archivos de esta versión o anteriores
+VERSION_FORMATO = 1
+
+# Código de cada tipo de columna en la cabecera del archivo
+TIPOS_COLUMNA = {"int64": 1, "float64": 2, "bool": 3, "entero": 4, "texto": 5, "valor": 6}
+_NOMBRES_TIPO = {codigo: nombre for nombre, codigo in TIPOS_COLUMNA.items()}
+
+# Tipos de ancho fijo: código de `array` y estructura de un valor
+_FIJOS = {"int64": ("q", struct.Struct("<q")), "float64": ("d", struct.Struct("<d")),
+          "bool": ("B", struct.Struct("<?"))}
+
+# Filas acumuladas en memoria antes de escribir un bloque
+FILAS_POR_BLOQUE = 65536
+
+_MAGIA = b"PQCOL\x00"
+_CABECERA = struct.Struct("<6sHH")       # magia, versión, cantidad de columnas
+_COLUMNA = struct.Struct("<BH")          # tipo, largo del nombre en bytes
+_BLOQUE = struct.Struct("<4sI")          # marca, cantidad de filas
+_MARCA_BLOQUE = b"BLQ\x00"
+_LARGO = struct.Struct("<Q")
+_PAR_DESPLAZAMIENTOS = struct.Struct("<QQ")
+_FLOTANTE = struct.Struct("<d")
+
+_NATIVO_LITTLE = sys.byteorder == "little"
+
+# Etiquetas de las columnas 'valor'
+_NINGUNO, _FALSO, _VERDADERO, _ENTERO, _FLOTANTE_ETIQUETA, _TEXTO = range(6)
+
+
+def _relleno(largo: int) -> int:
+    """Bytes de relleno para alinear `largo` a 8 bytes."""
+    return -largo % 8
+
+
+def _codificar_entero(n: int) -> bytes:
+    """Entero de cualquier tamaño en complemento a dos con los bytes mínimos."""
+    return n.to_bytes((n.bit_length() + 8) // 8, "little", signed=True)
+
+
+def _codificar_valor(valor: Any) -> bytes:
+    """Valor de tipo mixto con una etiqueta de un byte."""
+    if valor is None:
+        return bytes((_NINGUNO,))
+    if isinstance(valor, bool):
+        return bytes((_VERDADERO if valor else _FALSO,))
+    if isinstance(valor, int):
+        return bytes((_ENTERO,)) + _codificar_entero(valor)
+    if isinstance(valor, float):
+        return bytes((_FLOTANTE_ETIQUETA,)) + _FLOTANTE.pack(valor)
+    if isinstance(valor, str):
+        return bytes((_TEXTO,)) + valor.encode("utf-8")
+    raise TypeError(f"Valor no soportado en una columna 'valor': {type(valor).__name__}")
+
+
+def _decodificar_entero(datos: Union[bytes, memoryview]) -> int:
+    return int.from_bytes(datos, "little", signed=True)
+
+
+def _decodificar_texto(datos: Union[bytes, memoryview]) -> str:
+    return bytes(datos).decode("utf-8")
+
+
+def _decodificar_valor(datos: Union[bytes, memoryview]) -> Any:
+    etiqueta = datos[0]
+    if etiqueta == _NINGUNO:
+        return None
+    if etiqueta in (_FALSO, _VERDADERO):
+        return etiqueta == _VERDADERO
+    if etiqueta == _ENTERO:
+        return int.from_bytes(datos[1:], "little", signed=True)
+    if etiqueta == _FLOTANTE_ETIQUETA:
+        return _FLOTANTE.unpack_from(datos, 1)[0]
+    if etiqueta == _TEXTO:
+        return bytes(datos[1:]).decode("utf-8")
+    raise ValueError(f"Etiqueta de valor desconocida: {etiqueta}")
+
+
+def _codificar_texto(texto: str) -> bytes:
+    if not isinstance(texto, str):
+        raise TypeError("Los valores de una columna 'texto' deben ser cadenas")
+    return texto.encode("utf-8")
+
+
+def _codificar_entero_validado(n: int) -> bytes:
+    if not isinstance(n, int):
+        raise TypeError("Los valores de una columna 'entero' deben ser enteros")
+    return _codificar_entero(n)
+
+
+# Tipos de largo variable: codificador y decodificador de un valor
+_VARIABLES: Dict[str, Tuple[Callable[[Any], bytes], Callable[[Any], Any]]] = {
+    "entero": (_codificar_entero_validado, _decodificar_entero),
+    "texto": (_codificar_texto, _decodificar_texto),
+    "valor": (_codificar_valor, _decodificar_valor),
+}
+
+
+def _validar_columnas(columnas: Sequence[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """Valida la lista de columnas (nombre, tipo)."""
+    columnas = [tuple(columna) for columna in columnas]
+    if not columnas:
+        raise ValueError("Debe haber al menos una columna")
+    nombres = set()
+    for nombre, tipo in columnas:
+        if not isinstance(nombre, str) or not nombre:
+            raise ValueError(f"Nombre de columna no válido: {nombre!r}")
+        if nombre in nombres:
+            raise ValueError(f"Columna repetida: {nombre}")
+        if tipo not in TIPOS_COLUMNA:
+            raise ValueError(f"Tipo de columna no válido: {tipo!r} (usa {tuple(TIPOS_COLUMNA)})")
+        nombres.add(nombre)
+    return columnas
+
+
+def _codificar_cabecera(columnas: List[Tuple[str, str]]) -> bytes:
+    partes = [_CABECERA.pack(_MAGIA, VERSION_FORMATO, len(columnas))]
+    for nombre, tipo in columnas:
+        nombre_bytes = nombre.encode("utf-8")
+        partes.append(_COLUMNA.pack(TIPOS_COLUMNA[tipo], len(nombre_bytes)))
+        partes.append(nombre_bytes)
+    cabecera = b"".join(partes)
+    return cabecera + bytes(_relleno(len(cabecera)))
+
+
+def _leer_cabecera(datos: Union[bytes, mmap.mmap]) -> Tuple[int, List[Tuple[str, str]], int]:
+    """
+    Interpreta la cabecera de un archivo columnar.
+
+    Returns:
+        Tupla (version, columnas, posición del primer bloque)
+    """
+    if len(datos) < _CABECERA.size:
+        raise ValueError("El archivo no tiene formato columnar")
+    magia, version, cantidad = _CABECERA.unpack_from(datos, 0)
+    if magia != _MAGIA:
+        raise ValueError("El archivo no tiene formato columnar")
+    if version > VERSION_FORMATO:
+        raise ValueError(f"Versión de formato {version} no soportada (máxima {VERSION_FORMATO})")
+
+    posicion = _CABECERA.size
+    columnas = []
+    for _ in range(cantidad):
+        codigo, largo = _COLUMNA.unpack_from(datos, posicion)
+        posicion += _COLUMNA.size
+        if codigo not in _NOMBRES_TIPO:
+            raise ValueError(f"Tipo de columna desconocido: {codigo}")
+        columnas.append((bytes(datos[posicion:posicion + largo]).decode("utf-8"), _NOMBRES_TIPO[codigo]))
+        posicion += largo
+    return version, columnas, posicion + _relleno(posicion)
+
+
+def _codificar_columna(tipo: str, valores: Sequence[Any]) -> bytes:
+    """Datos de una columna dentro de un bloque."""
+    if tipo in _FIJOS:
+        datos = array(_FIJOS[tipo][0], valores)
+        if not _NATIVO_LITTLE:
+            datos.byteswap()
+        return datos.tobytes()
+
+    codificar = _VARIABLES[tipo][0]
+    segmentos = [codificar(valor) for valor in valores]
+    desplazamientos = array("Q", accumulate(map(len, segmentos), initial=0))
+    if not _NATIVO_LITTLE:
+        desplazamientos.byteswap()
+    return desplazamientos.tobytes() + b"".join(segmentos)
+
+
+def _recorrer_bloques(datos: Any, posicion: int, cantidad: int
+                      ) -> Iterator[Tuple[int, int, List[Tuple[int, int]]]]:
+    """
+    Recorre las cabeceras de los bloques completos de un archivo.
+
+    Un bloque final incompleto (por ejemplo, de un proceso interrumpido)
+    termina el recorrido sin error.
+
+    Args:
+        datos: Contenido del archivo (bytes o mmap)
+        posicion: Posición del primer bloque
+        cantidad: Cantidad de columnas
+
+    Yields:
+        Tuplas (posición siguiente al bloque, filas, [(posición, largo)
+        de los datos de cada columna])
+
+    Raises:
+        ValueError: Si un bloque no empieza con la marca de bloque
+    """
+    tamano = len(datos)
+    while posicion + _BLOQUE.size <= tamano:
+        marca, filas = _BLOQUE.unpack_from(datos, posicion)
+        if marca != _MARCA_BLOQUE:
+            raise ValueError(f"Bloque dañado en la posición {posicion}")
+        actual = posicion + _BLOQUE.size
+        columnas = []
+        for _ in range(cantidad):
+            if actual + _LARGO.size > tamano:
+                return
+            largo = _LARGO.unpack_from(datos, actual)[0]
+            actual += _LARGO.size
+            columnas.append((actual, largo))
+            actual += largo + _relleno(largo)
+        if actual > tamano:
+            return
+        yield actual, filas, columnas
+        posicion = actual
+
+
+class EscritorColumnar:
+    """
+    Escribe filas en un archivo columnar.
+
+    Las filas se acumulan en memoria y se escriben en bloques de
+    `filas_por_bloque` filas (o al llamar a `vaciar` o `cerrar`). Cada
+    bloque se escribe con una sola llamada a `write`.
+
+        with EscritorColumnar("factoriales.col", [("n", "int64"), ("factorial", "entero")]) as escritor:
+            for n in range(1000):
+                escritor.escribir_fila(n, factorial(n))
+
+    Args:
+        ruta: Ruta del archivo
+        columnas: Lista de tuplas (nombre, tipo) con tipos de `TIPOS_COLUMNA`
+        agregar: Si True y el archivo existe, agrega bloques al final; sus
+            columnas deben coincidir. Un bloque final incompleto se
+            descarta antes de agregar
+        filas_por_bloque: Filas por bloque escrito
+
+    Raises:
+        ValueError: Si las columnas no son válidas o no coinciden con las
+            del archivo existente
+    """
+
+    def __init__(self, ruta: str, columnas: Sequence[Tuple[str, str]], agregar: bool = False,
+                 filas_por_bloque: int = FILAS_POR_BLOQUE) -> None:
+        if filas_por_bloque < 1:
+            raise ValueError("Las filas por bloque deben ser positivas")
+        self.columnas = _validar_columnas(columnas)
+        self.filas_por_bloque = filas_por_bloque
+        self._tipos = [tipo for _, tipo in self.columnas]
+        self._pendientes: List[List[Any]] = [[] for _ in self.columnas]
+
+        if agregar and os.path.exists(ruta) and os.path.getsize(ruta) > 0:
+            self._archivo = open(ruta, "r+b")
+            try:
+                self._posicionar_al_final()
+            except Exception:
+                self._archivo.close()
+                raise
+        else:
+            self._archivo = open(ruta, "wb")
+            self._archivo.write(_codificar_cabecera(self.columnas))
+
+    def _posicionar_al_final(self) -> None:
+        """Valida el archivo existente y se ubica después de su último bloque completo."""
+        with mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            _, existentes, fin = _leer_cabecera(mapa)
+            if existentes != self.columnas:
+                raise ValueError(f"Las columnas no coinciden con las del archivo: {existentes}")
+            for fin, _, _ in _recorrer_bloques(mapa, fin, len(self.columnas)):
+                pass
+        # Agregar después de un bloque cortado dejaría el archivo ilegible
+        self._archivo.truncate(fin)
+        self._archivo.seek(fin)
+
+    def __len__(self) -> int:
+        """Filas pendientes de escribir."""
+        return len(self._pendientes[0])
+
+    def escribir_fila(self, *valores: Any) -> None:
+        """
+        Agrega una fila.
+
+        Raises:
+            ValueError: Si la cantidad de valores no coincide con las columnas
+        """
+        if len(valores) != len(self._pendientes):
+            raise ValueError(f"Se esperaban {len(self._pendientes)} valores, se recibieron {len(valores)}")
+        for pendientes, valor in zip(self._pendientes, valores):
+            pendientes.append(valor)
+        if len(self._pendientes[0]) >= self.filas_por_bloque:
+            self.vaciar()
+
+    def escribir_filas(self, filas: Iterable[Sequence[Any]]) -> None:
+        """Agrega varias filas."""
+        for fila in filas:
+            self.escribir_fila(*fila)
+
+    def escribir_columnas(self, *columnas: Sequence[Any]) -> None:
+        """
+        Agrega filas dadas como columnas completas, una secuencia por columna.
+
+        Raises:
+            ValueError: Si la cantidad de columnas o sus largos no coinciden
+        """
+        if len(columnas) != len(self._pendientes):
+            raise ValueError(f"Se esperaban {len(self._pendientes)} columnas, se recibieron {len(columnas)}")
+        if len({len(columna) for columna in columnas}) > 1:
+            raise ValueError("Las columnas deben tener el mismo largo")
+        for pendientes, columna in zip(self._pendientes, columnas):
+            pendientes.extend(columna)
+        while len(self._pendientes[0]) >= self.filas_por_bloque:
+            self._escribir_bloque(self.filas_por_bloque)
+
+    def vaciar(self) -> None:
+        """Escribe las filas pendientes como un bloque."""
+        if self._pendientes[0]:
+            self._escribir_bloque(len(self._pendientes[0]))
+        self._archivo.flush()
+
+    def _escribir_bloque(self, filas: int) -> None:
+        # Se codifican todas las columnas antes de tocar las pendientes: si
+        # una falla, las filas quedan intactas y alineadas
+        codificadas = [_codificar_columna(tipo, pendientes[:filas])
+                       for tipo, pendientes in zip(self._tipos, self._pendientes)]
+        partes = [_BLOQUE.pack(_MARCA_BLOQUE, filas)]
+        for datos in codificadas:
+            partes.append(_LARGO.pack(len(datos)))
+            partes.append(datos)
+            partes.append(bytes(_relleno(len(datos))))
+        self._archivo.write(b"".join(partes))
+        for pendientes in self._pendientes:
+            del pendientes[:filas]
+
+    def cerrar(self) -> None:
+        """Escribe las filas pendientes y cierra el archivo."""
+        if not self._archivo.closed:
+            self.vaciar()
+            self._archivo.close()
+
+    def __enter__(self) -> "EscritorColumnar":
+        return self
+
+    def __exit__(self, *excepcion: Any) -> None:
+        self.cerrar()
+
+
+class _Bloque:
+    """Posición de un bloque dentro del archivo."""
+
+    __slots__ = ("inicio", "filas", "columnas")
+
+    def __init__(self, inicio: int, filas: int, columnas: List[Tuple[int, int]]) -> None:
+        self.inicio = inicio          # índice de su primera fila
+        self.filas = filas
+        self.columnas = columnas      # (posición de los datos, largo) por columna
+
+
+class LectorColumnar:
+    """
+    Lee un archivo columnar mapeado en memoria.
+
+    Al abrirlo solo se recorren las cabeceras de los bloques; las filas se
+    leen del `mmap` cuando se piden.
+
+        with LectorColumnar("factoriales.col") as lector:
+            n, factorial = lector[500]
+            ns = lector.columna("n")
+
+    Args:
+        ruta: Ruta del archivo
+
+    Raises:
+        ValueError: Si el archivo no tiene formato columnar o su versión
+            es más nueva que la soportada
+    """
+
+    def __init__(self, ruta: str) -> None:
+        with open(ruta, "rb") as archivo:
+            if os.fstat(archivo.fileno()).st_size == 0:
+                raise ValueError("El archivo no tiene formato columnar")
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.version, self.columnas, posicion = _leer_cabecera(self._mapa)
+        except Exception:
+            self._mapa.close()
+            raise
+        self._indices = {nombre: i for i, (nombre, _) in enumerate(self.columnas)}
+        self._bloques: List[_Bloque] = []
+        self._inicios: List[int] = []
+        self._total = 0
+        self._indexar(posicion)
+
+    def _indexar(self, posicion: int) -> None:
+        """Recorre las cabeceras de los bloques; ignora un bloque final incompleto."""
+        for _, filas, columnas in _recorrer_bloques(self._mapa, posicion, len(self.columnas)):
+            self._bloques.append(_Bloque(self._total, filas, columnas))
+            self._inicios.append(self._total)
+            self._total += filas
+
+    def __len__(self) -> int:
+        return self._total
+
+    def _indice_columna(self, columna: Union[str, int]) -> int:
+        if isinstance(columna, int):
+            if not -len(self.columnas) <= columna < len(self.columnas):
+                raise IndexError("Índice de columna fuera de rango")
+            return columna % len(self.columnas)
+        try:
+            return self._indices[columna]
+        except KeyError:
+            raise ValueError(f"Columna desconocida: {columna}") from None
+
+    def _valor(self, bloque: _Bloque, j: int, c: int) -> Any:
+        """Valor de la fila j (dentro del bloque) en la columna c."""
+        tipo = self.columnas[c][1]
+        posicion, _ = bloque.columnas[c]
+        if tipo in _FIJOS:
+            estructura = _FIJOS[tipo][1]
+            return estructura.unpack_from(self._mapa, posicion + j * estructura.size)[0]
+        desde, hasta = _PAR_DESPLAZAMIENTOS.unpack_from(self._mapa, posicion + 8 * j)
+        datos = posicion + 8 * (bloque.filas + 1)
+        with memoryview(self._mapa) as vista:
+            return _VARIABLES[tipo][1](vista[datos + desde:datos + hasta])
+
+    def fila(self, i: int) -> Tuple[Any, ...]:
+        """
+        Devuelve la fila i sin leer las demás.
+
+        Args:
+            i: Índice de la fila (negativo cuenta desde el final)
+
+        Returns:
+            Tupla con un valor por columna
+
+        Raises:
+            IndexError: Si el índice está fuera de rango
+        """
+        if not -self._total <= i < self._total:
+            raise IndexError("Índice de fila fuera de rango")
+        i %= self._total
+        bloque = self._bloques[bisect_right(self._inicios, i) - 1]
+        j = i - bloque.inicio
+        return tuple(self._valor(bloque, j, c) for c in range(len(self.columnas)))
+
+    __getitem__ = fila
+
+    def _columna_bloque(self, bloque: _Bloque, c: int) -> Sequence[Any]:
+        """Todos los valores de una columna dentro de un bloque."""
+        tipo = self.columnas[c][1]
+        posicion, largo = bloque.columnas[c]
+        if tipo in _FIJOS:
+            valores = array(_FIJOS[tipo][0], self._mapa[posicion:posicion + largo])
+            if not _NATIVO_LITTLE:
+                valores.byteswap()
+            return [bool(v) for v in valores] if tipo == "bool" else valores
+
+        desplazamientos = array("Q", self._mapa[posicion:posicion + 8 * (bloque.filas + 1)])
+        if not _NATIVO_LITTLE:
+            desplazamientos.byteswap()
+        datos = self._mapa[posicion + 8 * (bloque.filas + 1):posicion + largo]
+        decodificar = _VARIABLES[tipo][1]
+        with memoryview(datos) as vista:
+            return [decodificar(vista[desde:hasta])
+                    for desde, hasta in zip(desplazamientos, desplazamientos[1:])]
+
+    def columna(self, columna: Union[str, int]) -> Union[array, List[Any]]:
+        """
+        Devuelve todos los valores de una columna.
+
+        Args:
+            columna: Nombre o índice de la columna
+
+        Returns:
+            array.array para 'int64' y 'float64', lista para los demás tipos
+        """
+        c = self._indice_columna(columna)
+        tipo = self.columnas[c][1]
+        resultado = array(_FIJOS[tipo][0]) if tipo in ("int64", "float64") else []
+        for bloque in self._bloques:
+            resultado.extend(self._columna_bloque(bloque, c))
+        return resultado
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        """Recorre las filas decodificando un bloque por vez."""
+        for bloque in self._bloques:
+            yield from zip(*(self._columna_bloque(bloque, c) for c in range(len(self.columnas))))
+
+    def cerrar(self) -> None:
+        """Libera el mapa del archivo."""
+        self._mapa.close()
+
+    def __enter__(self) -> "LectorColumnar":
+        return self
+
+    def __exit__(self, *excepcion: Any) -> None:
+        self.cerrar()
@@ -0,0 +1,253 @@
+"""
+Módulo de Validación de Correos
+===============================
+
+Este módulo contiene la validación masiva de direcciones de email. Usa el
+mismo patrón que `utilidades.validar_email`, compilado una sola vez, y un
+filtro previo barato que descarta sin expresión regular las direcciones
+sin arroba. El motivo de rechazo se calcula solo para las direcciones
+rechazadas, sin volver a evaluar el patrón.
+
+La entrada se procesa como flujo: nunca se carga la lista completa en
+memoria, también cuando se reparte entre varios procesos. Repartir solo
+se hace con entradas de al menos `MINIMO_PARALELO` direcciones y con más
+de una CPU; por debajo, serializar las direcciones cuesta más de lo que
+ahorran los procesos trabajadores.
+
+Funciones disponibles:
+- filtrar_emails(emails): Devuelve solo las direcciones válidas
+- validar_emails(emails): Valida un iterable de direcciones
+- validar_archivo_emails(ruta): Valida las direcciones de un archivo (una por línea)
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import os
+import re
+from collections import deque
+from itertools import chain, compress, islice, repeat
+from operator import is_, not_
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+# Patrón de email compartido con utilidades.validar_email
+PATRON_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Motivos de rechazo
+MOTIVO_VACIO = "vacio"
+MOTIVO_ARROBA = "arroba"
+MOTIVO_DOMINIO = "dominio"
+MOTIVO_FORMATO = "formato"
+
+# Direcciones por bloque al repartir entre procesos
+TAMANO_BLOQUE = 50_000
+
+# Direcciones por bloque al validar en el proceso actual
+_TAMANO_BLOQUE_LOCAL = 4096
+
+# Direcciones mínimas para repartir entre procesos
+MINIMO_PARALELO = 1_000_000
+
+
+def motivo_rechazo(email: str) -> Optional[str]:
+    """
+    Devuelve por qué una dirección no es válida, o None si es válida.
+
+    El resultado coincide con `utilidades.validar_email`: es None
+    exactamente cuando el patrón acepta la dirección.
+
+    Args:
+        email: La dirección de email a validar
+
+    Returns:
+        None si es válida, o uno de 'vacio', 'arroba', 'dominio', 'formato'
+    """
+    # Filtro previo: estos motivos no necesitan evaluar el patrón
+    motivo = _motivo_rechazada(email)
+    if motivo != MOTIVO_FORMATO or PATRON_EMAIL.match(email) is None:
+        return motivo
+    return None
+
+
+def _motivo_rechazada(email: str) -> str:
+    """
+    Motivo de rechazo sin evaluar el patrón.
+
+    Devuelve 'formato' para las direcciones que pasan el filtro previo; si
+    el patrón ya las rechazó, ese es su motivo.
+    """
+    if not email:
+        return MOTIVO_VACIO
+    if email.count("@") != 1:
+        return MOTIVO_ARROBA
+    if "." not in email[email.index("@"):]:
+        return MOTIVO_DOMINIO
+    return MOTIVO_FORMATO
+
+
+def _validar_bloque(bloque: List[str]) -> List[Optional[str]]:
+    """
+    Valida un bloque en un proceso trabajador.
+
+    Solo devuelve los motivos (None para las válidas) para no serializar
+    de vuelta las direcciones, que el proceso principal ya tiene.
+    """
+    return _motivos(bloque, _coincidencias(bloque))
+
+
+def _coincidencias(bloque: List[str]) -> List[bool]:
+    """Evalúa el patrón en un bloque, salvo en las direcciones sin arroba."""
+    coincide = PATRON_EMAIL.match
+    # Filtro previo: sin arroba no hace falta evaluar el patrón
+    return ["@" in email and coincide(email) is not None for email in bloque]
+
+
+def _motivos(bloque: List[str], validos: List[bool]) -> List[Optional[str]]:
+    """Motivos de un bloque ya evaluado; solo se calculan para las rechazadas."""
+    motivos = [None] * len(bloque)
+    for i in compress(range(len(bloque)), map(not_, validos)):
+        motivos[i] = _motivo_rechazada(bloque[i])
+    return motivos
+
+
+def _validar_flujo(emails: Iterable[str]) -> Iterator[Tuple[str, bool, Optional[str]]]:
+    """
+    Valida en el proceso actual por bloques.
+
+    Las tuplas se arman con `zip` y los motivos solo se calculan para las
+    rechazadas.
+    """
+    for bloque in _bloques(emails, _TAMANO_BLOQUE_LOCAL):
+        validos = _coincidencias(bloque)
+        yield from zip(bloque, validos, _motivos(bloque, validos))
+
+
+def _combinar(bloque: List[str], futuro) -> Iterator[Tuple[str, bool, Optional[str]]]:
+    """Une un bloque con los motivos calculados por su proceso trabajador."""
+    motivos = futuro.result()
+    return zip(bloque, map(is_, motivos, repeat(None)), motivos)
+
+
+def _bloques(emails: Iterable[str], tamano: int) -> Iterator[List[str]]:
+    """Agrupa el iterable en listas de hasta `tamano` elementos."""
+    iterador = iter(emails)
+    while True:
+        bloque = list(islice(iterador, tamano))
+        if not bloque:
+            return
+        yield bloque
+
+
+def _validar_argumentos(procesos: int, tamano_bloque: int) -> None:
+    """
+    Comprueba la cantidad de procesos y el tamaño de bloque.
+
+    Raises:
+        ValueError: Si `procesos` o `tamano_bloque` no son positivos
+    """
+    if procesos < 1 or tamano_bloque < 1:
+        raise ValueError("La cantidad de procesos y el tamaño de bloque deben ser positivos")
+
+
+def filtrar_emails(emails: Iterable[str]) -> Iterator[str]:
+    """
+    Devuelve perezosamente las direcciones válidas de un iterable.
+
+    Es el equivalente masivo de `[e for e in emails if validar_email(e)]`:
+    el patrón se aplica con `filter`, sin llamar a una función de Python
+    por dirección, y no se calculan motivos de rechazo.
+
+    Args:
+        emails: Iterable de direcciones
+
+    Returns:
+        Iterador de las direcciones válidas, en el orden de la entrada
+    """
+    return filter(PATRON_EMAIL.match, emails)
+
+
+def validar_emails(emails: Iterable[str], procesos: int = 1,
+                   tamano_bloque: int = TAMANO_BLOQUE) -> Iterator[Tuple[str, bool, Optional[str]]]:
+    """
+    Valida perezosamente un iterable de direcciones de email.
+
+    Los argumentos se validan al llamar a la función, no al empezar a
+    iterar el resultado.
+
+    Args:
+        emails: Iterable de direcciones (por ejemplo un generador o un archivo ya limpio)
+        procesos: Cantidad máxima de procesos; con 1 se valida en el proceso actual
+        tamano_bloque: Direcciones por bloque enviado a cada proceso
+
+    Repartir entre procesos solo conviene con entradas muy grandes: cada
+    dirección debe serializarse hacia el proceso trabajador. Con una sola
+    CPU o con menos de `MINIMO_PARALELO` direcciones se valida en el
+    proceso actual aunque se pidan varios procesos.
+
+    Returns:
+        Iterador de tuplas (email, es_valido, motivo) en el mismo orden que
+        la entrada; `motivo` es None para las direcciones válidas
+
+    Raises:
+        ValueError: Si `procesos` o `tamano_bloque` no son positivos
+    """
+    _validar_argumentos(procesos, tamano_bloque)
+    procesos = min(procesos, os.cpu_count() or 1)
+    if procesos == 1:
+        return _validar_flujo(emails)
+    return _validar_en_procesos(emails, procesos, tamano_bloque)
+
+
+def _validar_en_procesos(emails: Iterable[str], procesos: int,
+                         tamano_bloque: int) -> Iterator[Tuple[str, bool, Optional[str]]]:
+    """Reparte los bloques entre procesos trabajadores conservando el orden."""
+    iterador = iter(emails)
+    cabeza = list(islice(iterador, MINIMO_PARALELO))
+    if len(cabeza) < MINIMO_PARALELO:
+        yield from _validar_flujo(cabeza)
+        return
+    emails = chain(cabeza, iterador)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Ventana acotada de bloques en vuelo: la memoria no crece con la entrada
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        en_vuelo = deque()
+        for bloque in _bloques(emails, tamano_bloque):
+            en_vuelo.append((bloque, ejecutor.submit(_validar_bloque, bloque)))
+            if len(en_vuelo) >= 2 * procesos:
+                yield from _combinar(*en_vuelo.popleft())
+        while en_vuelo:
+            yield from _combinar(*en_vuelo.popleft())
+
+
+def validar_archivo_emails(ruta: str, procesos: int = 1, tamano_bloque: int = TAMANO_BLOQUE,
+                           codificacion: str = "utf-8") -> Iterator[Tuple[str, bool, Optional[str]]]:
+    """
+    Valida las direcciones de un archivo de texto, una por línea.
+
+    Se ignoran los espacios al inicio y al final de cada línea.
+
+    Args:
+        ruta: Ruta del archivo
+        procesos: Cantidad de procesos; con 1 se valida en el proceso actual
+        tamano_bloque: Direcciones por bloque enviado a cada proceso
+        codificacion: Codificación del archivo
+
+    Returns:
+        Iterador de tuplas (email, es_valido, motivo) en el orden del archivo
+
+    Raises:
+        ValueError: Si `procesos` o `tamano_bloque` no son positivos
+    """
+    _validar_argumentos(procesos, tamano_bloque)
+    return _validar_archivo(ruta, procesos, tamano_bloque, codificacion)
+
+
+def _validar_archivo(ruta: str, procesos: int, tamano_bloque: int,
+                     codificacion: str) -> Iterator[Tuple[str, bool, Optional[str]]]:
+    """Lee el archivo mientras se consume el resultado y lo cierra al terminar."""
+    with open(ruta, encoding=codificacion, errors="replace") as archivo:
+        yield from validar_emails((linea.strip() for linea in archivo), procesos, tamano_bloque)
@@ -0,0 +1,331 @@
+"""
+Módulo de Fuentes de Entrada
+============================
+
+Este módulo contiene las fuentes de donde leen `utilidades.obtener_numero`,
+`confirmar`, `obtener_opcion_menu` y las demás funciones interactivas.
+Por defecto se lee de la consola con `input`, como siempre; para
+ejecuciones automáticas se puede instalar una fuente que lee las
+respuestas de un archivo, de una tubería (stdin), de un iterable en
+memoria o de un guion de respuestas precargado, sin simular una terminal.
+
+Con una fuente no interactiva, las respuestas inválidas no imprimen un
+mensaje y vuelven a preguntar: se registran en el reporte de la fuente
+(o lanzan ValueError si así se configuró) y se lee la respuesta siguiente.
+
+Las fuentes también leen columnas de números por bloques: cada bloque de
+líneas se divide en tokens y se convierte de una sola vez a
+`array.array`, con los tokens inválidos reunidos en un reporte.
+
+Funciones disponibles:
+- configurar_entrada(fuente): Cambia la fuente de entrada
+- usar_fuente(fuente): Administrador de contexto que instala una fuente temporalmente
+- leer(mensaje): Lee una respuesta de la fuente actual
+- FuenteConsola: Lee de la consola con `input`
+- FuenteLineas(lineas): Lee de un archivo abierto, una tubería o un iterable
+- FuenteArchivo(ruta): Lee de un archivo de texto
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import abc
+import contextlib
+import sys
+from array import array
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+# Conversión de los números: 'float' e 'int' producen array.array, 'auto' una lista
+TIPOS_NUMERO = ("float", "int", "auto")
+
+# Líneas convertidas juntas al leer números por bloques
+LINEAS_POR_BLOQUE = 4096
+
+_MODOS_ERROR = ("omitir", "lanzar")
+
+
+def _convertir_auto(token: str) -> Union[int, float]:
+    """Convierte un token en int si es entero o en float si no lo es."""
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+_CONVERSORES = {"float": float, "int": int, "auto": _convertir_auto}
+
+
+class _Fuente(abc.ABC):
+    """Comportamiento común de las fuentes de entrada; cada fuente define `leer`."""
+
+    interactiva = False
+
+    def __init__(self, errores: str = "omitir") -> None:
+        if errores not in _MODOS_ERROR:
+            raise ValueError(f"Modo de errores no válido: {errores!r} (usa {_MODOS_ERROR})")
+        self.errores = errores
+        # Tuplas (número de respuesta, mensaje) de las respuestas inválidas
+        self.reporte: List[Tuple[int, str]] = []
+        self.leidas = 0
+
+    @abc.abstractmethod
+    def leer(self, mensaje: str = "") -> str:
+        """
+        Lee una respuesta.
+
+        Raises:
+            EOFError: Si no quedan respuestas
+        """
+
+    def registrar_error(self, mensaje: str) -> None:
+        """
+        Registra que la última respuesta leída no es válida.
+
+        Raises:
+            ValueError: Si la fuente se configuró con errores='lanzar'
+        """
+        if self.errores == "lanzar":
+            raise ValueError(f"{mensaje} (respuesta {self.leidas})")
+        self.reporte.append((self.leidas, mensaje))
+
+    def lineas(self) -> Iterator[str]:
+        """Recorre las respuestas restantes hasta agotar la fuente."""
+        while True:
+            try:
+                yield self.leer()
+            except EOFError:
+                return
+
+    def numeros(self, tipo: str = "float", lineas_por_bloque: int = LINEAS_POR_BLOQUE,
+                reporte: Optional[list] = None) -> Iterator[Sequence[Union[int, float]]]:
+        """
+        Lee los números restantes por bloques.
+
+        Cada línea puede tener varios números separados por espacios, comas
+        o punto y coma. Las líneas vacías y las que empiezan con '#' se
+        ignoran.
+
+        Args:
+            tipo: 'float', 'int' (ambos producen array.array) o 'auto'
+                (lista con int o float según cada token)
+            lineas_por_bloque: Líneas convertidas juntas
+            reporte: Lista donde se agregan tuplas (indice, mensaje) de los
+                tokens inválidos (por defecto el reporte de la fuente)
+
+        Yields:
+            Bloques de números
+
+        Raises:
+            ValueError: Si el tipo no es válido, o si la fuente se configuró
+                con errores='lanzar' y algún token no es un número
+        """
+        if tipo not in TIPOS_NUMERO:
+            raise ValueError(f"Tipo no válido: {tipo!r} (usa {TIPOS_NUMERO})")
+        reporte = self.reporte if reporte is None else reporte
+        lineas = self.lineas()
+        leidos = 0
+        while True:
+            bloque = list(islice(lineas, lineas_por_bloque))
+            if not bloque:
+                return
+            texto = " ".join(l for l in bloque if not l.lstrip().startswith("#"))
+            tokens = texto.replace(",", " ").replace(";", " ").split()
+            if tokens:
+                yield self._convertir(tokens, tipo, leidos, reporte)
+                leidos += len(tokens)
+
+    def _convertir(self, tokens: List[str], tipo: str, desplazamiento: int,
+                   reporte: list) -> Sequence[Union[int, float]]:
+        """Convierte los tokens de un bloque, primero de una sola vez y, si falla, uno por uno."""
+        conversor = _CONVERSORES[tipo]
+        codigo = "d" if tipo == "float" else "q"
+        try:
+            if tipo == "auto":
+                return [conversor(t) for t in tokens]
+            return array(codigo, map(conversor, tokens))
+        except (ValueError, OverflowError):
+            pass
+
+        valores = []
+        for indice, token in enumerate(tokens, desplazamiento):
+            try:
+                valor = conversor(token)
+                if tipo == "int" and not -2 ** 63 <= valor < 2 ** 63:
+                    raise OverflowError("El entero no cabe en 64 bits")
+                valores.append(valor)
+            except (ValueError, OverflowError) as e:
+                mensaje = f"Token no numérico: {token[:40]!r}" if isinstance(e, ValueError) else str(e)
+                if self.errores == "lanzar":
+                    raise ValueError(f"{mensaje} (elemento {indice})") from None
+                reporte.append((indice, mensaje))
+        return valores if tipo == "auto" else array(codigo, valores)
+
+
+class FuenteConsola(_Fuente):
+    """
+    Lee de la consola con `input`. Es la fuente por defecto.
+
+    Las respuestas inválidas se informan con `imprimir_mensaje` y se vuelve
+    a preguntar, como siempre.
+    """
+
+    interactiva = True
+
+    def leer(self, mensaje: str = "") -> str:
+        """Muestra el mensaje y lee una línea de la consola."""
+        respuesta = input(mensaje)
+        self.leidas += 1
+        return respuesta
+
+    def lineas(self) -> Iterator[str]:
+        """Lee líneas de la consola hasta una línea vacía o el fin de la entrada."""
+        while True:
+            try:
+                linea = self.leer()
+            except EOFError:
+                return
+            if not linea.strip():
+                return
+            yield linea
+
+
+class FuenteLineas(_Fuente):
+    """
+    Lee las respuestas de un iterable de líneas, una por pregunta.
+
+    Sirve para archivos abiertos, tuberías (`FuenteLineas(sys.stdin)`),
+    listas en memoria y guiones de respuestas:
+
+        with usar_fuente(FuenteLineas(["3", "4", "s"])):
+            a = obtener_numero("Primer número")
+
+    Args:
+        lineas: Iterable de líneas (archivo, sys.stdin, lista...)
+        eco: Si True, escribe cada pregunta y su respuesta en `destino`,
+            como se vería en una sesión interactiva
+        destino: Flujo donde escribir el eco (por defecto el sys.stdout vigente)
+        errores: 'omitir' registra las respuestas inválidas en `reporte` y
+            sigue con la próxima; 'lanzar' lanza ValueError en la primera
+    """
+
+    def __init__(self, lineas: Iterable[str], eco: bool = False, destino=None,
+                 errores: str = "omitir") -> None:
+        super().__init__(errores)
+        self._lineas = iter(lineas)
+        self.eco = eco
+        self.destino = destino
+
+    def leer(self, mensaje: str = "") -> str:
+        """
+        Devuelve la próxima línea, sin el salto de línea final.
+
+        Raises:
+            EOFError: Si no quedan líneas, como `input` al final de la entrada
+        """
+        try:
+            linea = next(self._lineas)
+        except StopIteration:
+            raise EOFError("No quedan respuestas en la fuente de entrada") from None
+        self.leidas += 1
+        linea = linea.rstrip("\r\n")
+        if self.eco:
+            print(f"{mensaje}{linea}", file=self.destino or sys.stdout)
+        return linea
+
+    def lineas(self) -> Iterator[str]:
+        """Recorre las líneas restantes directamente, sin pasar por `leer`."""
+        for linea in self._lineas:
+            self.leidas += 1
+            yield linea.rstrip("\r\n")
+
+
+class FuenteArchivo(FuenteLineas):
+    """
+    Lee las respuestas de un archivo de texto, una por línea.
+
+    Args:
+        ruta: Ruta del archivo ('-' para stdin)
+        encoding: Codificación del archivo
+        eco: Si True, escribe cada pregunta y su respuesta
+        errores: 'omitir' o 'lanzar', como en `FuenteLineas`
+    """
+
+    def __init__(self, ruta: str, encoding: str = "utf-8", eco: bool = False,
+                 errores: str = "omitir") -> None:
+        self._archivo = sys.stdin if ruta == "-" else open(ruta, encoding=encoding)
+        super().__init__(self._archivo, eco=eco, errores=errores)
+
+    def cerrar(self) -> None:
+        """Cierra el archivo (stdin no se cierra)."""
+        if self._archivo is not sys.stdin:
+            self._archivo.close()
+
+    def __enter__(self) -> "FuenteArchivo":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+
+Fuente = Union[FuenteConsola, FuenteLineas]
+
+# Fuente usada por las funciones interactivas de utilidades
+_fuente: Fuente = FuenteConsola()
+
+
+def obtener_fuente() -> Fuente:
+    """Devuelve la fuente de entrada actual."""
+    return _fuente
+
+
+def configurar_entrada(fuente: Optional[Fuente] = None) -> Fuente:
+    """
+    Cambia la fuente de entrada de las funciones interactivas.
+
+    Args:
+        fuente: Nueva fuente (None vuelve a la consola)
+
+    Returns:
+        La fuente anterior
+    """
+    global _fuente
+    anterior = _fuente
+    _fuente = fuente if fuente is not None else FuenteConsola()
+    return anterior
+
+
+@contextlib.contextmanager
+def usar_fuente(fuente: Fuente) -> Iterator[Fuente]:
+    """
+    Instala una fuente de entrada mientras dura el bloque `with`.
+
+    Args:
+        fuente: Fuente a usar
+
+    Yields:
+        La fuente instalada
+    """
+    anterior = configurar_entrada(fuente)
+    try:
+        yield fuente
+    finally:
+        configurar_entrada(anterior)
+
+
+def leer(mensaje: str = "") -> str:
+    """
+    Lee una respuesta de la fuente actual.
+
+    Args:
+        mensaje: Pregunta a mostrar (solo en las fuentes que la muestran)
+
+    Returns:
+        La respuesta, sin el salto de línea final
+
+    Raises:
+        EOFError: Si la fuente no tiene más respuestas
+    """
+    return _fuente.leer(mensaje)
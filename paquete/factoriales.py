@@ -0,0 +1,208 @@
+"""
+Módulo de Factoriales
+=====================
+
+Este módulo contiene el motor usado por `operaciones.factorial`. El cálculo
+completo usa `math.factorial`, que implementa en C una división binaria
+(binary splitting) de la parte impar del producto, y se complementa con
+una memoria de puntos de control: los factoriales grandes ya calculados se
+guardan para que llamadas repetidas o cercanas los reutilicen
+multiplicando solo el tramo que falta desde un punto de control menor.
+Dividir desde un punto mayor es más lento que `math.factorial`, así que
+en ese caso se calcula directamente.
+
+Funciones disponibles:
+- factorial(n): Calcula n! reutilizando puntos de control
+- factorial_mod(n, m): Calcula n! mod m sin construir el entero completo
+- producto_rango(a, b): Multiplica los enteros de [a, b) por división binaria
+- limpiar_puntos_control(): Vacía la memoria de puntos de control
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import bisect
+import math
+import threading
+from collections import OrderedDict
+from typing import Tuple
+
+from . import primos
+
+
+# Por debajo de este valor recalcular es más barato que consultar la memoria
+UMBRAL_PUNTO_CONTROL = 1000
+
+# Cantidad máxima de puntos de control guardados (se descarta el menos usado)
+MAX_PUNTOS_CONTROL = 16
+
+# Un punto de control se reutiliza si está a menos de n / FRACCION_CERCANIA
+FRACCION_CERCANIA = 4
+
+# Cantidad de factores que se multiplican antes de reducir en factorial_mod
+_BLOQUE_MODULAR = 64
+
+
+def producto_rango(a: int, b: int) -> int:
+    """
+    Multiplica los enteros de [a, b) dividiendo el rango en mitades.
+
+    Multiplicar números de tamaño parecido mantiene el costo de las
+    multiplicaciones de enteros grandes por debajo del producto secuencial.
+
+    Args:
+        a: Inicio del rango (incluido)
+        b: Fin del rango (excluido)
+
+    Returns:
+        El producto a * (a + 1) * ... * (b - 1), o 1 si el rango es vacío
+    """
+    if b - a <= 32:
+        return math.prod(range(a, b))
+    medio = (a + b) // 2
+    return producto_rango(a, medio) * producto_rango(medio, b)
+
+
+class _PuntosControl:
+    """Memoria LRU de factoriales grandes, segura entre hilos."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._valores = OrderedDict()
+        self._claves = []
+
+    def cercano(self, n: int) -> Tuple[int, int]:
+        """Devuelve el mayor punto de control (k, k!) con k <= n, o (0, 1)."""
+        with self._lock:
+            i = bisect.bisect_right(self._claves, n)
+            if not i:
+                return 0, 1
+            k = self._claves[i - 1]
+            self._valores.move_to_end(k)
+            return k, self._valores[k]
+
+    def guardar(self, n: int, valor: int) -> None:
+        """Guarda n! descartando el punto de control menos usado si hace falta."""
+        with self._lock:
+            if n in self._valores:
+                self._valores.move_to_end(n)
+                return
+            self._valores[n] = valor
+            bisect.insort(self._claves, n)
+            while len(self._valores) > MAX_PUNTOS_CONTROL:
+                viejo, _ = self._valores.popitem(last=False)
+                self._claves.remove(viejo)
+
+    def limpiar(self) -> None:
+        """Vacía la memoria."""
+        with self._lock:
+            self._valores.clear()
+            self._claves.clear()
+
+
+_puntos = _PuntosControl()
+
+
+def limpiar_puntos_control() -> None:
+    """
+    Vacía la memoria de puntos de control de factorial.
+
+    Returns:
+        None
+    """
+    _puntos.limpiar()
+
+
+def _factorial(n: int) -> int:
+    """Factorial de un entero no negativo sin validación de tipo."""
+    if n < UMBRAL_PUNTO_CONTROL:
+        return math.factorial(n)
+
+    k, valor = _puntos.cercano(n)
+    if k == n:
+        return valor
+
+    if k and (n - k) * FRACCION_CERCANIA < n:
+        resultado = valor * producto_rango(k + 1, n + 1)
+    else:
+        resultado = math.factorial(n)
+
+    _puntos.guardar(n, resultado)
+    return resultado
+
+
+def factorial(n: int) -> int:
+    """
+    Calcula el factorial de un número entero no negativo.
+
+    Los resultados con n >= UMBRAL_PUNTO_CONTROL se guardan como puntos de
+    control; una llamada posterior con un n algo mayor parte del punto más
+    próximo por debajo en lugar de recalcular desde 1.
+
+    Args:
+        n: Número entero no negativo
+
+    Returns:
+        El factorial del número
+
+    Raises:
+        TypeError: Si el argumento no es un entero
+        ValueError: Si el número es negativo
+    """
+    if not isinstance(n, int):
+        raise TypeError("El argumento debe ser un entero")
+
+    if n < 0:
+        raise ValueError("No se puede calcular el factorial de un número negativo")
+
+    return _factorial(n)
+
+
+def factorial_mod(n: int, m: int) -> int:
+    """
+    Calcula n! mod m sin construir el factorial completo.
+
+    Si n >= m el resultado es 0, porque m aparece como factor. Si m es
+    primo y n está en la mitad superior de [0, m), se usa el teorema de
+    Wilson ((m - 1)! ≡ -1 mod m) para multiplicar solo los m - 1 - n
+    factores restantes.
+
+    Args:
+        n: Número entero no negativo
+        m: Módulo entero positivo
+
+    Returns:
+        El resto de dividir n! entre m
+
+    Raises:
+        TypeError: Si los argumentos no son enteros
+        ValueError: Si n es negativo o m no es positivo
+    """
+    if not isinstance(n, int) or not isinstance(m, int):
+        raise TypeError("Los argumentos deben ser enteros")
+
+    if n < 0:
+        raise ValueError("No se puede calcular el factorial de un número negativo")
+
+    if m <= 0:
+        raise ValueError("El módulo debe ser positivo")
+
+    if m == 1 or n >= m:
+        return 0
+
+    if n > m // 2 and primos._es_primo(m):
+        # n! ≡ -1 / ((n + 1) * ... * (m - 1))  (mod m)
+        resto = _producto_mod(n + 1, m, m)
+        return (-pow(resto, -1, m)) % m
+
+    return _producto_mod(2, n + 1, m)
+
+
+def _producto_mod(a: int, b: int, m: int) -> int:
+    """Producto de los enteros de [a, b) módulo m, reduciendo por bloques."""
+    resultado = 1
+    for inicio in range(a, b, _BLOQUE_MODULAR):
+        bloque = math.prod(range(inicio, min(inicio + _BLOQUE_MODULAR, b)))
+        resultado = resultado * bloque % m
+    return resultado
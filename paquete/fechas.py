@@ -0,0 +1,241 @@
+"""
+Módulo de Fechas
+================
+
+Este módulo contiene un formateador de columnas de fechas. Acepta objetos
+`datetime` o marcas de tiempo numéricas (segundos desde la época Unix) y,
+a diferencia de `utilidades.formatear_fecha`, no imprime un mensaje por
+cada fila inválida: los errores se reúnen en un reporte.
+
+Para los formatos que terminan en `%H:%M:%S` (entre ellos el formato por
+defecto `%d/%m/%Y %H:%M:%S` e ISO-8601 `%Y-%m-%dT%H:%M:%S`) el prefijo
+con la fecha y la hora se genera con `strftime` una vez por hora y se
+reutiliza mientras las marcas sigan en la misma hora; los minutos y
+segundos salen de una tabla precalculada. La ventana de cada hora se
+acota al cambio de horario si el desfase UTC cambia dentro de ella (las
+zonas con cambios de media hora, como Australia/Lord_Howe). Los demás formatos usan
+`strftime` y reutilizan el resultado mientras las marcas consecutivas
+caigan en el mismo segundo.
+
+Funciones disponibles:
+- FormateadorFechas(formato, zona): Formateador de columnas de fechas
+- formatear_fechas(valores, formato): Formatea una columna de fechas
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import math
+import re
+from datetime import datetime, tzinfo
+from typing import Any, Iterable, List, Optional, Tuple, Union
+
+from .lotes import _validar_modo
+
+
+FORMATO_POR_DEFECTO = "%d/%m/%Y %H:%M:%S"
+FORMATO_ISO = "%Y-%m-%dT%H:%M:%S"
+
+# Cola común de los formatos con camino rápido
+_COLA = "%H:%M:%S"
+
+# Directivas que solo dependen de la fecha y la hora (válidas en el prefijo cacheado)
+_DIRECTIVAS_PREFIJO = frozenset("YmdHyjbBaAp%")
+
+_EPOCA = datetime(1970, 1, 1)
+
+# "MM:SS" para cada segundo dentro de una hora
+_MINUTOS_SEGUNDOS = tuple(f"{s // 60:02d}:{s % 60:02d}" for s in range(3600))
+
+
+def _prefijo_rapido(formato: str) -> Optional[str]:
+    """Formato del prefijo si `formato` admite el camino rápido, o None."""
+    if not formato.endswith(_COLA):
+        return None
+    prefijo = formato[:-len(_COLA)] + "%H:"
+    directivas = re.findall(r"%(.)", prefijo.replace("%%", ""))
+    if all(d in _DIRECTIVAS_PREFIJO for d in directivas):
+        return prefijo
+    return None
+
+
+class FormateadorFechas:
+    """
+    Formateador de columnas de fechas.
+
+        formateador = FormateadorFechas(FORMATO_ISO)
+        reporte = []
+        textos = formateador.formatear_lote(marcas, reporte=reporte)
+
+    Args:
+        formato: Formato de `strftime` (por defecto dd/mm/yyyy hh:mm:ss)
+        zona: Zona horaria para las marcas numéricas (None = hora local,
+            como `datetime.fromtimestamp`); los `datetime` se formatean con
+            su propia hora
+    """
+
+    def __init__(self, formato: str = FORMATO_POR_DEFECTO, zona: Optional[tzinfo] = None) -> None:
+        if not isinstance(formato, str):
+            raise TypeError("El formato debe ser un texto")
+        self.formato = formato
+        self.zona = zona
+        self._prefijo = _prefijo_rapido(formato)
+        # Caché del prefijo de las marcas numéricas:
+        # (inicio de la hora, desde, hasta, prefijo), válido para desde <= marca < hasta
+        self._hora_marca: Tuple[float, float, float, str] = (math.inf, math.inf, -math.inf, "")
+        # Caché del prefijo de los datetime: ((año, mes, día, hora), prefijo)
+        self._hora_fecha: Tuple[Any, str] = (None, "")
+        # Caché del último segundo en el camino general: (clave, texto)
+        self._ultimo: Tuple[Any, str] = (None, "")
+
+    def _desde_marca(self, marca: Union[int, float]) -> str:
+        """Formatea una marca de tiempo numérica."""
+        # datetime.fromtimestamp redondea a microsegundos antes de truncar el segundo
+        segundo = math.floor(round(marca, 6)) if isinstance(marca, float) else marca
+        if self._prefijo is not None:
+            inicio, desde, hasta, prefijo = self._hora_marca
+            if not desde <= segundo < hasta:
+                inicio, prefijo = self._nueva_ventana(segundo)
+            return prefijo + _MINUTOS_SEGUNDOS[segundo - inicio]
+
+        clave, texto = self._ultimo
+        if clave != segundo:
+            texto = datetime.fromtimestamp(marca, self.zona).strftime(self.formato)
+            self._ultimo = (segundo if "%f" not in self.formato else None, texto)
+        return texto
+
+    def _desfase(self, segundo: int) -> float:
+        """Diferencia en segundos entre la hora local de la marca y UTC."""
+        fecha = datetime.fromtimestamp(segundo, self.zona).replace(tzinfo=None)
+        return (fecha - _EPOCA).total_seconds() - segundo
+
+    def _limite(self, bajo: int, alto: int, desfase: float, primero: bool) -> int:
+        """Búsqueda binaria del primer (o último) segundo de [bajo, alto] con ese desfase."""
+        while bajo < alto:
+            if primero:
+                medio = (bajo + alto) // 2
+                if self._desfase(medio) == desfase:
+                    alto = medio
+                else:
+                    bajo = medio + 1
+            else:
+                medio = (bajo + alto + 1) // 2
+                if self._desfase(medio) == desfase:
+                    bajo = medio
+                else:
+                    alto = medio - 1
+        return bajo
+
+    def _nueva_ventana(self, segundo: int) -> Tuple[int, str]:
+        """Calcula y guarda la ventana de la hora local que contiene la marca."""
+        fecha = datetime.fromtimestamp(segundo, self.zona)
+        inicio = segundo - (fecha.minute * 60 + fecha.second)
+        desde, hasta = inicio, inicio + 3600
+        # La hora local solo avanza al ritmo de la marca mientras el desfase no cambie
+        desfase = self._desfase(segundo)
+        if self._desfase(desde) != desfase:
+            desde = self._limite(desde, segundo, desfase, primero=True)
+        if self._desfase(hasta - 1) != desfase:
+            hasta = self._limite(segundo, hasta - 1, desfase, primero=False) + 1
+        prefijo = fecha.strftime(self._prefijo)
+        self._hora_marca = (inicio, desde, hasta, prefijo)
+        return inicio, prefijo
+
+    def _desde_fecha(self, fecha: datetime) -> str:
+        """Formatea un datetime."""
+        if self._prefijo is not None:
+            hora = (fecha.year, fecha.month, fecha.day, fecha.hour)
+            clave, prefijo = self._hora_fecha
+            if clave != hora:
+                prefijo = fecha.strftime(self._prefijo)
+                self._hora_fecha = (hora, prefijo)
+            return prefijo + _MINUTOS_SEGUNDOS[fecha.minute * 60 + fecha.second]
+
+        clave, texto = self._ultimo
+        # Dos datetime con zona distinta pueden ser iguales y formatearse distinto
+        actual = (fecha, fecha.tzinfo)
+        if clave != actual:
+            texto = fecha.strftime(self.formato)
+            self._ultimo = (actual, texto)
+        return texto
+
+    def formatear(self, valor: Union[datetime, int, float]) -> str:
+        """
+        Formatea una fecha o una marca de tiempo.
+
+        Args:
+            valor: datetime o segundos desde la época Unix
+
+        Returns:
+            La fecha formateada
+
+        Raises:
+            TypeError: Si el valor no es un datetime ni un número
+            ValueError: Si la marca de tiempo está fuera de rango o es NaN
+        """
+        if isinstance(valor, datetime):
+            return self._desde_fecha(valor)
+        if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+            try:
+                return self._desde_marca(valor)
+            except (OverflowError, OSError, ValueError):
+                raise ValueError(f"Marca de tiempo fuera de rango: {valor!r}") from None
+        raise TypeError(f"No es una fecha ni una marca de tiempo: {valor!r}")
+
+    __call__ = formatear
+
+    def formatear_lote(self, valores: Iterable[Union[datetime, int, float]],
+                       errores: str = "mascara", reporte: Optional[list] = None) -> List[str]:
+        """
+        Formatea una columna de fechas o marcas de tiempo.
+
+        Args:
+            valores: Iterable de datetime o de segundos desde la época Unix
+            errores: 'mascara' deja `str(valor)` en los elementos inválidos,
+                como `utilidades.formatear_fecha`; 'lanzar' lanza la
+                excepción del primero
+            reporte: Lista opcional donde se agregan tuplas (indice, mensaje)
+
+        Returns:
+            Lista con cada fecha formateada
+
+        Raises:
+            ValueError: Si el modo de errores no es válido
+        """
+        _validar_modo(errores)
+        formatear = self.formatear
+        resultados = []
+        for indice, valor in enumerate(valores):
+            try:
+                resultados.append(formatear(valor))
+            except (TypeError, ValueError) as e:
+                if errores == "lanzar":
+                    raise type(e)(f"{e} (elemento {indice})") from None
+                if reporte is not None:
+                    reporte.append((indice, str(e)))
+                resultados.append(str(valor))
+        return resultados
+
+    def __repr__(self) -> str:
+        return f"FormateadorFechas({self.formato!r}, zona={self.zona!r})"
+
+
+def formatear_fechas(valores: Iterable[Union[datetime, int, float]],
+                     formato: str = FORMATO_POR_DEFECTO, zona: Optional[tzinfo] = None,
+                     errores: str = "mascara", reporte: Optional[list] = None) -> List[str]:
+    """
+    Formatea una columna de fechas o marcas de tiempo.
+
+    Args:
+        valores: Iterable de datetime o de segundos desde la época Unix
+        formato: Formato de `strftime` (por defecto dd/mm/yyyy hh:mm:ss)
+        zona: Zona horaria para las marcas numéricas (None = hora local)
+        errores: 'mascara' deja `str(valor)` en los elementos inválidos;
+            'lanzar' lanza la excepción del primero
+        reporte: Lista opcional donde se agregan tuplas (indice, mensaje)
+
+    Returns:
+        Lista con cada fecha formateada
+    """
+    return FormateadorFechas(formato, zona).formatear_lote(valores, errores, reporte)
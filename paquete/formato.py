@@ -0,0 +1,232 @@
+"""
+Módulo de Formato de Números
+============================
+
+Este módulo contiene un formateador de números que se configura una sola
+vez (decimales, separador de miles, separador decimal y ancho) y después
+formatea columnas completas. `utilidades.formatear_numero` arma el
+especificador de formato en cada llamada; aquí se arma al crear el
+formateador, y los separadores distintos de los de Python (por ejemplo el
+estilo español `1.234,56`) se aplican con una sola traducción sobre todo
+el texto generado en lugar de una por número. Los valores que no son
+números se convierten con `str` y no se traducen.
+
+Funciones disponibles:
+- FormateadorNumeros(decimales, separador_miles, separador_decimal, ancho):
+  Formateador compilado
+- formateador(decimales, separador_miles, separador_decimal): Formateador
+  compartido para una configuración
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import functools
+from array import array
+from typing import Any, Iterable, List, Optional
+
+
+# Estilos de separadores habituales: (separador de miles, separador decimal)
+ESTILOS = {
+    "en": (",", "."),
+    "es": (".", ","),
+    "fr": (" ", ","),
+    "ninguno": ("", "."),
+}
+
+# Alineaciones admitidas en modo de ancho fijo
+_ALINEACIONES = {"derecha": ">", "izquierda": "<", "centro": "^"}
+
+# Marca temporal que separa los números al unirlos antes de traducir los separadores
+_MARCA = "\x00"
+
+# Números formateados por cada llamada a `format` en las colecciones
+_TRAMO = 4096
+
+# Códigos de array.array cuyos elementos son enteros
+_TIPOS_ENTEROS = frozenset("bBhHiIlLqQ")
+
+
+class FormateadorNumeros:
+    """
+    Formateador de números con la configuración compilada.
+
+    Los enteros se formatean sin decimales y los float con `decimales`, igual
+    que `utilidades.formatear_numero`. Lo que no admite el formato decimal
+    se convierte con `str`, sin traducir sus separadores.
+
+        es = FormateadorNumeros(2, separador_miles=".", separador_decimal=",")
+        es(1234.5)                              # '1.234,50'
+        es.unir([1, 2.5, 1234567.891], ", ")    # '1, 2,50, 1.234.567,89'
+
+    Args:
+        decimales: Decimales de los números no enteros
+        separador_miles: Separador de miles (un carácter o '' para ninguno)
+        separador_decimal: Separador decimal (un carácter)
+        ancho: Ancho fijo de cada número, para salida tabular (None = sin relleno)
+        alinear: 'derecha', 'izquierda' o 'centro' en modo de ancho fijo
+        estilo: Nombre de un estilo de `ESTILOS` ('en', 'es', 'fr', 'ninguno'),
+            que reemplaza a los separadores indicados
+
+    Raises:
+        TypeError: Si decimales o ancho no son enteros
+        ValueError: Si algún parámetro no es válido
+    """
+
+    def __init__(self, decimales: int = 2, separador_miles: str = ",",
+                 separador_decimal: str = ".", ancho: Optional[int] = None,
+                 alinear: str = "derecha", estilo: Optional[str] = None) -> None:
+        if estilo is not None:
+            if estilo not in ESTILOS:
+                raise ValueError(f"Estilo no válido: {estilo!r} (usa {tuple(ESTILOS)})")
+            separador_miles, separador_decimal = ESTILOS[estilo]
+        if not isinstance(decimales, int):
+            raise TypeError("El número de decimales debe ser un entero")
+        if decimales < 0:
+            raise ValueError("El número de decimales no puede ser negativo")
+        if len(separador_miles) > 1 or len(separador_decimal) != 1:
+            raise ValueError("Los separadores deben tener un solo carácter")
+        if separador_miles == separador_decimal:
+            raise ValueError("Los separadores de miles y decimal deben ser distintos")
+        if ancho is not None and (not isinstance(ancho, int) or ancho < 1):
+            raise ValueError("El ancho debe ser un entero positivo")
+        if alinear not in _ALINEACIONES:
+            raise ValueError(f"Alineación no válida: {alinear!r} (usa {tuple(_ALINEACIONES)})")
+
+        self.decimales = decimales
+        self.separador_miles = separador_miles
+        self.separador_decimal = separador_decimal
+        self.ancho = ancho
+
+        relleno = f"{_ALINEACIONES[alinear]}{ancho}" if ancho else ""
+        agrupar = "," if separador_miles else ""
+        self._spec_entero = f"{relleno}{agrupar}"
+        self._spec_flotante = f"{relleno}{agrupar}.{decimales}f"
+        # El ancho también se aplica a los valores que se formatean con str
+        self._spec_texto = relleno
+
+        cambios = {}
+        if separador_miles not in ("", ","):
+            cambios[","] = separador_miles
+        if separador_decimal != ".":
+            cambios["."] = separador_decimal
+        self._traduccion = str.maketrans(cambios) if cambios else None
+
+    def formatear(self, numero: Any) -> str:
+        """
+        Formatea un número.
+
+        Args:
+            numero: Número a formatear
+
+        Returns:
+            El número formateado
+        """
+        try:
+            if isinstance(numero, int):
+                texto = format(numero, self._spec_entero)
+            else:
+                texto = format(numero, self._spec_flotante)
+        except (TypeError, ValueError):
+            # Solo se traducen los separadores que generó el formato numérico
+            return format(str(numero), self._spec_texto)
+        return texto.translate(self._traduccion) if self._traduccion else texto
+
+    __call__ = formatear
+
+    def _unir_homogeneo(self, numeros: Any, spec: str) -> str:
+        """Une números de un mismo tipo con una plantilla por tramo (una llamada a `format`)."""
+        campo = "{:" + spec + "}"
+        plantilla = _MARCA.join([campo] * _TRAMO)
+        partes = []
+        for inicio in range(0, len(numeros), _TRAMO):
+            tramo = numeros[inicio:inicio + _TRAMO]
+            if len(tramo) < _TRAMO:
+                plantilla = _MARCA.join([campo] * len(tramo))
+            partes.append(plantilla.format(*tramo))
+        return _MARCA.join(partes)
+
+    def _texto_homogeneo(self, numeros: Any) -> Optional[str]:
+        """
+        Formatea una colección de un solo tipo numérico, unida con la marca.
+
+        Devuelve el texto ya traducido, o None si la colección mezcla tipos
+        (o tiene valores que no son números) y hay que formatear uno por uno.
+        """
+        if isinstance(numeros, array):
+            spec = self._spec_entero if numeros.typecode in _TIPOS_ENTEROS else self._spec_flotante
+            texto = self._unir_homogeneo(numeros, spec)
+        else:
+            tipos = set(map(type, numeros))
+            if tipos == {float}:
+                texto = self._unir_homogeneo(numeros, self._spec_flotante)
+            elif tipos == {int}:
+                try:
+                    texto = self._unir_homogeneo(numeros, self._spec_entero)
+                except ValueError:
+                    return None  # enteros con más dígitos de los que Python convierte a texto
+            else:
+                return None
+        # Una sola traducción para todo el texto; la marca protege al separador
+        return texto.translate(self._traduccion) if self._traduccion else texto
+
+    def unir(self, numeros: Iterable[Any], separador: str = "\n") -> str:
+        """
+        Formatea una colección y la une en un solo texto.
+
+        Args:
+            numeros: Iterable, lista o array.array de números
+            separador: Texto entre números (por defecto un salto de línea)
+
+        Returns:
+            El texto con todos los números formateados
+        """
+        numeros = numeros if isinstance(numeros, (list, tuple, array)) else list(numeros)
+        texto = self._texto_homogeneo(numeros)
+        if texto is None:
+            return separador.join([self.formatear(x) for x in numeros])
+        return texto.replace(_MARCA, separador)
+
+    def formatear_lista(self, numeros: Iterable[Any]) -> List[str]:
+        """
+        Formatea una colección y devuelve una lista de textos.
+
+        Args:
+            numeros: Iterable, lista o array.array de números
+
+        Returns:
+            Lista con cada número formateado
+        """
+        numeros = numeros if isinstance(numeros, (list, tuple, array)) else list(numeros)
+        if not numeros:
+            return []
+        texto = self._texto_homogeneo(numeros)
+        if texto is None:
+            return [self.formatear(x) for x in numeros]
+        return texto.split(_MARCA)
+
+    def __repr__(self) -> str:
+        return (f"FormateadorNumeros(decimales={self.decimales}, "
+                f"separador_miles={self.separador_miles!r}, "
+                f"separador_decimal={self.separador_decimal!r}, ancho={self.ancho})")
+
+
+@functools.lru_cache(maxsize=64)
+def formateador(decimales: int = 2, separador_miles: str = ",",
+                separador_decimal: str = ".") -> FormateadorNumeros:
+    """
+    Devuelve un formateador compartido para una configuración.
+
+    Los formateadores no tienen estado mutable, así que se reutilizan
+    entre llamadas (por ejemplo desde `utilidades.formatear_numero`).
+
+    Args:
+        decimales: Decimales de los números no enteros
+        separador_miles: Separador de miles
+        separador_decimal: Separador decimal
+
+    Returns:
+        El formateador
+    """
+    return FormateadorNumeros(decimales, separador_miles, separador_decimal)
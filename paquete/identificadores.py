@@ -0,0 +1,252 @@
+"""
+Módulo de Identificadores
+=========================
+
+Este módulo contiene un generador de identificadores aleatorios que toma
+la aleatoriedad en bloque de un único `os.urandom` y la convierte al
+alfabeto elegido con `bytes.translate`, sin crear un UUID por ID.
+
+El buffer de aleatoriedad se descarta en el proceso hijo después de un
+`fork`, así que padre e hijo nunca entregan los mismos IDs.
+
+Los bytes que producirían sesgo (los que no caben un número entero de
+veces en 256 para el tamaño del alfabeto) se descartan, de modo que cada
+carácter es uniforme.
+
+Funciones disponibles:
+- generar_ids(n): Genera n identificadores de una vez
+- GeneradorIds: Generador configurable (longitud, alfabeto, modo ordenable,
+  control de colisiones)
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import math
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from typing import List, Optional
+
+
+ALFABETO_HEX = "0123456789abcdef"
+ALFABETO_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"  # Crockford, ordenado
+ALFABETO_BASE62 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+# Bits de la marca de tiempo en milisegundos del modo ordenable (hasta el año 10889)
+_BITS_TIEMPO = 48
+
+# Bytes aleatorios pedidos al sistema en cada recarga
+TAMANO_BUFFER = 64 * 1024
+
+# Reintentos por ID antes de declarar agotado el espacio en modo sin colisiones
+_MAX_REINTENTOS = 100
+
+# Generadores vivos, para descartar sus buffers en el hijo tras un fork
+_instancias = weakref.WeakSet()
+
+
+class GeneradorIds:
+    """
+    Generador de identificadores aleatorios con aleatoriedad en bloque.
+
+    Args:
+        longitud: Caracteres aleatorios de cada ID
+        alfabeto: Caracteres ASCII distintos (entre 2 y 256)
+        ordenable: Si True, cada ID empieza con la marca de tiempo en
+            milisegundos, así que el orden alfabético sigue al orden de
+            creación entre milisegundos distintos (requiere un alfabeto en
+            orden ASCII)
+        sin_colisiones: Si True, se garantiza que no se repite ningún ID
+            dentro de los últimos `ventana` generados
+        ventana: Tamaño del conjunto de IDs recordados en modo sin colisiones
+
+    Raises:
+        ValueError: Si la configuración no es válida
+    """
+
+    def __init__(self, longitud: int = 16, alfabeto: str = ALFABETO_BASE62,
+                 ordenable: bool = False, sin_colisiones: bool = False,
+                 ventana: int = 1_000_000) -> None:
+        if not isinstance(longitud, int) or longitud <= 0:
+            raise ValueError("La longitud debe ser un entero positivo")
+        if not 2 <= len(alfabeto) <= 256 or len(set(alfabeto)) != len(alfabeto):
+            raise ValueError("El alfabeto debe tener entre 2 y 256 caracteres distintos")
+        if not alfabeto.isascii():
+            raise ValueError("El alfabeto solo puede contener caracteres ASCII")
+        if ordenable and list(alfabeto) != sorted(alfabeto):
+            raise ValueError("El modo ordenable requiere un alfabeto en orden ASCII")
+        if sin_colisiones and ventana <= 0:
+            raise ValueError("La ventana debe ser positiva")
+
+        self.longitud = longitud
+        self.alfabeto = alfabeto
+        self.ordenable = ordenable
+        self.sin_colisiones = sin_colisiones
+        self.ventana = ventana
+
+        base = len(alfabeto)
+        utiles = 256 - 256 % base  # bytes que no introducen sesgo
+        self._tabla = bytes.maketrans(
+            bytes(range(utiles)), (alfabeto * (utiles // base)).encode("ascii"))
+        self._descartar = bytes(range(utiles, 256))
+        self._proporcion = 256 / utiles
+
+        self._ancho_tiempo = math.ceil(_BITS_TIEMPO / math.log2(base))
+        self._buffer = ""
+        self._posicion = 0
+        self._lock = threading.Lock()
+        self._vistos = set()
+        self._orden = deque()
+        _instancias.add(self)
+
+    def _descartar_buffer(self) -> None:
+        """Olvida la aleatoriedad pendiente (la copia heredada tras un fork)."""
+        self._buffer = ""
+        self._posicion = 0
+        # Otro hilo del padre pudo tener el lock tomado en el momento del fork
+        self._lock = threading.Lock()
+
+    def _aleatorio(self, cantidad: int) -> str:
+        """Devuelve `cantidad` caracteres aleatorios del alfabeto."""
+        inicio = self._posicion
+        if inicio + cantidad <= len(self._buffer):
+            self._posicion = inicio + cantidad
+            return self._buffer[inicio:inicio + cantidad]
+
+        partes = [self._buffer[inicio:]]
+        faltan = cantidad - (len(self._buffer) - inicio)
+        while True:
+            pedido = max(TAMANO_BUFFER, int(faltan * self._proporcion) + 64)
+            self._buffer = os.urandom(pedido).translate(self._tabla, self._descartar).decode("ascii")
+            tomar = min(len(self._buffer), faltan)
+            partes.append(self._buffer[:tomar])
+            self._posicion = tomar
+            faltan -= tomar
+            if not faltan:
+                return "".join(partes)
+
+    def _prefijo_tiempo(self) -> str:
+        """Codifica la hora actual en milisegundos con ancho fijo."""
+        valor = time.time_ns() // 1_000_000
+        base = len(self.alfabeto)
+        digitos = []
+        for _ in range(self._ancho_tiempo):
+            valor, resto = divmod(valor, base)
+            digitos.append(self.alfabeto[resto])
+        return "".join(reversed(digitos))
+
+    def _recordar(self, identificador: str) -> bool:
+        """Registra un ID en la ventana; devuelve False si ya estaba."""
+        if identificador in self._vistos:
+            return False
+        self._vistos.add(identificador)
+        self._orden.append(identificador)
+        if len(self._orden) > self.ventana:
+            self._vistos.discard(self._orden.popleft())
+        return True
+
+    def generar(self, n: int) -> List[str]:
+        """
+        Genera n identificadores.
+
+        Args:
+            n: Cantidad de identificadores
+
+        Returns:
+            Lista de n identificadores
+
+        Raises:
+            ValueError: Si n es negativo
+            RuntimeError: Si en modo sin colisiones el espacio de IDs está
+                prácticamente agotado dentro de la ventana
+        """
+        if not isinstance(n, int) or n < 0:
+            raise ValueError("La cantidad debe ser un entero no negativo")
+
+        largo = self.longitud
+        with self._lock:
+            datos = self._aleatorio(n * largo)
+            ids = [datos[i:i + largo] for i in range(0, n * largo, largo)]
+
+            if self.ordenable:
+                prefijo = self._prefijo_tiempo()
+                ids = [prefijo + i for i in ids]
+
+            if self.sin_colisiones:
+                for indice, identificador in enumerate(ids):
+                    intentos = 0
+                    while not self._recordar(identificador):
+                        intentos += 1
+                        if intentos > _MAX_REINTENTOS:
+                            raise RuntimeError(
+                                "No se pudo generar un ID sin colisión; "
+                                "aumenta la longitud o reduce la ventana")
+                        identificador = identificador[:len(identificador) - largo] + \
+                            self._aleatorio(largo)
+                    ids[indice] = identificador
+        return ids
+
+    def siguiente(self) -> str:
+        """Genera un único identificador."""
+        if self.ordenable or self.sin_colisiones:
+            return self.generar(1)[0]
+        with self._lock:
+            return self._aleatorio(self.longitud)
+
+
+def generar_ids(n: int, longitud: int = 16, alfabeto: str = ALFABETO_BASE62,
+                ordenable: bool = False, sin_colisiones: bool = False,
+                ventana: int = 1_000_000) -> List[str]:
+    """
+    Genera n identificadores aleatorios de una vez.
+
+    Para llamadas repetidas conviene crear un `GeneradorIds` y reutilizarlo,
+    así se aprovecha el buffer de aleatoriedad y la ventana de colisiones.
+
+    Args:
+        n: Cantidad de identificadores
+        longitud: Caracteres aleatorios de cada ID
+        alfabeto: Caracteres ASCII distintos (entre 2 y 256)
+        ordenable: Si True, cada ID empieza con la marca de tiempo
+        sin_colisiones: Si True, no se repiten IDs dentro del lote
+        ventana: Tamaño del conjunto de IDs recordados en modo sin colisiones;
+            se amplía a n si el lote es más grande
+
+    Returns:
+        Lista de n identificadores
+
+    Raises:
+        ValueError: Si la configuración no es válida
+    """
+    generador = GeneradorIds(longitud, alfabeto, ordenable, sin_colisiones, ventana)
+    if sin_colisiones and isinstance(n, int):
+        # La ventana debe abarcar todo el lote para que ningún ID se repita
+        generador.ventana = max(ventana, n)
+    return generador.generar(n)
+
+
+# Generadores hexadecimales compartidos por utilidades.generar_id, por longitud
+_generadores_hex = {}
+
+
+def _despues_de_fork() -> None:
+    """Descarta en el proceso hijo los buffers copiados del padre."""
+    for generador in list(_instancias):
+        generador._descartar_buffer()
+    _generadores_hex.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_despues_de_fork)
+
+
+def id_hex(longitud: int = 8) -> str:
+    """Genera un ID hexadecimal usando un buffer de aleatoriedad compartido."""
+    generador = _generadores_hex.get(longitud)
+    if generador is None:
+        generador = _generadores_hex.setdefault(longitud, GeneradorIds(longitud, ALFABETO_HEX))
+    return generador.siguiente()
@@ -0,0 +1,266 @@
+"""
+Módulo de Instrumentación
+=========================
+
+Este módulo contiene métricas opcionales para las funciones públicas de
+`operaciones`: cantidad de llamadas, cantidad de errores e histograma de
+latencias por función. Se exportan como diccionario o en el formato de
+texto de Prometheus.
+
+Mientras la instrumentación está apagada, las funciones de `operaciones`
+son los objetos originales, sin envoltura, así que no tiene costo. Se
+enciende con `activar_instrumentacion()` o con la variable de entorno
+`PAQUETE_INSTRUMENTACION` antes de importar el paquete ('1' para todas
+las funciones o una lista separada por comas, por ejemplo 'factorial,es_primo').
+
+La instrumentación es una capa de `capas`, así que convive con la caché
+en memoria y la caché en disco.
+
+Funciones disponibles:
+- activar_instrumentacion(nombres): Envuelve funciones de `operaciones`
+- desactivar_instrumentacion(nombres): Restaura las funciones originales
+- metricas_instrumentacion(formato): Métricas como diccionario o texto Prometheus
+- reiniciar_metricas(): Pone las métricas en cero
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import functools
+import inspect
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from . import capas, operaciones
+
+
+# Variable de entorno que activa la instrumentación al importar el paquete
+VARIABLE_ENTORNO = "PAQUETE_INSTRUMENTACION"
+
+# Límites superiores (en segundos) de las cubetas del histograma de latencias
+CUBETAS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3,
+           0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class _Metricas:
+    """Contadores e histograma de una función."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        """Pone todos los contadores en cero."""
+        with self._lock:
+            self.llamadas = 0
+            self.errores = 0
+            self.segundos = 0.0
+            # Una cubeta por límite más la de +Inf, sin acumular
+            self.cubetas = [0] * (len(CUBETAS) + 1)
+
+    def registrar(self, duracion: float, error: bool) -> None:
+        """Registra una llamada."""
+        with self._lock:
+            self.llamadas += 1
+            self.errores += error
+            self.segundos += duracion
+            self.cubetas[bisect_left(CUBETAS, duracion)] += 1
+
+    def a_dict(self) -> Dict[str, Any]:
+        """Copia las métricas con las cubetas acumuladas, como en Prometheus."""
+        with self._lock:
+            acumuladas = {}
+            total = 0
+            for limite, cantidad in zip(CUBETAS + (float("inf"),), self.cubetas):
+                total += cantidad
+                acumuladas[limite] = total
+            return {
+                "llamadas": self.llamadas,
+                "errores": self.errores,
+                "segundos": self.segundos,
+                "cubetas": acumuladas,
+            }
+
+
+def _instrumentar(funcion: Callable, metricas: _Metricas) -> Callable:
+    """Envuelve una función midiendo cada llamada."""
+    reloj = time.perf_counter
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        error = False
+        inicio = reloj()
+        try:
+            return funcion(*args, **kwargs)
+        except Exception:
+            error = True
+            raise
+        finally:
+            metricas.registrar(reloj() - inicio, error)
+
+    envoltura.metricas = metricas
+    return envoltura
+
+
+# Nombre de la capa de instrumentación en `capas`
+CAPA = "instrumentacion"
+
+# Funciones de `operaciones` instrumentadas: nombre -> métricas
+_activas: Dict[str, _Metricas] = {}
+_lock_activas = threading.Lock()
+
+
+def _funciones_publicas() -> List[str]:
+    """Nombres de las funciones públicas definidas en `operaciones`."""
+    return [nombre for nombre, objeto in vars(operaciones).items()
+            if inspect.isfunction(objeto) and not nombre.startswith("_")
+            and objeto.__module__ == operaciones.__name__]
+
+
+def activar_instrumentacion(nombres: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Envuelve funciones de `operaciones` con contadores e histograma.
+
+    Las funciones ya instrumentadas se dejan como están, conservando sus
+    métricas. Las capas activadas antes (por ejemplo `cache.activar_cache`)
+    quedan por dentro: se mide la versión memorizada.
+
+    Args:
+        nombres: Funciones a instrumentar, o None para todas las públicas
+
+    Returns:
+        Los nombres de las funciones instrumentadas
+
+    Raises:
+        ValueError: Si algún nombre no es una función de operaciones
+    """
+    with _lock_activas:
+        nombres = _funciones_publicas() if nombres is None else list(nombres)
+        for nombre in nombres:
+            actual = getattr(operaciones, nombre, None)
+            if not inspect.isfunction(actual) or nombre.startswith("_"):
+                raise ValueError(f"'{nombre}' no es una función de operaciones")
+
+        for nombre in nombres:
+            if nombre not in _activas:
+                metricas = _Metricas()
+                capas.envolver(nombre, CAPA,
+                               lambda funcion, metricas=metricas: _instrumentar(funcion, metricas))
+                _activas[nombre] = metricas
+        return sorted(_activas)
+
+
+def desactivar_instrumentacion(nombres: Optional[Iterable[str]] = None) -> None:
+    """
+    Quita la instrumentación de funciones de `operaciones` y descarta sus métricas.
+
+    Solo se quita la capa de instrumentación; las demás capas de la
+    función (por ejemplo una caché) se conservan.
+
+    Args:
+        nombres: Funciones a restaurar, o None para todas
+
+    Returns:
+        None
+    """
+    with _lock_activas:
+        nombres = list(_activas) if nombres is None else list(nombres)
+        for nombre in nombres:
+            if _activas.pop(nombre, None) is not None:
+                capas.quitar(nombre, CAPA)
+
+
+def instrumentacion_activa() -> List[str]:
+    """Devuelve los nombres de las funciones instrumentadas."""
+    with _lock_activas:
+        return sorted(_activas)
+
+
+def reiniciar_metricas() -> None:
+    """
+    Pone en cero las métricas de todas las funciones instrumentadas.
+
+    Returns:
+        None
+    """
+    with _lock_activas:
+        for metricas in _activas.values():
+            metricas.reiniciar()
+
+
+def _formatear_limite(limite: float) -> str:
+    """Formatea el límite de una cubeta como lo espera Prometheus."""
+    return "+Inf" if limite == float("inf") else repr(limite)
+
+
+def _a_prometheus(datos: Dict[str, Dict[str, Any]], prefijo: str) -> str:
+    """Convierte las métricas al formato de texto de Prometheus."""
+    lineas = [
+        f"# HELP {prefijo}_llamadas_total Llamadas a la función.",
+        f"# TYPE {prefijo}_llamadas_total counter",
+    ]
+    lineas += [f'{prefijo}_llamadas_total{{funcion="{n}"}} {m["llamadas"]}'
+               for n, m in datos.items()]
+    lineas += [
+        f"# HELP {prefijo}_errores_total Llamadas que terminaron con una excepción.",
+        f"# TYPE {prefijo}_errores_total counter",
+    ]
+    lineas += [f'{prefijo}_errores_total{{funcion="{n}"}} {m["errores"]}'
+               for n, m in datos.items()]
+    lineas += [
+        f"# HELP {prefijo}_duracion_segundos Duración de cada llamada.",
+        f"# TYPE {prefijo}_duracion_segundos histogram",
+    ]
+    for nombre, metricas in datos.items():
+        for limite, cantidad in metricas["cubetas"].items():
+            lineas.append(f'{prefijo}_duracion_segundos_bucket{{funcion="{nombre}",'
+                          f'le="{_formatear_limite(limite)}"}} {cantidad}')
+        lineas.append(f'{prefijo}_duracion_segundos_sum{{funcion="{nombre}"}} '
+                      f'{metricas["segundos"]!r}')
+        lineas.append(f'{prefijo}_duracion_segundos_count{{funcion="{nombre}"}} '
+                      f'{metricas["llamadas"]}')
+    return "\n".join(lineas) + "\n"
+
+
+def metricas_instrumentacion(formato: str = "dict",
+                             prefijo: str = "paquete") -> Union[Dict[str, Dict[str, Any]], str]:
+    """
+    Devuelve una instantánea de las métricas de las funciones instrumentadas.
+
+    Args:
+        formato: 'dict' o 'prometheus'
+        prefijo: Prefijo de los nombres de métrica en formato Prometheus
+
+    Returns:
+        Con 'dict', nombre -> {llamadas, errores, segundos, cubetas}, donde
+        `cubetas` asocia cada límite superior (en segundos, el último es
+        infinito) con la cantidad acumulada de llamadas que no lo superan.
+        Con 'prometheus', el texto listo para exponer.
+
+    Raises:
+        ValueError: Si el formato no es válido
+    """
+    if formato not in ("dict", "prometheus"):
+        raise ValueError(f"Formato no válido: {formato!r}")
+
+    with _lock_activas:
+        datos = {nombre: metricas.a_dict()
+                 for nombre, metricas in sorted(_activas.items())}
+    if formato == "prometheus":
+        return _a_prometheus(datos, prefijo)
+    return datos
+
+
+def _activar_desde_entorno() -> None:
+    """Activa la instrumentación según la variable de entorno."""
+    valor = os.environ.get(VARIABLE_ENTORNO, "").strip()
+    if not valor or valor.lower() in ("0", "no", "false"):
+        return
+    if valor.lower() in ("1", "si", "sí", "true", "todas"):
+        activar_instrumentacion()
+    else:
+        activar_instrumentacion(n.strip() for n in valor.split(",") if n.strip())
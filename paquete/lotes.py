@@ -0,0 +1,581 @@
+"""
+Módulo de Operaciones por Lotes
+===============================
+
+Este módulo contiene variantes vectorizadas de las operaciones aritméticas
+de `operaciones`. Cada función acepta escalares, secuencias, `array.array`
+o arreglos de NumPy (si está instalado), valida la entrada una sola vez y
+difunde un escalar contra una columna completa.
+
+Los errores que en las funciones escalares abortan la llamada (división
+por cero, base negativa con exponente no entero, total cero) se reportan
+por elemento: la posición afectada queda como NaN y, opcionalmente, se
+registra en una lista de reporte.
+
+Funciones disponibles:
+- suma_lote(a, b): Suma elemento a elemento
+- resta_lote(a, b): Resta elemento a elemento
+- multiplicacion_lote(a, b): Multiplica elemento a elemento
+- division_lote(a, b): Divide elemento a elemento
+- potencia_lote(base, exponente): Calcula potencias elemento a elemento
+- porcentaje_lote(valor, total): Calcula porcentajes elemento a elemento
+- porcentajes_columna(valores, decimales): Porcentajes del total de una columna, redondeados
+- redondear_columna(valores, decimales): Redondea una columna completa
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import math
+import operator
+from array import array
+from fractions import Fraction
+from itertools import repeat
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+
+NAN = float("nan")
+
+# Códigos de tipo de array.array que representan enteros
+_TIPOS_ENTEROS = frozenset("bBhHiIlLqQ")
+
+_MENSAJE_TIPO = "Los argumentos deben ser números"
+_MENSAJE_DIVISION = "No se puede dividir por cero"
+_MENSAJE_POTENCIA = "No se puede calcular la potencia de un número negativo con exponente no entero"
+_MENSAJE_PORCENTAJE = "El total no puede ser cero"
+_MENSAJE_CERO_NEGATIVO = "No se puede elevar cero a un exponente negativo"
+_MENSAJE_DESBORDE = "El resultado es demasiado grande"
+
+_MODOS_ERROR = ("mascara", "lanzar")
+
+# Modos de desempate al redondear: mitad al par (como round) o mitad lejos de cero
+MODOS_REDONDEO = ("par", "arriba")
+
+
+def _es_escalar(valor: Any) -> bool:
+    """Indica si el valor es un número escalar aceptado por `operaciones`."""
+    return isinstance(valor, (int, float))
+
+
+def _es_numpy(valor: Any) -> bool:
+    """Indica si el valor es un arreglo de NumPy."""
+    return np is not None and isinstance(valor, np.ndarray)
+
+
+def _validar_columna(columna: Any) -> Tuple[Any, bool]:
+    """
+    Valida una columna de números una sola vez.
+
+    Args:
+        columna: Secuencia, iterable o array.array de números
+
+    Returns:
+        Tupla (valores, es_entera) donde `valores` es indexable y
+        `es_entera` indica si la columna proviene de un array entero
+
+    Raises:
+        TypeError: Si algún elemento no es un número
+    """
+    if isinstance(columna, array):
+        # El código de tipo garantiza que todos los elementos son numéricos
+        if columna.typecode in ("u", "w"):
+            raise TypeError(_MENSAJE_TIPO)
+        return columna, columna.typecode in _TIPOS_ENTEROS
+
+    if isinstance(columna, (str, bytes)):
+        raise TypeError(_MENSAJE_TIPO)
+
+    try:
+        valores = columna if isinstance(columna, (list, tuple)) else list(columna)
+    except TypeError:
+        raise TypeError(_MENSAJE_TIPO) from None
+
+    if not all(isinstance(x, (int, float)) for x in valores):
+        raise TypeError(_MENSAJE_TIPO)
+
+    return valores, False
+
+
+def _preparar(a: Any, b: Any) -> Tuple[Any, Any, int, str, bool]:
+    """
+    Valida y alinea dos operandos para operar elemento a elemento.
+
+    Returns:
+        Tupla (xs, ys, n, salida, enteros) donde `xs` e `ys` son iterables
+        de la misma longitud `n`, `salida` es 'escalar', 'array' o 'lista'
+        según el contenedor de entrada y `enteros` indica si ambos operandos
+        provienen de arrays enteros.
+
+    Raises:
+        TypeError: Si algún operando no es numérico
+        ValueError: Si las dos columnas tienen distinta longitud
+    """
+    escalar_a = _es_escalar(a)
+    escalar_b = _es_escalar(b)
+
+    if escalar_a and escalar_b:
+        return (a,), (b,), 1, "escalar", False
+
+    salida = "array" if isinstance(a, array) or isinstance(b, array) else "lista"
+
+    if escalar_a:
+        ys, enteros = _validar_columna(b)
+        return repeat(a, len(ys)), ys, len(ys), salida, enteros and isinstance(a, int)
+
+    if escalar_b:
+        xs, enteros = _validar_columna(a)
+        return xs, repeat(b, len(xs)), len(xs), salida, enteros and isinstance(b, int)
+
+    xs, enteros_a = _validar_columna(a)
+    ys, enteros_b = _validar_columna(b)
+    if len(xs) != len(ys):
+        raise ValueError(
+            f"Las columnas deben tener la misma longitud ({len(xs)} != {len(ys)})"
+        )
+    return xs, ys, len(xs), salida, enteros_a and enteros_b
+
+
+def _empaquetar(resultados: List[Any], salida: str, enteros: bool) -> Any:
+    """Devuelve los resultados en el mismo tipo de contenedor que la entrada."""
+    if salida == "escalar":
+        return resultados[0]
+    if salida == "array":
+        if enteros:
+            try:
+                return array("q", resultados)
+            except (OverflowError, TypeError):
+                pass
+        return array("d", resultados)
+    return resultados
+
+
+def _validar_modo(errores: str) -> None:
+    """Verifica que el modo de manejo de errores sea válido."""
+    if errores not in _MODOS_ERROR:
+        raise ValueError(f"Modo de errores no válido: {errores!r} (usa {_MODOS_ERROR})")
+
+
+def _fallo(indice: int, mensaje: str, errores: str, reporte: Optional[list],
+           excepcion: type) -> float:
+    """Registra o lanza el error de un elemento y devuelve el valor de máscara."""
+    if errores == "lanzar":
+        raise excepcion(f"{mensaje} (elemento {indice})")
+    if reporte is not None:
+        reporte.append((indice, mensaje))
+    return NAN
+
+
+def _numpy_operandos(a: Any, b: Any) -> Tuple[Any, Any]:
+    """Convierte ambos operandos a arreglos de NumPy validando su tipo numérico."""
+    xa = np.asarray(a)
+    xb = np.asarray(b)
+    for x in (xa, xb):
+        if x.dtype.kind not in "biuf":
+            raise TypeError(_MENSAJE_TIPO)
+    return xa, xb
+
+
+def _numpy_mascara(resultado: Any, mascara: Any, mensaje: str, errores: str,
+                   reporte: Optional[list], excepcion: type) -> Any:
+    """Aplica la máscara de errores a un resultado de NumPy."""
+    if not mascara.any():
+        return resultado
+    indices = np.flatnonzero(mascara)
+    if errores == "lanzar":
+        raise excepcion(f"{mensaje} (elemento {int(indices[0])})")
+    if reporte is not None:
+        reporte.extend((int(i), mensaje) for i in indices)
+    resultado = np.array(resultado, dtype=float)
+    resultado[mascara] = NAN
+    return resultado
+
+
+def _aplicar_simple(operador: Callable[[Any, Any], Any], a: Any, b: Any) -> Any:
+    """Aplica una operación que no puede fallar por elemento."""
+    if _es_numpy(a) or _es_numpy(b):
+        xa, xb = _numpy_operandos(a, b)
+        return operador(xa, xb)
+
+    xs, ys, _, salida, enteros = _preparar(a, b)
+    return _empaquetar(list(map(operador, xs, ys)), salida, enteros)
+
+
+def suma_lote(a: Any, b: Any) -> Any:
+    """
+    Suma elemento a elemento dos columnas o una columna y un escalar.
+
+    Args:
+        a: Escalar, secuencia, array.array o arreglo de NumPy
+        b: Escalar, secuencia, array.array o arreglo de NumPy
+
+    Returns:
+        Las sumas en el mismo tipo de contenedor que la entrada
+
+    Raises:
+        TypeError: Si algún operando no es numérico
+        ValueError: Si las columnas tienen distinta longitud
+    """
+    return _aplicar_simple(operator.add, a, b)
+
+
+def resta_lote(a: Any, b: Any) -> Any:
+    """
+    Resta elemento a elemento dos columnas o una columna y un escalar.
+
+    Args:
+        a: Escalar, secuencia, array.array o arreglo de NumPy
+        b: Escalar, secuencia, array.array o arreglo de NumPy
+
+    Returns:
+        Las diferencias en el mismo tipo de contenedor que la entrada
+
+    Raises:
+        TypeError: Si algún operando no es numérico
+        ValueError: Si las columnas tienen distinta longitud
+    """
+    return _aplicar_simple(operator.sub, a, b)
+
+
+def multiplicacion_lote(a: Any, b: Any) -> Any:
+    """
+    Multiplica elemento a elemento dos columnas o una columna y un escalar.
+
+    Args:
+        a: Escalar, secuencia, array.array o arreglo de NumPy
+        b: Escalar, secuencia, array.array o arreglo de NumPy
+
+    Returns:
+        Los productos en el mismo tipo de contenedor que la entrada
+
+    Raises:
+        TypeError: Si algún operando no es numérico
+        ValueError: Si las columnas tienen distinta longitud
+    """
+    return _aplicar_simple(operator.mul, a, b)
+
+
+def division_lote(a: Any, b: Any, errores: str = "mascara",
+                  reporte: Optional[list] = None) -> Any:
+    """
+    Divide elemento a elemento dos columnas o una columna y un escalar.
+
+    Las divisiones por cero no abortan el lote: el elemento queda como NaN
+    y, si se pasa `reporte`, se agrega la tupla (indice, mensaje).
+
+    Args:
+        a: Numeradores (escalar, secuencia, array.array o arreglo de NumPy)
+        b: Denominadores (escalar, secuencia, array.array o arreglo de NumPy)
+        errores: 'mascara' para marcar con NaN o 'lanzar' para abortar
+        reporte: Lista opcional donde registrar los elementos fallidos
+
+    Returns:
+        Los cocientes en el mismo tipo de contenedor que la entrada
+
+    Raises:
+        TypeError: Si algún operando no es numérico
+        ValueError: Si las columnas tienen distinta longitud
+        ZeroDivisionError: Si `errores` es 'lanzar' y algún denominador es cero
+    """
+    _validar_modo(errores)
+
+    if _es_numpy(a) or _es_numpy(b):
+        xa, xb = _numpy_operandos(a, b)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            resultado = np.true_divide(xa, xb)
+        mascara = np.broadcast_to(xb == 0, resultado.shape)
+        return _numpy_mascara(resultado, mascara, _MENSAJE_DIVISION, errores,
+                              reporte, ZeroDivisionError)
+
+    xs, ys, _, salida, _ = _preparar(a, b)
+
+    divisores = (b,) if isinstance(ys, repeat) else ys
+    if 0 not in divisores:
+        # Camino rápido: ningún denominador es cero
+        return _empaquetar(list(map(operator.truediv, xs, ys)), salida, False)
+
+    resultados = []
+    for i, (x, y) in enumerate(zip(xs, ys)):
+        if y == 0:
+            resultados.append(_fallo(i, _MENSAJE_DIVISION, errores, reporte,
+                                     ZeroDivisionError))
+        else:
+            resultados.append(x / y)
+    return _empaquetar(resultados, salida, False)
+
+
+def potencia_lote(base: Any, exponente: Any, errores: str = "mascara",
+                  reporte: Optional[list] = None) -> Any:
+    """
+    Calcula potencias elemento a elemento.
+
+    Una base negativa con exponente no entero, cero con exponente negativo
+    o un resultado que no cabe en un float no abortan el lote: el elemento
+    queda como NaN y, si se pasa `reporte`, se agrega la tupla (indice,
+    mensaje). En arrays de punto flotante se considera entero cualquier
+    exponente con valor entero (por ejemplo 2.0).
+
+    Args:
+        base: Bases (escalar, secuencia, array.array o arreglo de NumPy)
+        exponente: Exponentes (escalar, secuencia, array.array o arreglo de NumPy)
+        errores: 'mascara' para marcar con NaN o 'lanzar' para abortar
+        reporte: Lista opcional donde registrar los elementos fallidos
+
+    Returns:
+        Las potencias en el mismo tipo de contenedor que la entrada
+
+    Raises:
+        TypeError: Si algún operando no es numérico
+        ValueError: Si las columnas tienen distinta longitud, o si `errores`
+            es 'lanzar' y alguna base negativa tiene exponente no entero
+        ZeroDivisionError: Si `errores` es 'lanzar' y se eleva cero a un
+            exponente negativo
+        OverflowError: Si `errores` es 'lanzar' y algún resultado no cabe
+            en un float
+    """
+    _validar_modo(errores)
+
+    if _es_numpy(base) or _es_numpy(exponente):
+        xa, xb = _numpy_operandos(base, exponente)
+        no_entero = xb != np.floor(xb) if xb.dtype.kind == "f" else np.zeros(xb.shape, bool)
+        mascara = np.broadcast_to((xa < 0) & no_entero, np.broadcast(xa, xb).shape)
+        # NumPy no admite potencias enteras negativas sobre enteros
+        flotante = mascara.any() or xb.dtype.kind == "f" or bool((xb < 0).any())
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            resultado = np.power(xa.astype(float) if flotante else xa, xb)
+        return _numpy_mascara(resultado, mascara, _MENSAJE_POTENCIA, errores,
+                              reporte, ValueError)
+
+    xs, ys, _, salida, enteros = _preparar(base, exponente)
+
+    if isinstance(exponente, array):
+        # Los arrays de punto flotante no distinguen 2 de 2.0; con
+        # exponentes infinitos o NaN Python ya da el resultado sin fallar
+        def es_entero(e):
+            return not math.isfinite(e) or e == math.floor(e)
+    else:
+        def es_entero(e):
+            return isinstance(e, int)
+
+    # En un array.array los enteros enormes no caben ni en 'q' ni en 'd'
+    limite_bits = 1024 if salida == "array" else None
+
+    resultados = []
+    for i, (x, e) in enumerate(zip(xs, ys)):
+        if x < 0 and not es_entero(e):
+            resultados.append(_fallo(i, _MENSAJE_POTENCIA, errores, reporte, ValueError))
+            continue
+        try:
+            valor = x ** e
+            if limite_bits and isinstance(valor, int) and valor.bit_length() > limite_bits:
+                float(valor)
+        except ZeroDivisionError:
+            valor = _fallo(i, _MENSAJE_CERO_NEGATIVO, errores, reporte, ZeroDivisionError)
+        except OverflowError:
+            valor = _fallo(i, _MENSAJE_DESBORDE, errores, reporte, OverflowError)
+        resultados.append(valor)
+    return _empaquetar(resultados, salida, enteros)
+
+
+def porcentaje_lote(valor: Any, total: Any, errores: str = "mascara",
+                    reporte: Optional[list] = None) -> Any:
+    """
+    Calcula elemento a elemento el porcentaje que representa cada valor.
+
+    Un total igual a cero no aborta el lote: el elemento queda como NaN y,
+    si se pasa `reporte`, se agrega la tupla (indice, mensaje).
+
+    Args:
+        valor: Valores (escalar, secuencia, array.array o arreglo de NumPy)
+        total: Totales (escalar, secuencia, array.array o arreglo de NumPy)
+        errores: 'mascara' para marcar con NaN o 'lanzar' para abortar
+        reporte: Lista opcional donde registrar los elementos fallidos
+
+    Returns:
+        Los porcentajes en el mismo tipo de contenedor que la entrada
+
+    Raises:
+        TypeError: Si algún operando no es numérico
+        ValueError: Si las columnas tienen distinta longitud, o si `errores`
+            es 'lanzar' y algún total es cero
+    """
+    _validar_modo(errores)
+
+    if _es_numpy(valor) or _es_numpy(total):
+        xa, xb = _numpy_operandos(valor, total)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            resultado = np.true_divide(xa, xb) * 100
+        mascara = np.broadcast_to(xb == 0, resultado.shape)
+        return _numpy_mascara(resultado, mascara, _MENSAJE_PORCENTAJE, errores,
+                              reporte, ValueError)
+
+    xs, ys, _, salida, _ = _preparar(valor, total)
+
+    resultados = []
+    for i, (x, t) in enumerate(zip(xs, ys)):
+        if t == 0:
+            resultados.append(_fallo(i, _MENSAJE_PORCENTAJE, errores, reporte, ValueError))
+        else:
+            resultados.append((x / t) * 100)
+    return _empaquetar(resultados, salida, False)
+
+
+def _validar_redondeo(decimales: int, modo: str) -> None:
+    """Valida los decimales y el modo de redondeo, con los mensajes de `redondear`."""
+    if not isinstance(decimales, int):
+        raise TypeError("El número de decimales debe ser un entero")
+    if decimales < 0:
+        raise ValueError("El número de decimales no puede ser negativo")
+    if modo not in MODOS_REDONDEO:
+        raise ValueError(f"Modo de redondeo no válido: {modo!r} (usa {MODOS_REDONDEO})")
+
+
+def _valores_columna(valores: Any) -> Any:
+    """Valida una columna para las funciones de columna completa."""
+    if _es_numpy(valores):
+        if valores.dtype.kind not in "biuf":
+            raise TypeError(_MENSAJE_TIPO)
+        return valores.ravel().tolist()
+    return _validar_columna(valores)[0]
+
+
+def _redondear_arriba(x: float, decimales: int) -> float:
+    """
+    Redondea con los empates lejos de cero.
+
+    Como `round`, decide sobre el valor binario exacto de x: solo es un
+    empate si x * 10^decimales termina exactamente en ,5.
+    """
+    if not math.isfinite(x):
+        return round(x, decimales)
+    escala = 10 ** decimales
+    try:
+        y = x * escala
+        posible_empate = abs(y - math.trunc(y)) == 0.5
+    except OverflowError:
+        # La escala o el producto no caben en un float: se decide con el valor exacto
+        posible_empate = True
+    if posible_empate:
+        exacto = Fraction(x) * escala
+        if exacto.denominator == 2:
+            # La división entre enteros redondea bien aunque no quepan en un float
+            return (math.trunc(exacto) + (1 if x > 0 else -1)) / escala
+    return round(x, decimales)
+
+
+def redondear_columna(valores: Any, decimales: int = 2, modo: str = "par") -> array:
+    """
+    Redondea todos los valores de una columna en una sola pasada.
+
+    Equivale a llamar `redondear(x, decimales)` para cada elemento, pero
+    valida la columna y los parámetros una sola vez.
+
+    Args:
+        valores: Secuencia, iterable, array.array o arreglo de NumPy
+        decimales: Número de decimales (por defecto 2)
+        modo: 'par' (empates al par, como `round`) o 'arriba' (empates
+            lejos de cero)
+
+    Returns:
+        array('d') con los valores redondeados
+
+    Raises:
+        TypeError: Si algún valor no es un número o decimales no es entero
+        ValueError: Si decimales es negativo o el modo no es válido
+    """
+    _validar_redondeo(decimales, modo)
+    xs = _valores_columna(valores)
+    if modo == "par":
+        return array("d", [round(x, decimales) for x in xs])
+    return array("d", [_redondear_arriba(x, decimales) for x in xs])
+
+
+def _mayor_resto(xs: Any, total: float, decimales: int, objetivo: Optional[float] = None) -> array:
+    """
+    Reparte un porcentaje entre los valores por el método del mayor resto.
+
+    Args:
+        objetivo: Porcentaje que deben sumar los resultados (por defecto
+            100); se redondea a `decimales` antes de repartir
+    """
+    escala = 10 ** decimales
+    factor = 100 * escala / total
+    exactos = [x * factor for x in xs]
+    if not all(map(math.isfinite, exactos)):
+        raise ValueError(_MENSAJE_DESBORDE)
+    unidades = [math.floor(e) for e in exactos]
+    meta = 100 * escala if objetivo is None else round(objetivo * escala)
+    faltante = meta - sum(unidades)
+    if faltante:
+        # Los de mayor resto reciben una unidad (o, si sobra por error de
+        # redondeo, la pierden los de menor resto)
+        orden = sorted(range(len(exactos)), key=lambda i: exactos[i] - unidades[i],
+                       reverse=faltante > 0)
+        paso = 1 if faltante > 0 else -1
+        for i in orden[:abs(faltante)]:
+            unidades[i] += paso
+    return array("d", [u / escala for u in unidades])
+
+
+def porcentajes_columna(valores: Any, decimales: Optional[int] = 2, modo: str = "par",
+                        mayor_resto: bool = False,
+                        total: Optional[Union[int, float]] = None) -> array:
+    """
+    Calcula el porcentaje del total que representa cada valor de una columna.
+
+    Reemplaza llamar `porcentaje(valor, total)` y luego `redondear(x, 2)`
+    por cada celda: el total se calcula una sola vez (con `math.fsum`) y
+    el redondeo se hace en la misma pasada.
+
+    Args:
+        valores: Secuencia, iterable, array.array o arreglo de NumPy
+        decimales: Decimales del resultado, o None para no redondear
+        modo: 'par' (empates al par, como `round`) o 'arriba' (empates
+            lejos de cero)
+        mayor_resto: Si True, reparte los redondeos por el método del mayor
+            resto para que los porcentajes sumen exactamente 100, o con
+            `total` el porcentaje redondeado que representa la suma de la
+            columna (requiere valores no negativos; `modo` no se usa)
+        total: Total contra el que calcular (por defecto la suma de la columna)
+
+    Returns:
+        array('d') con los porcentajes
+
+    Raises:
+        TypeError: Si algún valor no es un número o decimales no es entero
+        ValueError: Si el total es cero, los parámetros no son válidos, o
+            hay valores negativos o no finitos con `mayor_resto`
+    """
+    if decimales is not None:
+        _validar_redondeo(decimales, modo)
+    elif mayor_resto:
+        raise ValueError("El método del mayor resto necesita un número de decimales")
+    xs = _valores_columna(valores)
+
+    objetivo = None
+    if total is None:
+        total = math.fsum(xs)
+    elif not _es_escalar(total):
+        raise TypeError(_MENSAJE_TIPO)
+    elif mayor_resto and total != 0:
+        # Con un total propio la columna no tiene por qué sumar el 100 %
+        objetivo = math.fsum(xs) / total * 100
+    if total == 0:
+        raise ValueError(_MENSAJE_PORCENTAJE)
+
+    if mayor_resto:
+        if not all(map(math.isfinite, xs)):
+            raise ValueError("El método del mayor resto requiere valores finitos")
+        if any(x < 0 for x in xs):
+            raise ValueError("El método del mayor resto requiere valores no negativos")
+        return _mayor_resto(xs, total, decimales, objetivo)
+    if decimales is None:
+        return array("d", [(x / total) * 100 for x in xs])
+    if modo == "par":
+        return array("d", [round((x / total) * 100, decimales) for x in xs])
+    return array("d", [_redondear_arriba((x / total) * 100, decimales) for x in xs])
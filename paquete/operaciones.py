@@ -22,7 +22,10 @@ Versión: 1.0
 """
 
 import math
-from typing import Union, Optional
+import os
+from typing import Optional, Union
+
+from . import factoriales, primos
 
 
 def suma(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
@@ -113,6 +116,9 @@ def potencia(base: Union[int, float], exponente: Union[int, float]) -> Union[int
     """
     Calcula la potencia de un número.
     
+    Para reducir módulo un entero sin construir la potencia completa, usar
+    `teoria_numeros.potencia_mod`.
+    
     Args:
         base: Número base
         exponente: Exponente al cual elevar la base
@@ -137,6 +143,10 @@ def raiz_cuadrada(numero: Union[int, float]) -> float:
     """
     Calcula la raíz cuadrada de un número.
     
+    Los enteros mayores que 2^53 no se convierten a float antes de la raíz,
+    así que no pierden precisión ni desbordan por encima de ~1e308. Para la
+    raíz entera exacta usa `raices.raiz_cuadrada_exacta`.
+    
     Args:
         numero: Número del cual calcular la raíz cuadrada
         
@@ -153,6 +163,11 @@ def raiz_cuadrada(numero: Union[int, float]) -> float:
     if numero < 0:
         raise ValueError("No se puede calcular la raíz cuadrada de un número negativo")
     
+    if isinstance(numero, int) and numero.bit_length() > 53:
+        # Importación diferida: raices depende de lotes, que es costoso de importar
+        from . import raices
+        return raices._raiz_flotante(numero, 2)
+    
     return math.sqrt(numero)
 
 
@@ -176,14 +191,8 @@ def factorial(n: int) -> int:
     if n < 0:
         raise ValueError("No se puede calcular el factorial de un número negativo")
     
-    if n == 0 or n == 1:
-        return 1
-    
-    resultado = 1
-    for i in range(2, n + 1):
-        resultado *= i
-    
-    return resultado
+    # División binaria y puntos de control en el módulo factoriales
+    return factoriales._factorial(n)
 
 
 def porcentaje(valor: Union[int, float], total: Union[int, float]) -> float:
@@ -273,18 +282,16 @@ def es_primo(numero: int) -> bool:
     if not isinstance(numero, int):
         raise TypeError("El argumento debe ser un entero")
     
-    if numero < 2:
-        return False
-    
-    if numero == 2:
-        return True
-    
-    if numero % 2 == 0:
-        return False
-    
-    # Verificar divisores impares hasta la raíz cuadrada
-    for i in range(3, int(math.sqrt(numero)) + 1, 2):
-        if numero % i == 0:
-            return False
-    
-    return True
\ No newline at end of file
+    # La criba en caché y Miller-Rabin viven en el módulo primos
+    return primos._es_primo(numero)
+
+
+# Instrumentación opcional: solo se importa si se pidió por variable de entorno
+if os.environ.get("PAQUETE_INSTRUMENTACION"):
+    from . import instrumentacion
+    instrumentacion._activar_desde_entorno()
+
+# Caché en disco opcional: solo se importa si se indicó su ruta por variable de entorno
+if os.environ.get("PAQUETE_CACHE_DISCO"):
+    from . import cache_disco
+    cache_disco._activar_desde_entorno()
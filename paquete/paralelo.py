@@ -0,0 +1,187 @@
+"""
+Módulo de Ejecución en Paralelo
+===============================
+
+Este módulo contiene un `map` paralelo sobre las funciones de `operaciones`
+respaldado por un pool de procesos. El trabajo se reparte en bloques según
+un costo estimado por llamada, de modo que un factorial gigante viaja solo
+en su bloque y miles de verificaciones de primalidad baratas se agrupan en
+pocos bloques. El resultado conserva el orden de la entrada.
+
+Si el costo total estimado es pequeño, el cálculo se hace en el mismo
+proceso porque crear y alimentar el pool costaría más que el trabajo.
+
+Funciones disponibles:
+- mapa_paralelo(funcion, argumentos): Aplica una operación a muchos argumentos
+- estimar_costo(nombre, args): Estima el costo relativo de una llamada
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+from . import operaciones
+
+
+# Costo total estimado por debajo del cual no vale la pena usar procesos
+UMBRAL_PARALELO = 200_000
+
+# Bloques por proceso: más bloques equilibran mejor la carga
+BLOQUES_POR_PROCESO = 4
+
+
+def _bits(valor: Any) -> int:
+    """Cantidad de bits de un número (1 para valores no enteros)."""
+    if isinstance(valor, int):
+        return max(abs(valor).bit_length(), 1)
+    return 1
+
+
+def estimar_costo(nombre: str, args: Sequence[Any]) -> float:
+    """
+    Estima el costo relativo de llamar a `operaciones.<nombre>(*args)`.
+
+    Las estimaciones solo necesitan ser proporcionales entre sí; una
+    operación aritmética simple cuesta 1.
+
+    Args:
+        nombre: Nombre de la función en `operaciones`
+        args: Argumentos de la llamada
+
+    Returns:
+        El costo estimado (mayor o igual a 1)
+    """
+    try:
+        if nombre == "factorial":
+            n = args[0]
+            if isinstance(n, int) and n > 1000:
+                # Multiplicaciones de enteros de n*log2(n) bits
+                return (n * math.log2(n)) ** 1.2 / 100
+            return 1.0
+        if nombre == "es_primo":
+            bits = _bits(args[0])
+            return 1.0 if bits <= 22 else bits ** 3 / 1000
+        if nombre == "potencia":
+            base, exponente = args[0], args[1]
+            if isinstance(exponente, int) and exponente > 64:
+                return (_bits(base) * exponente) ** 1.2 / 100
+            return 1.0
+    except (IndexError, TypeError, ValueError, OverflowError):
+        pass
+    return 1.0
+
+
+def _normalizar(argumento: Any) -> tuple:
+    """Convierte un argumento suelto en una tupla de argumentos."""
+    return argumento if isinstance(argumento, tuple) else (argumento,)
+
+
+def _ejecutar_bloque(funcion: Union[str, Callable], bloque: List[tuple]) -> List[Any]:
+    """Ejecuta un bloque de llamadas dentro de un proceso trabajador."""
+    if isinstance(funcion, str):
+        funcion = getattr(operaciones, funcion)
+    return [funcion(*args) for args in bloque]
+
+
+def _repartir(costos: List[float], presupuesto: float) -> List[Tuple[int, int]]:
+    """
+    Agrupa índices consecutivos en bloques de costo cercano al presupuesto.
+
+    Returns:
+        Lista de rangos (inicio, fin) sobre la entrada
+    """
+    bloques = []
+    inicio = 0
+    acumulado = 0.0
+    for i, costo in enumerate(costos):
+        if costo >= presupuesto:
+            # Las llamadas caras viajan solas para no retrasar a las baratas
+            if i > inicio:
+                bloques.append((inicio, i))
+            bloques.append((i, i + 1))
+            inicio = i + 1
+            acumulado = 0.0
+            continue
+        acumulado += costo
+        if acumulado >= presupuesto:
+            bloques.append((inicio, i + 1))
+            inicio = i + 1
+            acumulado = 0.0
+    if inicio < len(costos):
+        bloques.append((inicio, len(costos)))
+    return bloques
+
+
+def mapa_paralelo(funcion: Union[str, Callable], argumentos: Iterable[Any],
+                  procesos: Optional[int] = None, ejecutor: Optional[Executor] = None,
+                  umbral: float = UMBRAL_PARALELO) -> List[Any]:
+    """
+    Aplica una operación a muchos argumentos usando varios procesos.
+
+    Args:
+        funcion: Nombre de una función de `operaciones` (por ejemplo
+            'factorial') o una función de nivel de módulo serializable
+        argumentos: Iterable de tuplas de argumentos, o de valores sueltos
+            para funciones de un solo argumento
+        procesos: Cantidad de procesos (por defecto os.cpu_count())
+        ejecutor: Pool existente a reutilizar en lugar de crear uno nuevo
+        umbral: Costo total estimado por debajo del cual se calcula en el
+            mismo proceso
+
+    Returns:
+        Lista de resultados en el mismo orden que `argumentos`
+
+    Raises:
+        ValueError: Si `funcion` no es una función de `operaciones`
+        Exception: La primera excepción lanzada por alguna llamada
+    """
+    if isinstance(funcion, str):
+        if funcion.startswith("_") or not callable(getattr(operaciones, funcion, None)):
+            raise ValueError(f"'{funcion}' no es una función de operaciones")
+        nombre = funcion
+    elif callable(funcion):
+        nombre = getattr(funcion, "__name__", "")
+    else:
+        raise TypeError("La función debe ser un nombre o un objeto invocable")
+
+    llamadas = [_normalizar(a) for a in argumentos]
+    if not llamadas:
+        return []
+
+    costos = [estimar_costo(nombre, args) for args in llamadas]
+    total = sum(costos)
+    procesos = procesos or os.cpu_count() or 1
+
+    if total < umbral or (procesos <= 1 and ejecutor is None) or len(llamadas) == 1:
+        return _ejecutar_bloque(funcion, llamadas)
+
+    presupuesto = max(total / (procesos * BLOQUES_POR_PROCESO), 1.0)
+    bloques = _repartir(costos, presupuesto)
+
+    propio = ejecutor is None
+    if propio:
+        ejecutor = ProcessPoolExecutor(max_workers=procesos)
+    futuros = {}
+    try:
+        # Enviar primero los bloques más caros para que no queden al final
+        orden = sorted(range(len(bloques)),
+                       key=lambda b: -sum(costos[bloques[b][0]:bloques[b][1]]))
+        futuros = {
+            b: ejecutor.submit(_ejecutar_bloque, funcion, llamadas[bloques[b][0]:bloques[b][1]])
+            for b in orden
+        }
+        resultados = []
+        for b in range(len(bloques)):
+            resultados.extend(futuros[b].result())
+        return resultados
+    finally:
+        # Si una llamada falló, no seguir calculando los bloques pendientes
+        for futuro in futuros.values():
+            futuro.cancel()
+        if propio:
+            ejecutor.shutdown()
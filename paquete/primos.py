@@ -0,0 +1,334 @@
+"""
+Módulo de Números Primos
+========================
+
+Este módulo contiene el motor de primalidad usado por `operaciones.es_primo`.
+Combina una criba de Eratóstenes en caché, que crece bajo demanda, para
+números pequeños con una prueba de Miller-Rabin determinista para enteros
+grandes.
+
+Para n < 3.317.044.064.679.887.385.961.981 la prueba de Miller-Rabin con
+los 13 primeros primos como bases es determinista. Por encima de ese
+límite se usa la prueba Baillie-PSW (Miller-Rabin en base 2 más una
+prueba fuerte de Lucas), para la que no se conocen contraejemplos.
+
+Funciones disponibles:
+- es_primo(numero): Verifica si un número es primo
+- es_primo_lote(numeros): Verifica la primalidad de muchos números
+- primos_en_rango(a, b): Genera los primos en [a, b) con una criba segmentada
+- limpiar_criba(): Libera la criba en caché
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import math
+import threading
+from typing import Iterable, Iterator, List
+
+
+# Límite superior de la criba en caché; por encima se usa Miller-Rabin
+LIMITE_CRIBA = 1 << 22
+
+# Tamaño inicial de la criba y de cada segmento de `primos_en_rango`
+_TAMANO_INICIAL = 1 << 16
+TAMANO_SEGMENTO = 1 << 18
+
+# Bases que hacen determinista a Miller-Rabin para n < _LIMITE_DETERMINISTA
+_BASES_MR = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_LIMITE_DETERMINISTA = 3317044064679887385961981
+
+# Primos pequeños para descartar divisores antes de Miller-Rabin
+_PRIMOS_PEQUENOS = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47,
+                    53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+
+def _cribar_impares(limite: int) -> bytearray:
+    """
+    Criba de Eratóstenes sobre los impares menores que `limite`.
+
+    El byte i representa al número 2*i + 1 y vale 1 si es primo.
+    """
+    tamano = (limite + 1) // 2
+    criba = bytearray(b"\x01") * tamano
+    criba[0] = 0  # el 1 no es primo
+    for i in range(1, (math.isqrt(limite - 1) + 1) // 2 + 1):
+        if criba[i]:
+            p = 2 * i + 1
+            inicio = p * p // 2
+            if inicio >= tamano:
+                break
+            criba[inicio::p] = bytes(len(range(inicio, tamano, p)))
+    return criba
+
+
+class _Criba:
+    """Criba en caché que crece por duplicación y es segura entre hilos."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._limite = 0
+        self._bits = bytearray()
+
+    def asegurar(self, n: int) -> bytearray:
+        """Garantiza que la criba cubra a `n` y devuelve sus bits."""
+        if n < self._limite:
+            return self._bits
+        with self._lock:
+            if n >= self._limite:
+                limite = max(self._limite, _TAMANO_INICIAL)
+                while limite <= n:
+                    limite *= 2
+                self._bits = _cribar_impares(min(limite, LIMITE_CRIBA + 2))
+                self._limite = 2 * len(self._bits)
+            return self._bits
+
+    def contiene(self, n: int) -> bool:
+        """Consulta la criba para un entero impar 1 <= n <= LIMITE_CRIBA."""
+        return bool(self.asegurar(n)[n >> 1])
+
+    def primos_hasta(self, limite: int) -> List[int]:
+        """Devuelve la lista de primos impares menores o iguales a `limite`."""
+        bits = self.asegurar(limite)
+        return [2 * i + 1 for i in range(1, (limite + 1) // 2) if bits[i]]
+
+    def limpiar(self) -> None:
+        """Libera la memoria ocupada por la criba."""
+        with self._lock:
+            self._limite = 0
+            self._bits = bytearray()
+
+
+_criba = _Criba()
+
+
+def limpiar_criba() -> None:
+    """
+    Libera la criba en caché.
+
+    Returns:
+        None
+    """
+    _criba.limpiar()
+
+
+def _miller_rabin(n: int, bases: Iterable[int]) -> bool:
+    """Prueba fuerte de Miller-Rabin de un impar n > 2 con las bases dadas."""
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    for a in bases:
+        a %= n
+        if a == 0:
+            continue
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _jacobi(a: int, n: int) -> int:
+    """Símbolo de Jacobi (a/n) para n impar positivo."""
+    a %= n
+    resultado = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                resultado = -resultado
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            resultado = -resultado
+        a %= n
+    return resultado if n == 1 else 0
+
+
+def _lucas_fuerte(n: int) -> bool:
+    """Prueba fuerte de Lucas con los parámetros de Selfridge (método A)."""
+    raiz = math.isqrt(n)
+    if raiz * raiz == n:
+        return False
+
+    d = 5
+    while True:
+        j = _jacobi(d, n)
+        if j == -1:
+            break
+        if j == 0 and abs(d) != n:
+            return False
+        d = -d - 2 if d > 0 else -d + 2
+    q = (1 - d) // 4
+
+    k = n + 1
+    s = (k & -k).bit_length() - 1
+    k >>= s
+
+    # Escalera binaria para U_k, V_k y Q^k módulo n
+    u, v, qk = 1, 1, q % n
+    inverso_2 = (n + 1) // 2
+    for bit in bin(k)[3:]:
+        u, v = u * v % n, (v * v - 2 * qk) % n
+        qk = qk * qk % n
+        if bit == "1":
+            u, v = (u + v) * inverso_2 % n, (d * u + v) * inverso_2 % n
+            qk = qk * q % n
+
+    if u == 0 or v == 0:
+        return True
+    for _ in range(s - 1):
+        v = (v * v - 2 * qk) % n
+        if v == 0:
+            return True
+        qk = qk * qk % n
+    return False
+
+
+def _es_primo_grande(n: int) -> bool:
+    """Primalidad de un entero n > LIMITE_CRIBA sin validación de tipo."""
+    for p in _PRIMOS_PEQUENOS:
+        if n % p == 0:
+            return n == p
+    if n < _LIMITE_DETERMINISTA:
+        return _miller_rabin(n, _BASES_MR)
+    return _miller_rabin(n, (2,)) and _lucas_fuerte(n)
+
+
+def _es_primo(n: int) -> bool:
+    """Primalidad de un entero sin validación de tipo."""
+    if n < 2:
+        return False
+    if n % 2 == 0:
+        return n == 2
+    if n <= LIMITE_CRIBA:
+        return _criba.contiene(n)
+    return _es_primo_grande(n)
+
+
+def es_primo(numero: int) -> bool:
+    """
+    Verifica si un número entero es primo.
+
+    Usa la criba en caché para números hasta `LIMITE_CRIBA` y Miller-Rabin
+    para números mayores.
+
+    Args:
+        numero: Número entero a verificar
+
+    Returns:
+        True si el número es primo, False en caso contrario
+
+    Raises:
+        TypeError: Si el argumento no es un entero
+    """
+    if not isinstance(numero, int):
+        raise TypeError("El argumento debe ser un entero")
+
+    return _es_primo(numero)
+
+
+def es_primo_lote(numeros: Iterable[int]) -> List[bool]:
+    """
+    Verifica la primalidad de muchos números con una sola validación.
+
+    La criba se hace crecer una sola vez hasta el mayor número pequeño
+    del lote antes de consultarla.
+
+    Args:
+        numeros: Iterable de números enteros
+
+    Returns:
+        Lista de booleanos en el mismo orden que la entrada
+
+    Raises:
+        TypeError: Si algún elemento no es un entero
+    """
+    valores = numeros if isinstance(numeros, (list, tuple)) else list(numeros)
+    if not all(isinstance(n, int) for n in valores):
+        raise TypeError("Todos los elementos deben ser enteros")
+
+    pequenos = [n for n in valores if n <= LIMITE_CRIBA]
+    bits = _criba.asegurar(max(pequenos)) if pequenos else None
+
+    resultados = []
+    for n in valores:
+        if n < 2:
+            resultados.append(False)
+        elif n % 2 == 0:
+            resultados.append(n == 2)
+        elif n <= LIMITE_CRIBA:
+            resultados.append(bool(bits[n >> 1]))
+        else:
+            resultados.append(_es_primo_grande(n))
+    return resultados
+
+
+def primos_en_rango(a: int, b: int, tamano_segmento: int = TAMANO_SEGMENTO) -> Iterator[int]:
+    """
+    Genera perezosamente los primos p con a <= p < b.
+
+    Usa una criba segmentada, por lo que la memoria queda acotada por
+    `tamano_segmento` y por los primos base hasta min(sqrt(b), LIMITE_CRIBA).
+    Si sqrt(b) supera ese límite, los candidatos que sobreviven a la criba
+    se confirman con Miller-Rabin.
+
+    Args:
+        a: Inicio del rango (incluido)
+        b: Fin del rango (excluido)
+        tamano_segmento: Cantidad de números cribados por segmento
+
+    Yields:
+        Los primos del rango en orden ascendente
+
+    Raises:
+        TypeError: Si los argumentos no son enteros
+        ValueError: Si el tamaño de segmento no es positivo
+    """
+    if not isinstance(a, int) or not isinstance(b, int) or not isinstance(tamano_segmento, int):
+        raise TypeError("Los argumentos deben ser enteros")
+
+    if tamano_segmento <= 0:
+        raise ValueError("El tamaño de segmento debe ser positivo")
+
+    a = max(a, 2)
+    if a >= b:
+        return
+
+    if a == 2:
+        yield 2
+        a = 3
+
+    raiz = math.isqrt(b - 1)
+    limite_base = min(raiz, LIMITE_CRIBA)
+    base = _criba.primos_hasta(limite_base)
+    confirmar = raiz > LIMITE_CRIBA
+
+    # Trabajar solo con impares: el segmento empieza en un impar
+    inicio = a | 1
+    mitad = max(tamano_segmento // 2, 1)
+    while inicio < b:
+        fin = min(inicio + 2 * mitad, b)
+        tamano = (fin - inicio + 1) // 2
+        segmento = bytearray(b"\x01") * tamano
+        for p in base:
+            cuadrado = p * p
+            if cuadrado >= fin:
+                break
+            primero = max(cuadrado, (inicio + p - 1) // p * p)
+            if primero % 2 == 0:
+                primero += p
+            indice = (primero - inicio) // 2
+            if indice < tamano:
+                segmento[indice::p] = bytes(len(range(indice, tamano, p)))
+        for i in range(tamano):
+            if segmento[i]:
+                n = inicio + 2 * i
+                if n > 1 and (not confirmar or n <= LIMITE_CRIBA or _es_primo_grande(n)):
+                    yield n
+        inicio += 2 * tamano
@@ -0,0 +1,214 @@
+"""
+Módulo de Progreso
+==================
+
+Este módulo contiene una barra de progreso pensada para bucles de millones
+de elementos. A diferencia de `utilidades.mostrar_progreso`, que dibuja la
+barra completa en cada llamada, `Progreso.tick()` solo suma y compara con
+un umbral; la barra se redibuja cuando cambia una celda visible o cuando
+pasó un tiempo mínimo, y el umbral se ajusta a la velocidad observada
+para consultar el reloj pocas veces.
+
+Si la salida no es una terminal, en lugar de redibujar con `\\r` se
+escribe una línea de registro a intervalos fijos.
+
+Funciones disponibles:
+- Progreso(total, mensaje): Barra de progreso con rendimiento y tiempo estimado
+- con_progreso(iterable): Recorre un iterable mostrando el progreso
+- formatear_barra(actual, total, mensaje): Texto de la barra
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import sys
+import time
+from typing import Any, Iterable, Iterator, Optional, TextIO
+
+
+ANCHO_BARRA = 30
+
+
+def formatear_barra(actual: int, total: int, mensaje: str = "Progreso",
+                    ancho: int = ANCHO_BARRA) -> str:
+    """
+    Construye el texto de una barra de progreso.
+
+    Args:
+        actual: Valor actual del progreso
+        total: Valor total del progreso (mayor que cero)
+        mensaje: Mensaje a mostrar junto con la barra
+        ancho: Cantidad de celdas de la barra
+
+    Returns:
+        El texto de la barra, por ejemplo 'Progreso: |███░░░| 50.0% (5/10)'
+    """
+    porcentaje = (actual / total) * 100
+    completado = min(int(ancho * actual // total), ancho)
+    barra = "█" * completado + "░" * (ancho - completado)
+    return f"{mensaje}: |{barra}| {porcentaje:.1f}% ({actual}/{total})"
+
+
+def _formatear_duracion(segundos: float) -> str:
+    """Formatea una duración como mm:ss o h:mm:ss."""
+    segundos = int(segundos)
+    horas, resto = divmod(segundos, 3600)
+    minutos, segundos = divmod(resto, 60)
+    if horas:
+        return f"{horas}:{minutos:02d}:{segundos:02d}"
+    return f"{minutos:02d}:{segundos:02d}"
+
+
+class Progreso:
+    """
+    Barra de progreso con redibujado limitado.
+
+    Se puede usar como administrador de contexto o para envolver un
+    iterable:
+
+        with Progreso(total=len(filas), mensaje="Procesando") as barra:
+            for fila in filas:
+                procesar(fila)
+                barra.tick()
+
+        for fila in con_progreso(filas, mensaje="Procesando"):
+            procesar(fila)
+
+    Args:
+        total: Cantidad total de elementos (None si se desconoce)
+        mensaje: Mensaje a mostrar junto con la barra
+        destino: Flujo de salida (por defecto el sys.stderr vigente)
+        intervalo_minimo: Segundos mínimos entre redibujados en una terminal
+        intervalo_registro: Segundos entre líneas cuando no hay terminal
+        ancho: Cantidad de celdas de la barra
+        tty: Forzar (True/False) el modo terminal en lugar de detectarlo
+    """
+
+    def __init__(self, total: Optional[int] = None, mensaje: str = "Progreso",
+                 destino: Optional[TextIO] = None, intervalo_minimo: float = 0.1,
+                 intervalo_registro: float = 10.0, ancho: int = ANCHO_BARRA,
+                 tty: Optional[bool] = None) -> None:
+        if total is not None and total < 0:
+            raise ValueError("El total no puede ser negativo")
+
+        self.total = total
+        self.mensaje = mensaje
+        self.destino = destino or sys.stderr
+        self.ancho = ancho
+        if tty is None:
+            esta_tty = getattr(self.destino, "isatty", None)
+            tty = bool(esta_tty and esta_tty())
+        self.tty = tty
+        self.intervalo = intervalo_minimo if tty else intervalo_registro
+
+        self.actual = 0
+        self._inicio = time.perf_counter()
+        self._ultimo_dibujo = self._inicio
+        self._ultima_celda = -1
+        self._paso = 1
+        self._siguiente = 1  # valor de `actual` en el que se vuelve a revisar
+        self._cerrado = False
+
+    def tick(self, n: int = 1) -> None:
+        """
+        Avanza el progreso en n elementos.
+
+        Solo suma y compara con un umbral; el trabajo de dibujar ocurre
+        pocas veces por segundo.
+        """
+        self.actual += n
+        if self.actual >= self._siguiente:
+            self._revisar()
+
+    def _celda(self) -> int:
+        """Celda de la barra correspondiente al valor actual."""
+        if not self.total:
+            return 0
+        return min(self.ancho * self.actual // self.total, self.ancho)
+
+    def _revisar(self) -> None:
+        """Decide si redibujar y recalcula el próximo umbral."""
+        ahora = time.perf_counter()
+        transcurrido = ahora - self._ultimo_dibujo
+        celda = self._celda()
+
+        if transcurrido >= self.intervalo or (self.tty and celda != self._ultima_celda):
+            self._dibujar(ahora)
+            self._ultima_celda = celda
+
+        # Ajustar el paso para revisar el reloj unas 4 veces por intervalo
+        velocidad = self.actual / max(ahora - self._inicio, 1e-9)
+        self._paso = max(1, int(velocidad * self.intervalo / 4))
+        siguiente = self.actual + self._paso
+        if self.tty and self.total:
+            # No saltarse el momento en que cambia la siguiente celda
+            proxima_celda = -(-(celda + 1) * self.total // self.ancho)
+            siguiente = min(siguiente, max(proxima_celda, self.actual + 1))
+        self._siguiente = siguiente
+
+    def _texto(self, ahora: float) -> str:
+        """Construye la línea con barra, rendimiento y tiempo estimado."""
+        transcurrido = max(ahora - self._inicio, 1e-9)
+        velocidad = self.actual / transcurrido
+        if self.total:
+            texto = formatear_barra(min(self.actual, self.total), self.total,
+                                    self.mensaje, self.ancho)
+            restante = (self.total - self.actual) / velocidad if velocidad else 0.0
+            return (f"{texto} {velocidad:,.1f} it/s "
+                    f"ETA {_formatear_duracion(max(restante, 0.0))}")
+        return (f"{self.mensaje}: {self.actual} {velocidad:,.1f} it/s "
+                f"{_formatear_duracion(transcurrido)}")
+
+    def _dibujar(self, ahora: float) -> None:
+        """Escribe el estado actual."""
+        self._ultimo_dibujo = ahora
+        if self.tty:
+            self.destino.write("\r" + self._texto(ahora))
+        else:
+            self.destino.write(self._texto(ahora) + "\n")
+        self.destino.flush()
+
+    def cerrar(self) -> None:
+        """Dibuja el estado final y termina la línea."""
+        if self._cerrado:
+            return
+        self._cerrado = True
+        self._dibujar(time.perf_counter())
+        if self.tty:
+            self.destino.write("\n")
+            self.destino.flush()
+
+    def iterar(self, iterable: Iterable[Any]) -> Iterator[Any]:
+        """Recorre un iterable avanzando el progreso en cada elemento."""
+        try:
+            for elemento in iterable:
+                yield elemento
+                self.tick()
+        finally:
+            self.cerrar()
+
+    def __enter__(self) -> "Progreso":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+
+def con_progreso(iterable: Iterable[Any], total: Optional[int] = None,
+                 mensaje: str = "Progreso", **opciones: Any) -> Iterator[Any]:
+    """
+    Recorre un iterable mostrando una barra de progreso.
+
+    Args:
+        iterable: Elementos a recorrer
+        total: Cantidad total (por defecto len(iterable) si está disponible)
+        mensaje: Mensaje a mostrar junto con la barra
+        **opciones: Opciones adicionales de `Progreso`
+
+    Yields:
+        Los elementos del iterable
+    """
+    if total is None and hasattr(iterable, "__len__"):
+        total = len(iterable)
+    return Progreso(total, mensaje, **opciones).iterar(iterable)
@@ -0,0 +1,252 @@
+"""
+Módulo de Raíces
+================
+
+Este módulo contiene raíces exactas y de tamaño arbitrario. La raíz
+cuadrada entera usa `math.isqrt` y la raíz n-ésima entera usa la iteración
+de Newton sobre enteros, así que ambas funcionan con enteros de cualquier
+tamaño e indican si la entrada es un cuadrado (o potencia n-ésima)
+perfecto.
+
+Para enteros grandes, la raíz en punto flotante se obtiene de la raíz
+entera con 64 bits extra de precisión en lugar de convertir primero la
+entrada a float, que pierde precisión por encima de 2^53 y desborda por
+encima de ~1e308.
+
+Funciones disponibles:
+- raiz_cuadrada_exacta(n): Raíz cuadrada entera e indicador de cuadrado perfecto
+- raiz_n(x, n): Raíz n-ésima en punto flotante
+- raiz_n_entera(x, n): Raíz n-ésima entera e indicador de potencia perfecta
+- raiz_cuadrada_lote(numeros): Raíces cuadradas de una secuencia
+- raiz_n_lote(numeros, n): Raíces n-ésimas de una secuencia
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import math
+from typing import Any, Iterable, List, Optional, Tuple, Union
+
+from .lotes import NAN, _validar_modo
+
+
+# Bits extra de precisión al convertir una raíz entera a float
+_BITS_PRECISION = 64
+
+# Tamaño a partir del cual un entero no se convierte a float antes de la raíz
+_BITS_FLOTANTE_EXACTO = 53
+
+
+def _validar_indice(n: int) -> None:
+    """Valida el índice de una raíz."""
+    if not isinstance(n, int) or isinstance(n, bool):
+        raise TypeError("El índice de la raíz debe ser un entero")
+    if n < 1:
+        raise ValueError("El índice de la raíz debe ser positivo")
+
+
+def _validar_radicando(x: Any, n: int) -> None:
+    """Valida el número del que se calcula la raíz."""
+    if not isinstance(x, (int, float)):
+        raise TypeError("El argumento debe ser un número")
+    if x < 0 and n % 2 == 0:
+        raise ValueError("No se puede calcular una raíz par de un número negativo")
+
+
+def _raiz_entera(x: int, n: int) -> int:
+    """Parte entera de la raíz n-ésima de un entero x >= 0 (Newton sobre enteros)."""
+    if x < 2 or n == 1:
+        return x
+    if n == 2:
+        return math.isqrt(x)
+
+    # Estimación inicial en punto flotante; un primer paso de Newton desde
+    # cualquier valor positivo da una cota superior de la parte entera
+    exponente = math.log(x) / n
+    if exponente < 700:
+        r = max(int(math.exp(exponente)), 1)
+    else:
+        r = 1 << int(exponente / math.log(2))  # dentro de un factor 2
+    r = ((n - 1) * r + x // r ** (n - 1)) // n
+    # Desde una cota superior, Newton decrece hasta la parte entera
+    while True:
+        y = ((n - 1) * r + x // r ** (n - 1)) // n
+        if y >= r:
+            return r
+        r = y
+
+
+def _raiz_flotante_entero(x: int, n: int) -> float:
+    """Raíz n-ésima de un entero x >= 0 como float, sin convertir x a float."""
+    desplazamiento = max(0, _BITS_PRECISION - x.bit_length() // n)
+    r = _raiz_entera(x << (n * desplazamiento), n)
+    try:
+        return math.ldexp(float(r), -desplazamiento) if desplazamiento else float(r)
+    except OverflowError:
+        raise OverflowError("El resultado es demasiado grande para un número decimal") from None
+
+
+def _raiz_flotante(x: Union[int, float], n: int) -> float:
+    """Raíz n-ésima sin validación; x negativo solo con n impar."""
+    if x < 0:
+        return -_raiz_flotante(-x, n)
+    if n == 1:
+        return float(x)
+    if isinstance(x, int) and x.bit_length() > _BITS_FLOTANTE_EXACTO:
+        return _raiz_flotante_entero(x, n)
+    if n == 2:
+        return math.sqrt(x)
+    if x == 0 or math.isinf(x):
+        return float(x)
+    r = x ** (1.0 / n)
+    # Un paso de Newton corrige el error de redondeo de la potencia
+    # fraccionaria (por ejemplo 27 ** (1/3) = 3.0000000000000004)
+    return r - (r ** n - x) / (n * r ** (n - 1))
+
+
+def raiz_cuadrada_exacta(n: int) -> Tuple[int, bool]:
+    """
+    Calcula la raíz cuadrada entera de un entero de cualquier tamaño.
+
+    Args:
+        n: Entero no negativo
+
+    Returns:
+        Tupla (raiz, es_cuadrado) donde `raiz` es la parte entera de la raíz
+        y `es_cuadrado` indica si n es un cuadrado perfecto
+
+    Raises:
+        TypeError: Si el argumento no es un entero
+        ValueError: Si el número es negativo
+    """
+    if not isinstance(n, int):
+        raise TypeError("El argumento debe ser un entero")
+    if n < 0:
+        raise ValueError("No se puede calcular la raíz cuadrada de un número negativo")
+
+    raiz = math.isqrt(n)
+    return raiz, raiz * raiz == n
+
+
+def raiz_n_entera(x: int, n: int) -> Tuple[int, bool]:
+    """
+    Calcula la raíz n-ésima entera de un entero de cualquier tamaño.
+
+    Para x negativo (solo con n impar) la raíz se trunca hacia cero.
+
+    Args:
+        x: Entero
+        n: Índice de la raíz (entero positivo)
+
+    Returns:
+        Tupla (raiz, es_exacta) donde `es_exacta` indica si raiz^n == x
+
+    Raises:
+        TypeError: Si x o n no son enteros
+        ValueError: Si n no es positivo, o si x es negativo y n es par
+    """
+    if not isinstance(x, int):
+        raise TypeError("El argumento debe ser un entero")
+    _validar_indice(n)
+    _validar_radicando(x, n)
+
+    raiz = _raiz_entera(abs(x), n)
+    if x < 0:
+        raiz = -raiz
+    return raiz, raiz ** n == x
+
+
+def raiz_n(x: Union[int, float], n: int) -> float:
+    """
+    Calcula la raíz n-ésima de un número.
+
+    Los enteros grandes se resuelven con la raíz entera, sin pasar la
+    entrada por float. Un número negativo tiene raíz real si n es impar.
+
+    Args:
+        x: Número del cual calcular la raíz
+        n: Índice de la raíz (entero positivo)
+
+    Returns:
+        La raíz n-ésima
+
+    Raises:
+        TypeError: Si x no es un número o n no es un entero
+        ValueError: Si n no es positivo, o si x es negativo y n es par
+        OverflowError: Si el resultado no cabe en un float
+    """
+    _validar_indice(n)
+    _validar_radicando(x, n)
+    return _raiz_flotante(x, n)
+
+
+def _raices_lote(numeros: Iterable[Any], n: int, exacta: bool, errores: str,
+                 reporte: Optional[list]) -> List[Any]:
+    """Aplica la raíz n-ésima a cada elemento reportando los errores por posición."""
+    _validar_modo(errores)
+    resultados = []
+    for indice, x in enumerate(numeros):
+        try:
+            if exacta:
+                if not isinstance(x, int):
+                    raise TypeError("El argumento debe ser un entero")
+                _validar_radicando(x, n)
+                raiz = _raiz_entera(abs(x), n)
+                raiz = -raiz if x < 0 else raiz
+                resultados.append((raiz, raiz ** n == x))
+            else:
+                _validar_radicando(x, n)
+                resultados.append(_raiz_flotante(x, n))
+        except (TypeError, ValueError, OverflowError) as e:
+            if errores == "lanzar":
+                raise type(e)(f"{e} (elemento {indice})") from None
+            if reporte is not None:
+                reporte.append((indice, str(e)))
+            resultados.append(None if exacta else NAN)
+    return resultados
+
+
+def raiz_cuadrada_lote(numeros: Iterable[Any], exacta: bool = False, errores: str = "mascara",
+                       reporte: Optional[list] = None) -> List[Any]:
+    """
+    Calcula la raíz cuadrada de cada número de una secuencia.
+
+    Args:
+        numeros: Iterable de números
+        exacta: Si True, devuelve tuplas (raiz, es_cuadrado) de enteros
+        errores: 'mascara' deja NaN (o None en modo exacto) en los
+            elementos inválidos; 'lanzar' lanza la excepción del primero
+        reporte: Lista opcional donde se agregan tuplas (indice, mensaje)
+
+    Returns:
+        Lista de raíces (float) o de tuplas (raiz, es_cuadrado)
+
+    Raises:
+        ValueError: Si el modo de errores no es válido
+    """
+    return _raices_lote(numeros, 2, exacta, errores, reporte)
+
+
+def raiz_n_lote(numeros: Iterable[Any], n: int, entera: bool = False, errores: str = "mascara",
+                reporte: Optional[list] = None) -> List[Any]:
+    """
+    Calcula la raíz n-ésima de cada número de una secuencia.
+
+    Args:
+        numeros: Iterable de números
+        n: Índice de la raíz (entero positivo)
+        entera: Si True, devuelve tuplas (raiz, es_exacta) de enteros
+        errores: 'mascara' deja NaN (o None en modo entero) en los
+            elementos inválidos; 'lanzar' lanza la excepción del primero
+        reporte: Lista opcional donde se agregan tuplas (indice, mensaje)
+
+    Returns:
+        Lista de raíces (float) o de tuplas (raiz, es_exacta)
+
+    Raises:
+        TypeError: Si n no es un entero
+        ValueError: Si n no es positivo o el modo de errores no es válido
+    """
+    _validar_indice(n)
+    return _raices_lote(numeros, n, entera, errores, reporte)
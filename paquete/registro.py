@@ -0,0 +1,293 @@
+"""
+Módulo de Registro de Operaciones
+=================================
+
+Este módulo contiene el registro central de operaciones. Cada operación
+guarda su nombre, su aridad (calculada una sola vez a partir de la firma),
+los tipos de sus argumentos y un validador precompilado, de modo que
+despachar una operación por nombre es una sola consulta a un diccionario.
+
+El menú y el modo por lotes de `main.py` y el servidor de cálculo se
+generan a partir de este registro. Otros módulos pueden agregar
+operaciones sin modificar `main.py`:
+
+    from paquete.registro import NUMERO, registrar_operacion
+
+    @registrar_operacion("hipotenusa", tipos=(NUMERO, NUMERO),
+                         etiqueta="Calcular la hipotenusa")
+    def hipotenusa(a, b):
+        return math.hypot(a, b)
+
+Funciones disponibles:
+- registrar_operacion(nombre, funcion): Agrega una operación al registro
+- obtener_operacion(nombre): Busca una operación por nombre
+- operaciones_registradas(): Lista las operaciones en orden de registro
+- eliminar_operacion(nombre): Quita una operación del registro
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import inspect
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from . import operaciones, raices, teoria_numeros
+
+
+# Tipo de los argumentos numéricos (enteros o decimales)
+NUMERO = (int, float)
+
+# Nombre legible de cada tipo, para los mensajes de error
+_NOMBRES_TIPO = {NUMERO: "un número", int: "un entero", float: "un número decimal"}
+
+# Tipo de un validador adicional: recibe los argumentos y lanza una excepción
+Validador = Callable[..., None]
+
+
+def _construir_validador(nombre: str, minimo: int, maximo: int,
+                         tipos: Tuple[Any, ...], extra: Optional[Validador]) -> Callable[[Sequence[Any]], None]:
+    """Compila la validación de aridad, tipos y reglas propias de una operación."""
+    if minimo == maximo:
+        esperado = f"{minimo} argumento{'s' if minimo != 1 else ''}"
+    else:
+        esperado = f"entre {minimo} y {maximo} argumentos"
+    mensajes = [f"El argumento {i} de {nombre} debe ser {_NOMBRES_TIPO.get(t, getattr(t, '__name__', t))}"
+                for i, t in enumerate(tipos, 1)]
+
+    def validar(argumentos: Sequence[Any]) -> None:
+        cantidad = len(argumentos)
+        if cantidad < minimo or cantidad > maximo:
+            raise ValueError(f"{nombre} espera {esperado}, se recibieron {cantidad}")
+        for valor, tipo, mensaje in zip(argumentos, tipos, mensajes):
+            if not isinstance(valor, tipo):
+                raise TypeError(mensaje)
+        if extra is not None:
+            extra(*argumentos)
+
+    return validar
+
+
+class Operacion:
+    """
+    Operación registrada.
+
+    Args:
+        nombre: Nombre con que se despacha (por ejemplo 'suma')
+        funcion: Función a llamar, o el nombre de una función de `operaciones`;
+            en ese caso se busca en cada llamada, así respeta las envolturas
+            de `cache` e `instrumentacion`
+        tipos: Tipo (o tupla de tipos) esperado para cada argumento; los
+            parámetros opcionales finales pueden omitirse y no se exponen
+        validador: Función opcional que recibe los argumentos y lanza una
+            excepción si no son válidos (por ejemplo, división por cero)
+        etiqueta: Texto del menú interactivo
+        descripcion: Nombre con artículo para los mensajes ('la suma',
+            'el factorial')
+    """
+
+    __slots__ = ("nombre", "tipos", "etiqueta", "descripcion", "minimo",
+                 "maximo", "parametros", "validar", "_funcion")
+
+    def __init__(self, nombre: str, funcion: Union[Callable, str], tipos: Sequence[Any],
+                 validador: Optional[Validador] = None, etiqueta: Optional[str] = None,
+                 descripcion: Optional[str] = None) -> None:
+        if not isinstance(nombre, str) or not nombre.isidentifier():
+            raise ValueError(f"Nombre de operación no válido: {nombre!r}")
+        objetivo = getattr(operaciones, funcion) if isinstance(funcion, str) else funcion
+        if not callable(objetivo):
+            raise TypeError(f"La operación {nombre} no es invocable")
+
+        self.nombre = nombre
+        self.tipos = tuple(tipos)
+        try:
+            firma = inspect.signature(objetivo)
+        except (TypeError, ValueError):
+            # Funciones integradas sin firma (por ejemplo math.hypot): la
+            # aridad es exactamente la cantidad de tipos indicados
+            self.parametros = tuple(f"arg{i}" for i in range(1, len(self.tipos) + 1))
+            self.minimo = self.maximo = len(self.tipos)
+        else:
+            parametros = [p for p in firma.parameters.values()
+                          if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+            # Los parámetros opcionales sin tipo indicado no se exponen
+            if len(self.tipos) > len(parametros) or any(
+                    p.default is p.empty for p in parametros[len(self.tipos):]):
+                raise ValueError(f"{nombre} tiene {len(parametros)} parámetros "
+                                 f"pero se indicaron {len(self.tipos)} tipos")
+            parametros = parametros[:len(self.tipos)]
+            self.parametros = tuple(p.name for p in parametros)
+            self.maximo = len(parametros)
+            self.minimo = sum(1 for p in parametros if p.default is p.empty)
+        self.etiqueta = etiqueta or nombre.replace("_", " ").capitalize()
+        self.descripcion = descripcion or f"la operación {nombre}"
+        self.validar = _construir_validador(nombre, self.minimo, self.maximo,
+                                            self.tipos, validador)
+        self._funcion = funcion
+
+    @property
+    def funcion(self) -> Callable:
+        """La función a llamar (la vigente en `operaciones` para las integradas)."""
+        if isinstance(self._funcion, str):
+            return getattr(operaciones, self._funcion)
+        return self._funcion
+
+    def __call__(self, *argumentos: Any) -> Any:
+        """Valida los argumentos y ejecuta la operación."""
+        self.validar(argumentos)
+        return self.funcion(*argumentos)
+
+    def __repr__(self) -> str:
+        return f"Operacion({self.nombre!r}, aridad={self.minimo}..{self.maximo})"
+
+
+# Operaciones registradas, en orden de registro: nombre -> Operacion
+_registro: Dict[str, Operacion] = {}
+_lock_registro = threading.Lock()
+
+
+def registrar_operacion(nombre: str, funcion: Union[Callable, str, None] = None,
+                        tipos: Sequence[Any] = (NUMERO, NUMERO),
+                        validador: Optional[Validador] = None, etiqueta: Optional[str] = None,
+                        descripcion: Optional[str] = None, reemplazar: bool = False):
+    """
+    Agrega una operación al registro.
+
+    Sin `funcion` se comporta como decorador y devuelve la función sin cambios.
+
+    Args:
+        nombre: Nombre con que se despacha
+        funcion: Función a llamar, o el nombre de una función de `operaciones`
+        tipos: Tipo esperado para cada parámetro posicional
+        validador: Función opcional que valida los argumentos
+        etiqueta: Texto del menú interactivo
+        descripcion: Nombre con artículo para los mensajes
+        reemplazar: Si True, reemplaza una operación existente con el mismo nombre
+
+    Returns:
+        La `Operacion` registrada (o el decorador si no se pasó `funcion`)
+
+    Raises:
+        ValueError: Si el nombre ya está registrado y `reemplazar` es False,
+            o si los tipos no coinciden con los parámetros
+    """
+    if funcion is None:
+        def decorador(original: Callable) -> Callable:
+            registrar_operacion(nombre, original, tipos, validador, etiqueta,
+                                descripcion, reemplazar)
+            return original
+        return decorador
+
+    operacion = Operacion(nombre, funcion, tipos, validador, etiqueta, descripcion)
+    with _lock_registro:
+        if nombre in _registro and not reemplazar:
+            raise ValueError(f"La operación '{nombre}' ya está registrada")
+        _registro[nombre] = operacion
+    return operacion
+
+
+def obtener_operacion(nombre: str) -> Operacion:
+    """
+    Busca una operación por nombre.
+
+    Args:
+        nombre: Nombre de la operación
+
+    Returns:
+        La operación registrada
+
+    Raises:
+        ValueError: Si no hay ninguna operación con ese nombre
+    """
+    try:
+        return _registro[nombre]
+    except (KeyError, TypeError):
+        raise ValueError(f"Operación desconocida: {nombre}") from None
+
+
+def buscar_operacion(nombre: Any) -> Optional[Operacion]:
+    """Devuelve la operación con ese nombre, o None si no existe."""
+    try:
+        return _registro.get(nombre)
+    except TypeError:
+        return None
+
+
+def operaciones_registradas() -> List[Operacion]:
+    """
+    Lista las operaciones en orden de registro.
+
+    Returns:
+        Lista de operaciones
+    """
+    with _lock_registro:
+        return list(_registro.values())
+
+
+def eliminar_operacion(nombre: str) -> None:
+    """
+    Quita una operación del registro.
+
+    Raises:
+        ValueError: Si no hay ninguna operación con ese nombre
+    """
+    with _lock_registro:
+        if _registro.pop(nombre, None) is None:
+            raise ValueError(f"Operación desconocida: {nombre}")
+
+
+# Validadores de las operaciones integradas
+
+def _divisor_no_nulo(a: Any, b: Any) -> None:
+    if b == 0:
+        raise ZeroDivisionError("No se puede dividir por cero")
+
+
+def _raiz_no_negativa(numero: Any) -> None:
+    if numero < 0:
+        raise ValueError("No se puede calcular la raíz cuadrada de un número negativo")
+
+
+def _factorial_no_negativo(n: int) -> None:
+    if n < 0:
+        raise ValueError("No se puede calcular el factorial de un número negativo")
+
+
+def _total_no_nulo(valor: Any, total: Any) -> None:
+    if total == 0:
+        raise ValueError("El total no puede ser cero")
+
+
+def _decimales_validos(numero: Any, decimales: int = 2) -> None:
+    if decimales < 0:
+        raise ValueError("El número de decimales no puede ser negativo")
+
+
+# Operaciones integradas; las cinco primeras conservan su número en el menú
+registrar_operacion("suma", "suma", etiqueta="Sumar dos números", descripcion="la suma")
+registrar_operacion("resta", "resta", etiqueta="Restar dos números", descripcion="la resta")
+registrar_operacion("multiplicacion", "multiplicacion", etiqueta="Multiplicar dos números",
+                    descripcion="la multiplicación")
+registrar_operacion("division", "division", validador=_divisor_no_nulo,
+                    etiqueta="Dividir dos números", descripcion="la división")
+registrar_operacion("potencia", "potencia", etiqueta="Calcular potencia",
+                    descripcion="la potencia")
+registrar_operacion("raiz_cuadrada", "raiz_cuadrada", tipos=(NUMERO,), validador=_raiz_no_negativa,
+                    etiqueta="Calcular raíz cuadrada", descripcion="la raíz cuadrada")
+registrar_operacion("factorial", "factorial", tipos=(int,), validador=_factorial_no_negativo,
+                    etiqueta="Calcular factorial", descripcion="el factorial")
+registrar_operacion("porcentaje", "porcentaje", validador=_total_no_nulo,
+                    etiqueta="Calcular porcentaje", descripcion="el porcentaje")
+registrar_operacion("redondear", "redondear", tipos=(NUMERO, int), validador=_decimales_validos,
+                    etiqueta="Redondear un número", descripcion="el redondeo")
+registrar_operacion("es_par", "es_par", tipos=(int,), etiqueta="Verificar si es par",
+                    descripcion="la verificación de paridad")
+registrar_operacion("es_primo", "es_primo", tipos=(int,), etiqueta="Verificar si es primo",
+                    descripcion="la verificación de primalidad")
+registrar_operacion("potencia_mod", teoria_numeros.potencia_mod, tipos=(int, int, int),
+                    etiqueta="Calcular potencia modular", descripcion="la potencia modular")
+registrar_operacion("inverso_mod", teoria_numeros.inverso_mod, tipos=(int, int),
+                    etiqueta="Calcular inverso modular", descripcion="el inverso modular")
+registrar_operacion("raiz_n", raices.raiz_n, tipos=(NUMERO, int),
+                    etiqueta="Calcular raíz n-ésima", descripcion="la raíz n-ésima")
@@ -0,0 +1,225 @@
+"""
+Módulo de Salida de Mensajes
+============================
+
+Este módulo contiene los destinos ("sumideros") donde escribe
+`utilidades.imprimir_mensaje`. Por defecto cada mensaje se imprime al
+momento, como siempre; para procesos por lotes se puede instalar un
+sumidero con buffer que escribe por tamaño o cada cierto tiempo, y un
+modo JSON por líneas para consumo automático.
+
+El nivel mínimo se verifica antes de formatear nada, así que un mensaje
+suprimido cuesta una consulta a un diccionario.
+
+Funciones disponibles:
+- configurar_salida(sumidero, nivel_minimo): Cambia el destino y el nivel mínimo
+- vaciar_salida(): Fuerza la escritura de los mensajes pendientes
+- SumideroConsola: Imprime cada mensaje inmediatamente
+- SumideroBuffer: Acumula mensajes y los escribe en bloque
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import atexit
+import json
+import sys
+import threading
+import time
+import weakref
+from typing import Optional, TextIO, Union
+
+
+# Símbolo de cada tipo de mensaje
+ESTILOS = {
+    "info": ("ℹ️", ""),
+    "error": ("❌", ""),
+    "success": ("✅", ""),
+    "warning": ("⚠️", ""),
+    "debug": ("🐛", ""),
+}
+
+# Severidad de cada tipo de mensaje
+NIVELES = {
+    "debug": 10,
+    "info": 20,
+    "success": 25,
+    "warning": 30,
+    "error": 40,
+}
+
+
+def _formatear_texto(mensaje: str, tipo: str) -> str:
+    """Formatea un mensaje con su símbolo."""
+    simbolo, _ = ESTILOS.get(tipo, ESTILOS["info"])
+    return f"{simbolo} {mensaje}"
+
+
+def _formatear_json(mensaje: str, tipo: str) -> str:
+    """Formatea un mensaje como un objeto JSON de una línea."""
+    return json.dumps({"ts": round(time.time(), 6), "nivel": tipo, "mensaje": mensaje},
+                      ensure_ascii=False)
+
+
+_FORMATOS = {"texto": _formatear_texto, "json": _formatear_json}
+
+
+class SumideroConsola:
+    """
+    Imprime cada mensaje inmediatamente.
+
+    Args:
+        destino: Flujo de salida (por defecto el sys.stdout vigente)
+        formato: 'texto' o 'json'
+    """
+
+    def __init__(self, destino: Optional[TextIO] = None, formato: str = "texto") -> None:
+        if formato not in _FORMATOS:
+            raise ValueError(f"Formato no válido: {formato!r}")
+        self.destino = destino
+        self._formatear = _FORMATOS[formato]
+
+    def escribir(self, mensaje: str, tipo: str) -> None:
+        """Escribe un mensaje."""
+        print(self._formatear(mensaje, tipo), file=self.destino or sys.stdout)
+
+    def vaciar(self) -> None:
+        """Fuerza la escritura del flujo de salida."""
+        (self.destino or sys.stdout).flush()
+
+
+class SumideroBuffer:
+    """
+    Acumula mensajes y los escribe en bloque.
+
+    El buffer se vacía cuando supera `max_bytes`, al llamar a `vaciar()`,
+    al terminar el programa y, si hay mensajes pendientes, a más tardar
+    `intervalo` segundos después del primero de ellos: un temporizador
+    en segundo plano lo vacía aunque no lleguen más mensajes.
+
+    Args:
+        destino: Flujo de salida (por defecto el sys.stdout vigente)
+        formato: 'texto' o 'json'
+        max_bytes: Tamaño aproximado del buffer antes de escribir
+        intervalo: Segundos máximos entre escrituras (None = solo por tamaño)
+    """
+
+    def __init__(self, destino: Optional[TextIO] = None, formato: str = "texto",
+                 max_bytes: int = 64 * 1024, intervalo: Optional[float] = 1.0) -> None:
+        if formato not in _FORMATOS:
+            raise ValueError(f"Formato no válido: {formato!r}")
+        if max_bytes <= 0:
+            raise ValueError("El tamaño del buffer debe ser positivo")
+
+        self.destino = destino
+        self.max_bytes = max_bytes
+        self.intervalo = intervalo
+        self._formatear = _FORMATOS[formato]
+        self._lineas = []
+        self._tamano = 0
+        self._ultima = time.monotonic()
+        self._temporizador = None
+        self._lock = threading.Lock()
+        _buffers.add(self)
+
+    def escribir(self, mensaje: str, tipo: str) -> None:
+        """Agrega un mensaje al buffer y lo vacía si corresponde."""
+        linea = self._formatear(mensaje, tipo)
+        with self._lock:
+            self._lineas.append(linea)
+            self._tamano += len(linea) + 1
+            if (self._tamano >= self.max_bytes or self.intervalo is not None
+                    and time.monotonic() - self._ultima >= self.intervalo):
+                self._vaciar_sin_lock()
+            elif self.intervalo is not None and self._temporizador is None:
+                self._temporizador = threading.Timer(self.intervalo, self.vaciar)
+                self._temporizador.daemon = True
+                self._temporizador.start()
+
+    def _vaciar_sin_lock(self) -> None:
+        """Escribe el buffer; el llamador debe tener el candado."""
+        if self._temporizador is not None:
+            self._temporizador.cancel()
+            self._temporizador = None
+        if self._lineas:
+            destino = self.destino or sys.stdout
+            destino.write("\n".join(self._lineas) + "\n")
+            destino.flush()
+            self._lineas.clear()
+            self._tamano = 0
+        self._ultima = time.monotonic()
+
+    def vaciar(self) -> None:
+        """Escribe todos los mensajes pendientes."""
+        with self._lock:
+            self._vaciar_sin_lock()
+
+
+# Sumideros con buffer vivos, vaciados por un único gancho de atexit
+_buffers = weakref.WeakSet()
+
+
+def _vaciar_buffers() -> None:
+    """Escribe los mensajes pendientes de todos los sumideros con buffer."""
+    for sumidero in list(_buffers):
+        sumidero.vaciar()
+
+
+atexit.register(_vaciar_buffers)
+
+
+Sumidero = Union[SumideroConsola, SumideroBuffer]
+
+# Configuración global usada por utilidades.imprimir_mensaje
+_sumidero: Sumidero = SumideroConsola()
+_nivel_minimo = 0
+
+
+def nivel_minimo() -> int:
+    """Devuelve la severidad mínima de los mensajes que se escriben."""
+    return _nivel_minimo
+
+
+def obtener_sumidero() -> Sumidero:
+    """Devuelve el sumidero actual."""
+    return _sumidero
+
+
+def configurar_salida(sumidero: Optional[Sumidero] = None,
+                      nivel_minimo: Union[str, int, None] = None) -> None:
+    """
+    Cambia el destino y/o el nivel mínimo de `imprimir_mensaje`.
+
+    El sumidero anterior se vacía antes de ser reemplazado.
+
+    Args:
+        sumidero: Nuevo sumidero (None mantiene el actual)
+        nivel_minimo: Tipo ('debug', 'info', 'success', 'warning', 'error')
+            o severidad numérica; los mensajes de menor severidad se descartan
+
+    Raises:
+        ValueError: Si el nivel no es válido
+    """
+    global _sumidero, _nivel_minimo
+
+    if nivel_minimo is not None:
+        if isinstance(nivel_minimo, str):
+            if nivel_minimo not in NIVELES:
+                raise ValueError(f"Nivel no válido: {nivel_minimo!r}")
+            nivel_minimo = NIVELES[nivel_minimo]
+        _nivel_minimo = nivel_minimo
+
+    if sumidero is not None and sumidero is not _sumidero:
+        _sumidero.vaciar()
+        _sumidero = sumidero
+
+
+def vaciar_salida() -> None:
+    """
+    Fuerza la escritura de los mensajes pendientes del sumidero actual.
+
+    Returns:
+        None
+    """
+    _sumidero.vaciar()
@@ -0,0 +1,414 @@
+"""
+Módulo de Servicio de Cálculo
+=============================
+
+Este módulo contiene un servidor asyncio local que expone las operaciones
+del registro de `paquete.registro` mediante un protocolo JSON delimitado
+por líneas, y el cliente correspondiente.
+
+Protocolo (una línea JSON por mensaje):
+- Petición:  {"id": 1, "funcion": "suma", "argumentos": [3, 4]}
+- Respuesta: {"id": 1, "resultado": 7}
+- Error:     {"id": 1, "error": "No se puede dividir por cero", "tipo": "ZeroDivisionError"}
+
+Los enteros muy grandes (por ejemplo factoriales) viajan como
+{"entero_hex": "0x..."} porque Python limita la conversión de enteros
+enormes a texto decimal.
+
+Un cliente puede enviar muchas peticiones sin esperar respuesta
+(pipelining); las respuestas llevan el mismo `id` y pueden llegar en otro
+orden. Las peticiones concurrentes a una misma función se agrupan durante
+una ventana breve y se ejecutan como un solo lote. Los lotes caros (según
+`paralelo.estimar_costo`) se calculan en un pool de procesos para que el
+bucle de eventos nunca se bloquee.
+
+Uso:
+    python -m paquete.servidor --puerto 8765
+    python -m paquete.servidor --unix /tmp/calculo.sock
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .paralelo import estimar_costo
+from .registro import buscar_operacion
+
+
+# Tiempo máximo que una petición espera a que se complete su lote
+VENTANA_LOTE = 0.002
+
+# Cantidad máxima de peticiones por lote
+MAX_LOTE = 256
+
+# Costo estimado a partir del cual un lote se calcula fuera del bucle
+UMBRAL_EJECUTOR = 1000
+
+# Tamaño máximo de una línea del protocolo
+LIMITE_LINEA = 16 * 1024 * 1024
+
+
+# Bits a partir de los cuales un entero se codifica en hexadecimal
+_BITS_HEX = 4096
+
+
+def a_json(valor: Any) -> Any:
+    """Codifica un valor para el protocolo (enteros enormes en hexadecimal)."""
+    if isinstance(valor, int) and not isinstance(valor, bool) and valor.bit_length() > _BITS_HEX:
+        return {"entero_hex": hex(valor)}
+    return valor
+
+
+def de_json(valor: Any) -> Any:
+    """Decodifica un valor del protocolo."""
+    if isinstance(valor, dict) and "entero_hex" in valor:
+        return int(valor["entero_hex"], 16)
+    return valor
+
+
+def _resolver(nombre: Any):
+    """Devuelve la operación registrada con ese nombre, o None."""
+    return buscar_operacion(nombre)
+
+
+def _ejecutar_lote(nombre: str, lote: List[list]) -> List[Tuple[bool, Any]]:
+    """
+    Ejecuta un lote de llamadas capturando el error de cada una.
+
+    Returns:
+        Lista de tuplas (exito, resultado o (tipo, mensaje))
+    """
+    operacion = _resolver(nombre)
+    resultados = []
+    for args in lote:
+        try:
+            resultados.append((True, operacion(*args)))
+        except Exception as e:
+            resultados.append((False, (type(e).__name__, str(e))))
+    return resultados
+
+
+class ServidorCalculo:
+    """
+    Servidor asyncio de las operaciones registradas.
+
+    Args:
+        host: Dirección TCP donde escuchar (ignorada si se usa `ruta_unix`)
+        puerto: Puerto TCP (0 elige uno libre)
+        ruta_unix: Ruta de un socket Unix en lugar de TCP
+        ejecutor: Pool donde calcular los lotes caros (por defecto uno de procesos)
+        ventana: Segundos que se espera para agrupar peticiones
+        max_lote: Cantidad máxima de peticiones por lote
+    """
+
+    def __init__(self, host: str = "127.0.0.1", puerto: int = 8765,
+                 ruta_unix: Optional[str] = None, ejecutor: Optional[Executor] = None,
+                 ventana: float = VENTANA_LOTE, max_lote: int = MAX_LOTE) -> None:
+        self.host = host
+        self.puerto = puerto
+        self.ruta_unix = ruta_unix
+        self.ventana = ventana
+        self.max_lote = max_lote
+        self._ejecutor = ejecutor
+        self._ejecutor_propio = ejecutor is None
+        self._servidor = None
+        self._pendientes: Dict[str, List[Tuple[list, asyncio.Future]]] = {}
+        self._temporizadores: Dict[str, asyncio.TimerHandle] = {}
+        self._lotes_en_curso = set()
+        self._conexiones: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    async def iniciar(self) -> None:
+        """Comienza a aceptar conexiones."""
+        if self.ruta_unix:
+            self._servidor = await asyncio.start_unix_server(
+                self._atender, path=self.ruta_unix, limit=LIMITE_LINEA)
+        else:
+            self._servidor = await asyncio.start_server(
+                self._atender, self.host, self.puerto, limit=LIMITE_LINEA)
+            self.puerto = self._servidor.sockets[0].getsockname()[1]
+
+    async def cerrar(self) -> None:
+        """Deja de aceptar conexiones y libera el pool de procesos."""
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+            self._servidor = None
+        # Cerrar los sockets hace que cada conexión termine leyendo EOF
+        conexiones = list(self._conexiones.items())
+        for escritor, _ in conexiones:
+            escritor.close()
+        if conexiones:
+            await asyncio.gather(*(t for _, t in conexiones), return_exceptions=True)
+        if self._ejecutor_propio and self._ejecutor is not None:
+            self._ejecutor.shutdown(wait=False)
+            self._ejecutor = None
+
+    async def servir_siempre(self) -> None:
+        """Inicia el servidor y atiende hasta que se cancele la tarea."""
+        await self.iniciar()
+        try:
+            await self._servidor.serve_forever()
+        finally:
+            await self.cerrar()
+
+    async def _atender(self, lector: asyncio.StreamReader,
+                       escritor: asyncio.StreamWriter) -> None:
+        """Atiende una conexión: cada línea es una petición independiente."""
+        tareas = set()
+        self._conexiones[escritor] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    linea = await lector.readline()
+                except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+                    break
+                if not linea:
+                    break
+                tarea = asyncio.ensure_future(self._responder(linea, escritor))
+                tareas.add(tarea)
+                tarea.add_done_callback(tareas.discard)
+            if tareas:
+                await asyncio.gather(*tareas, return_exceptions=True)
+        finally:
+            self._conexiones.pop(escritor, None)
+            escritor.close()
+
+    async def _responder(self, linea: bytes, escritor: asyncio.StreamWriter) -> None:
+        """Procesa una petición y escribe su respuesta."""
+        identificador = None
+        try:
+            peticion = json.loads(linea)
+            identificador = peticion.get("id")
+            nombre = peticion["funcion"]
+            argumentos = peticion.get("argumentos", [])
+            if _resolver(nombre) is None:
+                raise ValueError(f"Función desconocida: {nombre}")
+            if not isinstance(argumentos, list):
+                raise ValueError("'argumentos' debe ser una lista")
+            argumentos = [de_json(a) for a in argumentos]
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            respuesta = {"id": identificador, "error": str(e), "tipo": "PeticionInvalida"}
+        else:
+            exito, valor = await self._encolar(nombre, argumentos)
+            if exito:
+                respuesta = {"id": identificador, "resultado": a_json(valor)}
+            else:
+                respuesta = {"id": identificador, "error": valor[1], "tipo": valor[0]}
+
+        if escritor.is_closing():
+            return
+        try:
+            datos = json.dumps(respuesta)
+        except (TypeError, ValueError) as e:
+            datos = json.dumps({"id": identificador, "error": str(e), "tipo": type(e).__name__})
+        escritor.write(datos.encode() + b"\n")
+        try:
+            await escritor.drain()
+        except ConnectionError:
+            pass
+
+    def _encolar(self, nombre: str, argumentos: list) -> asyncio.Future:
+        """Agrega una petición al lote pendiente de su función."""
+        bucle = asyncio.get_running_loop()
+        futuro = bucle.create_future()
+        cola = self._pendientes.setdefault(nombre, [])
+        cola.append((argumentos, futuro))
+
+        if len(cola) >= self.max_lote:
+            self._despachar(nombre)
+        elif nombre not in self._temporizadores:
+            self._temporizadores[nombre] = bucle.call_later(
+                self.ventana, self._despachar, nombre)
+        return futuro
+
+    def _despachar(self, nombre: str) -> None:
+        """Envía a ejecutar el lote pendiente de una función."""
+        temporizador = self._temporizadores.pop(nombre, None)
+        if temporizador is not None:
+            temporizador.cancel()
+        lote = self._pendientes.pop(nombre, [])
+        if lote:
+            tarea = asyncio.ensure_future(self._ejecutar(nombre, lote))
+            self._lotes_en_curso.add(tarea)
+            tarea.add_done_callback(self._lotes_en_curso.discard)
+
+    async def _ejecutar(self, nombre: str, lote: List[Tuple[list, asyncio.Future]]) -> None:
+        """Calcula un lote en el bucle o en el pool según su costo estimado."""
+        argumentos = [args for args, _ in lote]
+        costo = sum(estimar_costo(nombre, args) for args in argumentos)
+        try:
+            if costo >= UMBRAL_EJECUTOR:
+                if self._ejecutor is None:
+                    self._ejecutor = ProcessPoolExecutor()
+                bucle = asyncio.get_running_loop()
+                resultados = await bucle.run_in_executor(
+                    self._ejecutor, _ejecutar_lote, nombre, argumentos)
+            else:
+                resultados = _ejecutar_lote(nombre, argumentos)
+        except Exception as e:
+            resultados = [(False, (type(e).__name__, str(e)))] * len(lote)
+
+        for (_, futuro), resultado in zip(lote, resultados):
+            if not futuro.done():
+                futuro.set_result(resultado)
+
+
+class ErrorRemoto(Exception):
+    """Error devuelto por el servidor de cálculo."""
+
+    def __init__(self, tipo: str, mensaje: str) -> None:
+        super().__init__(mensaje)
+        self.tipo = tipo
+
+
+class ClienteCalculo:
+    """
+    Cliente asyncio que reutiliza una única conexión con el servidor.
+
+    Las llamadas concurrentes se envían sin esperar a las anteriores y cada
+    respuesta se asocia a su petición por `id`.
+
+    Args:
+        host: Dirección TCP del servidor
+        puerto: Puerto TCP del servidor
+        ruta_unix: Ruta del socket Unix (en lugar de TCP)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", puerto: int = 8765,
+                 ruta_unix: Optional[str] = None) -> None:
+        self.host = host
+        self.puerto = puerto
+        self.ruta_unix = ruta_unix
+        self._lector = None
+        self._escritor = None
+        self._contador = itertools.count(1)
+        self._esperando: Dict[int, asyncio.Future] = {}
+        self._tarea_lectura = None
+        self._lock = None
+
+    async def conectar(self) -> None:
+        """Abre la conexión si no está abierta."""
+        if self._escritor is not None and not self._escritor.is_closing():
+            return
+        if self.ruta_unix:
+            self._lector, self._escritor = await asyncio.open_unix_connection(
+                self.ruta_unix, limit=LIMITE_LINEA)
+        else:
+            self._lector, self._escritor = await asyncio.open_connection(
+                self.host, self.puerto, limit=LIMITE_LINEA)
+        self._tarea_lectura = asyncio.ensure_future(self._leer_respuestas())
+
+    async def cerrar(self) -> None:
+        """Cierra la conexión y cancela las llamadas pendientes."""
+        if self._escritor is not None:
+            self._escritor.close()
+            try:
+                await self._escritor.wait_closed()
+            except ConnectionError:
+                pass
+        if self._tarea_lectura is not None:
+            self._tarea_lectura.cancel()
+            try:
+                await self._tarea_lectura
+            except asyncio.CancelledError:
+                pass
+        self._escritor = self._lector = self._tarea_lectura = None
+
+    async def __aenter__(self) -> "ClienteCalculo":
+        await self.conectar()
+        return self
+
+    async def __aexit__(self, *excepcion) -> None:
+        await self.cerrar()
+
+    async def _leer_respuestas(self) -> None:
+        """Entrega cada respuesta recibida a la llamada que la espera."""
+        error = ConnectionError("Conexión cerrada por el servidor")
+        try:
+            while True:
+                linea = await self._lector.readline()
+                if not linea:
+                    break
+                respuesta = json.loads(linea)
+                futuro = self._esperando.pop(respuesta.get("id"), None)
+                if futuro is not None and not futuro.done():
+                    futuro.set_result(respuesta)
+        except Exception as e:
+            error = e
+        finally:
+            for futuro in self._esperando.values():
+                if not futuro.done():
+                    futuro.set_exception(error)
+            self._esperando.clear()
+
+    async def llamar(self, funcion: str, *argumentos: Any) -> Any:
+        """
+        Ejecuta una operación registrada en el servidor.
+
+        Args:
+            funcion: Nombre de la función (por ejemplo 'factorial')
+            *argumentos: Argumentos de la llamada
+
+        Returns:
+            El resultado calculado por el servidor
+
+        Raises:
+            ErrorRemoto: Si la función lanzó un error en el servidor
+            ConnectionError: Si la conexión se cerró
+        """
+        await self.conectar()
+        identificador = next(self._contador)
+        futuro = asyncio.get_running_loop().create_future()
+        self._esperando[identificador] = futuro
+
+        mensaje = {"id": identificador, "funcion": funcion,
+                   "argumentos": [a_json(a) for a in argumentos]}
+        self._escritor.write(json.dumps(mensaje).encode() + b"\n")
+        await self._escritor.drain()
+
+        respuesta = await futuro
+        if "error" in respuesta:
+            raise ErrorRemoto(respuesta.get("tipo", ""), respuesta["error"])
+        return de_json(respuesta["resultado"])
+
+    async def llamar_muchos(self, funcion: str, argumentos: List[list]) -> List[Any]:
+        """
+        Envía muchas llamadas en paralelo por la misma conexión.
+
+        Returns:
+            Los resultados en el mismo orden; los errores se devuelven como
+            instancias de ErrorRemoto en su posición
+        """
+        return await asyncio.gather(
+            *(self.llamar(funcion, *args) for args in argumentos), return_exceptions=True)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Punto de entrada de línea de comandos del servidor.
+
+    Args:
+        argv: Argumentos (por defecto sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="Servidor local de operaciones")
+    parser.add_argument("--host", default="127.0.0.1", help="Dirección TCP")
+    parser.add_argument("--puerto", type=int, default=8765, help="Puerto TCP")
+    parser.add_argument("--unix", metavar="RUTA", help="Escuchar en un socket Unix")
+    opciones = parser.parse_args(argv)
+
+    servidor = ServidorCalculo(opciones.host, opciones.puerto, ruta_unix=opciones.unix)
+    try:
+        asyncio.run(servidor.servir_siempre())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
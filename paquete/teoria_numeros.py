@@ -0,0 +1,224 @@
+"""
+Módulo de Teoría de Números
+===========================
+
+Este módulo contiene operaciones modulares y de divisibilidad sobre enteros
+de tamaño arbitrario. A diferencia de `operaciones.potencia`, que calcula
+`base ** exponente` completo, la exponenciación modular reduce en cada
+paso, así que nunca se construye la potencia sin reducir.
+
+Funciones disponibles:
+- potencia_mod(base, exponente, modulo): Calcula base^exponente mod modulo
+- inverso_mod(a, modulo): Inverso multiplicativo modular
+- mcd_lote(numeros): Máximo común divisor de una secuencia
+- mcm_lote(numeros): Mínimo común múltiplo de una secuencia
+- mcd_cruzado(numeros): MCD de cada número con el producto de los demás
+- resto_chino(restos, modulos): Reconstrucción por el teorema chino del resto
+
+Autor: Tu Nombre
+Fecha: 2024
+Versión: 1.0
+"""
+
+import math
+from typing import Iterable, List, Sequence, Tuple
+
+
+def _validar_enteros(*valores: int) -> None:
+    """Lanza TypeError si algún valor no es entero."""
+    for valor in valores:
+        if not isinstance(valor, int):
+            raise TypeError("Los argumentos deben ser enteros")
+
+
+def _validar_modulo(modulo: int) -> None:
+    """Lanza ValueError si el módulo no es positivo."""
+    if modulo <= 0:
+        raise ValueError("El módulo debe ser positivo")
+
+
+def potencia_mod(base: int, exponente: int, modulo: int) -> int:
+    """
+    Calcula base^exponente mod modulo sin construir la potencia completa.
+
+    Un exponente negativo usa el inverso modular de la base.
+
+    Args:
+        base: Base entera
+        exponente: Exponente entero
+        modulo: Módulo entero positivo
+
+    Returns:
+        El resultado en el rango [0, modulo)
+
+    Raises:
+        TypeError: Si los argumentos no son enteros
+        ValueError: Si el módulo no es positivo, o si el exponente es
+            negativo y la base no es invertible módulo `modulo`
+    """
+    _validar_enteros(base, exponente, modulo)
+    _validar_modulo(modulo)
+
+    if exponente < 0:
+        return pow(inverso_mod(base, modulo), -exponente, modulo)
+    return pow(base, exponente, modulo)
+
+
+def inverso_mod(a: int, modulo: int) -> int:
+    """
+    Calcula el inverso multiplicativo de a módulo `modulo`.
+
+    Args:
+        a: Entero a invertir
+        modulo: Módulo entero positivo
+
+    Returns:
+        El entero x en [0, modulo) tal que a * x ≡ 1 (mod modulo)
+
+    Raises:
+        TypeError: Si los argumentos no son enteros
+        ValueError: Si el módulo no es positivo o a no es coprimo con él
+    """
+    _validar_enteros(a, modulo)
+    _validar_modulo(modulo)
+
+    if modulo == 1:
+        return 0
+    try:
+        return pow(a, -1, modulo)
+    except ValueError:
+        raise ValueError(f"{a} no tiene inverso módulo {modulo}") from None
+
+
+def mcd_lote(numeros: Iterable[int]) -> int:
+    """
+    Calcula el máximo común divisor de una secuencia de enteros.
+
+    En cuanto el resultado parcial es 1 deja de calcular MCD, pero sigue
+    comprobando el tipo de los elementos restantes.
+
+    Args:
+        numeros: Iterable de enteros
+
+    Returns:
+        El MCD (no negativo); 0 si la secuencia está vacía o son todos 0
+
+    Raises:
+        TypeError: Si algún elemento no es entero
+    """
+    resultado = 0
+    for numero in numeros:
+        _validar_enteros(numero)
+        # Con mcd 1 ya no cambia: solo falta validar el resto
+        if resultado != 1:
+            resultado = math.gcd(resultado, numero)
+    return resultado
+
+
+def mcm_lote(numeros: Iterable[int]) -> int:
+    """
+    Calcula el mínimo común múltiplo de una secuencia de enteros.
+
+    Args:
+        numeros: Iterable de enteros
+
+    Returns:
+        El MCM (no negativo); 1 si la secuencia está vacía y 0 si algún
+        elemento es 0
+
+    Raises:
+        TypeError: Si algún elemento no es entero
+    """
+    resultado = 1
+    for numero in numeros:
+        _validar_enteros(numero)
+        if numero == 0:
+            resultado = 0
+            continue
+        if resultado:
+            resultado = resultado // math.gcd(resultado, numero) * abs(numero)
+    return resultado
+
+
+def _arbol_productos(numeros: List[int]) -> List[List[int]]:
+    """Niveles del árbol de productos, desde las hojas hasta la raíz."""
+    niveles = [numeros]
+    while len(niveles[-1]) > 1:
+        nivel = niveles[-1]
+        niveles.append([math.prod(nivel[i:i + 2]) for i in range(0, len(nivel), 2)])
+    return niveles
+
+
+def mcd_cruzado(numeros: Sequence[int]) -> List[int]:
+    """
+    Calcula, para cada número, su MCD con el producto de todos los demás.
+
+    Usa un árbol de productos y otro de restos (MCD por lotes de
+    Bernstein), con costo casi lineal en el tamaño total de la entrada en
+    lugar de comparar todos los pares. Sirve, por ejemplo, para encontrar
+    módulos RSA que comparten un factor primo.
+
+    Args:
+        numeros: Secuencia de enteros positivos
+
+    Returns:
+        Lista con mcd(n_i, producto de los n_j con j != i) para cada i
+
+    Raises:
+        TypeError: Si algún elemento no es entero
+        ValueError: Si algún elemento no es positivo
+    """
+    numeros = list(numeros)
+    _validar_enteros(*numeros)
+    if any(n <= 0 for n in numeros):
+        raise ValueError("Los números deben ser positivos")
+    if len(numeros) < 2:
+        return [1] * len(numeros)
+
+    niveles = _arbol_productos(numeros)
+    # Bajar por el árbol: cada nodo guarda P mod (valor del nodo)^2
+    restos = niveles[-1]
+    for nivel in reversed(niveles[:-1]):
+        restos = [restos[i // 2] % (valor * valor) for i, valor in enumerate(nivel)]
+    return [math.gcd(resto // n, n) for resto, n in zip(restos, numeros)]
+
+
+def resto_chino(restos: Sequence[int], modulos: Sequence[int]) -> Tuple[int, int]:
+    """
+    Reconstruye un entero a partir de sus restos (teorema chino del resto).
+
+    Los módulos no necesitan ser coprimos: basta con que los restos sean
+    compatibles entre sí.
+
+    Args:
+        restos: Restos r_i
+        modulos: Módulos m_i positivos, uno por resto
+
+    Returns:
+        Tupla (x, M) con x en [0, M) tal que x ≡ r_i (mod m_i) para todo i,
+        donde M es el MCM de los módulos
+
+    Raises:
+        TypeError: Si algún valor no es entero
+        ValueError: Si las longitudes no coinciden, algún módulo no es
+            positivo o el sistema no tiene solución
+    """
+    restos, modulos = list(restos), list(modulos)
+    if len(restos) != len(modulos):
+        raise ValueError("Debe haber un módulo por cada resto")
+    _validar_enteros(*restos, *modulos)
+    for modulo in modulos:
+        _validar_modulo(modulo)
+
+    x, m = 0, 1
+    for r, n in zip(restos, modulos):
+        g = math.gcd(m, n)
+        diferencia = r - x
+        if diferencia % g:
+            raise ValueError(f"El sistema no tiene solución: {r} mod {n} es incompatible")
+        paso = n // g
+        t = diferencia // g * (pow(m // g, -1, paso) if paso > 1 else 0) % paso
+        x += m * t
+        m *= paso
+        x %= m
+    return x, m
@@ -14,6 +14,11 @@ Funciones disponibles:
 - validar_email(email): Valida formato de email
 - formatear_fecha(fecha): Formatea una fecha
 - generar_id(): Genera un ID único
+- obtener_numeros(tipo): Lee todos los números restantes de la fuente de entrada
+
+Las funciones interactivas leen de la fuente de `entradas` (la consola
+por defecto); ver `entradas.configurar_entrada` para leer de archivos,
+tuberías o guiones de respuestas.
 
 Autor: Tu Nombre
 Fecha: 2024
@@ -24,37 +29,49 @@ import os
 import sys
 import re
 import time
-import uuid
 from datetime import datetime
 from typing import Optional, Union
 
+from . import entradas, formato, salida
+from .correos import PATRON_EMAIL
+from .identificadores import id_hex
+from .progreso import formatear_barra
+
 
 def imprimir_mensaje(mensaje: str, tipo: str = "info") -> None:
     """
     Imprime un mensaje formateado con diferentes estilos según el tipo.
     
+    El destino, el formato y el nivel mínimo se configuran con
+    `salida.configurar_salida`; por defecto se imprime inmediatamente.
+    
     Args:
         mensaje: El mensaje a imprimir
-        tipo: Tipo de mensaje ('info', 'error', 'success', 'warning')
+        tipo: Tipo de mensaje ('info', 'error', 'success', 'warning', 'debug')
         
     Returns:
         None
     """
-    # Definir colores y símbolos para diferentes tipos de mensaje
-    estilos = {
-        "info": ("ℹ️", ""),
-        "error": ("❌", ""),
-        "success": ("✅", ""),
-        "warning": ("⚠️", ""),
-        "debug": ("🐛", "")
-    }
+    # Descartar antes de formatear si el tipo está por debajo del nivel mínimo
+    if salida.NIVELES.get(tipo, 20) < salida.nivel_minimo():
+        return
     
-    # Obtener el estilo correspondiente al tipo
-    simbolo, color = estilos.get(tipo, estilos["info"])
+    # El sumidero configurado en el módulo salida formatea y escribe
+    salida.obtener_sumidero().escribir(mensaje, tipo)
+
+
+def _respuesta_invalida(mensaje: str, tipo: str) -> None:
+    """
+    Informa una respuesta inválida antes de volver a preguntar.
     
-    # Formatear y imprimir el mensaje
-    mensaje_formateado = f"{simbolo} {mensaje}"
-    print(mensaje_formateado)
+    En la consola se imprime el mensaje; con otras fuentes de entrada se
+    registra en el reporte de la fuente (que puede lanzar ValueError).
+    """
+    fuente = entradas.obtener_fuente()
+    if fuente.interactiva:
+        imprimir_mensaje(mensaje, tipo)
+    else:
+        fuente.registrar_error(mensaje)
 
 
 def obtener_nombre_usuario() -> str:
@@ -69,25 +86,25 @@ def obtener_nombre_usuario() -> str:
     """
     while True:
         try:
-            nombre = input("👤 Ingresa tu nombre: ").strip()
+            nombre = entradas.leer("👤 Ingresa tu nombre: ").strip()
             
             # Validar que el nombre no esté vacío
             if not nombre:
-                imprimir_mensaje("El nombre no puede estar vacío. Intenta de nuevo.", "warning")
+                _respuesta_invalida("El nombre no puede estar vacío. Intenta de nuevo.", "warning")
                 continue
             
             # Validar que el nombre solo contenga letras y espacios
             if not re.match(r"^[a-zA-ZáéíóúÁÉÍÓÚñÑ\s]+$", nombre):
-                imprimir_mensaje("El nombre solo puede contener letras y espacios.", "warning")
+                _respuesta_invalida("El nombre solo puede contener letras y espacios.", "warning")
                 continue
             
             # Validar longitud del nombre
             if len(nombre) < 2:
-                imprimir_mensaje("El nombre debe tener al menos 2 caracteres.", "warning")
+                _respuesta_invalida("El nombre debe tener al menos 2 caracteres.", "warning")
                 continue
             
             if len(nombre) > 50:
-                imprimir_mensaje("El nombre es demasiado largo (máximo 50 caracteres).", "warning")
+                _respuesta_invalida("El nombre es demasiado largo (máximo 50 caracteres).", "warning")
                 continue
             
             return nombre.title()
@@ -110,10 +127,13 @@ def obtener_numero(mensaje: str, tipo: str = "float") -> Union[int, float]:
         
     Raises:
         KeyboardInterrupt: Si el usuario cancela la entrada
+        EOFError: Si una fuente no interactiva se quedó sin respuestas
+        ValueError: Si la fuente se configuró con errores='lanzar' y la
+            respuesta no es un número
     """
     while True:
         try:
-            entrada = input(f"{mensaje}: ").strip()
+            entrada = entradas.leer(f"{mensaje}: ").strip()
             
             # Permitir salir con 'q' o 'quit'
             if entrada.lower() in ['q', 'quit', 'salir']:
@@ -127,12 +147,48 @@ def obtener_numero(mensaje: str, tipo: str = "float") -> Union[int, float]:
             return numero
             
         except ValueError:
-            imprimir_mensaje(f"Por favor ingresa un número válido ({tipo}).", "error")
+            _respuesta_invalida(f"Por favor ingresa un número válido ({tipo}).", "error")
         except KeyboardInterrupt:
             imprimir_mensaje("\nOperación cancelada por el usuario.", "warning")
             raise
 
 
+def obtener_numeros(tipo: str = "float", mensaje: Optional[str] = None,
+                    reporte: Optional[list] = None) -> list:
+    """
+    Lee todos los números restantes de la fuente de entrada.
+    
+    Las líneas se convierten por bloques y pueden tener varios números
+    separados por espacios, comas o punto y coma. En la consola se lee
+    hasta una línea vacía.
+    
+    Args:
+        tipo: 'float', 'int' o 'auto' (int o float según cada número)
+        mensaje: Indicación a mostrar antes de leer (solo en la consola)
+        reporte: Lista donde se agregan tuplas (indice, mensaje) de los
+            valores inválidos (por defecto el reporte de la fuente)
+        
+    Returns:
+        Lista con los números leídos; los inválidos se omiten
+        
+    Raises:
+        ValueError: Si el tipo no es válido, o si la fuente se configuró
+            con errores='lanzar' y algún valor no es un número
+    """
+    fuente = entradas.obtener_fuente()
+    if fuente.interactiva:
+        if reporte is None:
+            reporte = []
+        imprimir_mensaje(mensaje or "Ingresa los números (línea vacía para terminar)")
+    numeros = []
+    for bloque in fuente.numeros(tipo, reporte=reporte):
+        numeros.extend(bloque)
+    if fuente.interactiva:
+        for indice, error in reporte:
+            imprimir_mensaje(f"Valor {indice} ignorado: {error}", "warning")
+    return numeros
+
+
 def limpiar_pantalla() -> None:
     """
     Limpia la pantalla de la consola según el sistema operativo.
@@ -157,7 +213,7 @@ def pausar(mensaje: str = "Presiona Enter para continuar...") -> None:
         None
     """
     try:
-        input(mensaje)
+        entradas.leer(mensaje)
     except KeyboardInterrupt:
         imprimir_mensaje("\nOperación cancelada por el usuario.", "warning")
 
@@ -172,15 +228,18 @@ def validar_email(email: str) -> bool:
     Returns:
         True si el email es válido, False en caso contrario
     """
-    # Patrón regex para validar email
-    patron = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(patron, email) is not None
+    # Patrón precompilado compartido con la validación masiva
+    return PATRON_EMAIL.match(email) is not None
 
 
 def formatear_fecha(fecha: datetime, formato: str = "%d/%m/%Y %H:%M:%S") -> str:
     """
     Formatea una fecha según el formato especificado.
     
+    Para columnas completas (datetime o marcas de tiempo) usa
+    `fechas.formatear_fechas`, que reúne los errores en un reporte en lugar
+    de imprimir uno por fila.
+    
     Args:
         fecha: Objeto datetime a formatear
         formato: Formato de fecha (por defecto: dd/mm/yyyy hh:mm:ss)
@@ -195,20 +254,30 @@ def formatear_fecha(fecha: datetime, formato: str = "%d/%m/%Y %H:%M:%S") -> str:
         return str(fecha)
 
 
-def generar_id() -> str:
+def generar_id(longitud: int = 8) -> str:
     """
-    Genera un ID único usando UUID.
+    Genera un ID único hexadecimal.
+    
+    Usa un buffer compartido de `os.urandom` en lugar de crear un UUID
+    por llamada. Para generar muchos IDs a la vez usa
+    `identificadores.generar_ids`.
+    
+    Args:
+        longitud: Cantidad de caracteres hexadecimales (por defecto 8)
     
     Returns:
         Un ID único como string
     """
-    return str(uuid.uuid4())[:8]
+    return id_hex(longitud)
 
 
 def mostrar_progreso(actual: int, total: int, mensaje: str = "Progreso") -> None:
     """
     Muestra una barra de progreso en la consola.
     
+    Dibuja la barra completa en cada llamada; para bucles largos conviene
+    `progreso.Progreso`, que solo redibuja cuando cambia algo visible.
+    
     Args:
         actual: Valor actual del progreso
         total: Valor total del progreso
@@ -220,12 +289,7 @@ def mostrar_progreso(actual: int, total: int, mensaje: str = "Progreso") -> None
     if total <= 0:
         return
     
-    porcentaje = (actual / total) * 100
-    barra_largo = 30
-    completado = int(barra_largo * actual // total)
-    barra = "█" * completado + "░" * (barra_largo - completado)
-    
-    print(f"\r{mensaje}: |{barra}| {porcentaje:.1f}% ({actual}/{total})", end="", flush=True)
+    print("\r" + formatear_barra(actual, total, mensaje), end="", flush=True)
     
     if actual == total:
         print()  # Nueva línea al completar
@@ -262,14 +326,14 @@ def confirmar(mensaje: str = "¿Estás seguro?") -> bool:
         True si el usuario confirma, False en caso contrario
     """
     while True:
-        respuesta = input(f"{mensaje} (s/n): ").lower().strip()
+        respuesta = entradas.leer(f"{mensaje} (s/n): ").lower().strip()
         
         if respuesta in ['s', 'si', 'sí', 'y', 'yes']:
             return True
         elif respuesta in ['n', 'no']:
             return False
         else:
-            imprimir_mensaje("Por favor responde 's' para sí o 'n' para no.", "warning")
+            _respuesta_invalida("Por favor responde 's' para sí o 'n' para no.", "warning")
 
 
 def obtener_opcion_menu(opciones: list, mensaje: str = "Selecciona una opción") -> int:
@@ -292,40 +356,46 @@ def obtener_opcion_menu(opciones: list, mensaje: str = "Selecciona una opción")
     
     while True:
         try:
-            seleccion = input(f"Selecciona (1-{len(opciones)}): ").strip()
+            seleccion = entradas.leer(f"Selecciona (1-{len(opciones)}): ").strip()
             
             if seleccion.lower() in ['q', 'quit', 'salir']:
                 raise KeyboardInterrupt
             
-            numero = int(seleccion)
+            try:
+                numero = int(seleccion)
+            except ValueError:
+                _respuesta_invalida("Por favor ingresa un número válido.", "error")
+                continue
             
             if 1 <= numero <= len(opciones):
                 return numero
             else:
-                imprimir_mensaje(f"Por favor selecciona un número entre 1 y {len(opciones)}.", "warning")
+                _respuesta_invalida(f"Por favor selecciona un número entre 1 y {len(opciones)}.", "warning")
                 
-        except ValueError:
-            imprimir_mensaje("Por favor ingresa un número válido.", "error")
         except KeyboardInterrupt:
             imprimir_mensaje("\nOperación cancelada por el usuario.", "warning")
             raise
 
 
-def formatear_numero(numero: Union[int, float], decimales: int = 2) -> str:
+def formatear_numero(numero: Union[int, float], decimales: int = 2,
+                     separador_miles: str = ",", separador_decimal: str = ".") -> str:
     """
     Formatea un número con separadores de miles y decimales.
     
+    Usa un formateador compilado y compartido por configuración; para
+    columnas completas conviene `formato.FormateadorNumeros`.
+    
     Args:
         numero: Número a formatear
         decimales: Número de decimales a mostrar
+        separador_miles: Separador de miles (por ejemplo '.' en español)
+        separador_decimal: Separador decimal (por ejemplo ',' en español)
         
     Returns:
         El número formateado como string
     """
     try:
-        if isinstance(numero, int):
-            return f"{numero:,}"
-        else:
-            return f"{numero:,.{decimales}f}"
-    except Exception:
-        return str(numero)
\ No newline at end of file
+        formateador = formato.formateador(decimales, separador_miles, separador_decimal)
+    except (TypeError, ValueError):
+        return str(numero)
+    return formateador.formatear(numero)
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""Pruebas de paquete.agregados."""
+
+import math
+import random
+
+import pytest
+
+from paquete.agregados import Agregador, agregar_flujo, combinar_agregadores
+
+
+def _por_valor(valores):
+    agregador = Agregador()
+    for valor in valores:
+        agregador.agregar(valor)
+    return agregador
+
+
+def _iguales(a, b):
+    return a == b or (isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b))
+
+
+@pytest.mark.parametrize("valores, suma", [
+    ([1.0, math.inf], math.inf),
+    ([math.inf], math.inf),
+    ([-math.inf, 2.0, 3.0], -math.inf),
+])
+def test_suma_con_infinitos(valores, suma):
+    assert _por_valor(valores).suma == suma
+    assert agregar_flujo(valores).suma == suma
+
+
+@pytest.mark.parametrize("valores, media, varianza", [
+    ([math.inf, 1.0], math.inf, math.nan),
+    ([1.0, math.inf], math.inf, math.nan),
+    ([math.inf, -math.inf], math.nan, math.nan),
+    ([math.nan, 1.0], math.nan, math.nan),
+    ([1e200, -1e200, 3.0], 1.0, math.inf),
+    ([1e308, 1e308, -1e308], 1e308 / 3, math.inf),
+])
+def test_valores_no_finitos_y_desbordes(valores, media, varianza):
+    for agregador in (_por_valor(valores), agregar_flujo(valores)):
+        resultado = agregador.resultado()
+        assert _iguales(resultado["media"], media)
+        assert _iguales(resultado["varianza"], varianza)
+        assert not resultado["varianza"] < 0
+
+
+def test_suma_reescalada_al_combinar():
+    partes = combinar_agregadores([agregar_flujo([1e308, 1e308]), agregar_flujo([-1e308])])
+    assert partes.suma == 1e308
+    assert partes.media == 1e308 / 3
+
+
+def test_precision_y_combinacion():
+    rng = random.Random(7)
+    valores = [rng.uniform(-1e6, 1e6) for _ in range(10_000)]
+    completo = agregar_flujo(valores)
+    partes = combinar_agregadores(agregar_flujo(valores[i:i + 999]) for i in range(0, len(valores), 999))
+    assert completo.suma == math.fsum(valores)
+    assert partes.suma == pytest.approx(completo.suma, rel=1e-12)
+    assert partes.varianza() == pytest.approx(completo.varianza(), rel=1e-9)
+
+
+def test_tipos_invalidos():
+    with pytest.raises(TypeError):
+        agregar_flujo([1, "x"])
@@ -0,0 +1,32 @@
+"""Pruebas de paquete.archivos."""
+
+import math
+
+import pytest
+
+from paquete.archivos import _aplicar_bloque
+
+
+def _contar_llamadas(funcion):
+    llamadas = []
+
+    def envoltura(x, *argumentos):
+        llamadas.append(x)
+        return funcion(x, *argumentos)
+    return envoltura, llamadas
+
+
+def test_fallo_no_recalcula_los_elementos_anteriores():
+    funcion, llamadas = _contar_llamadas(lambda x, d: d / x)
+    reporte = []
+    resultados = _aplicar_bloque(funcion, [1, 2, 0, 4, 0, 5], (20,), 100, "mascara",
+                                 reporte, math.nan)
+    assert llamadas == [1, 2, 0, 4, 0, 5]
+    assert resultados[:2] == [20.0, 10.0] and resultados[3] == 5.0 and resultados[5] == 4.0
+    assert math.isnan(resultados[2]) and math.isnan(resultados[4])
+    assert [indice for indice, _ in reporte] == [102, 104]
+
+
+def test_modo_lanzar_indica_el_elemento():
+    with pytest.raises(ZeroDivisionError, match=r"\(elemento 7\)"):
+        _aplicar_bloque(lambda x: 1 / x, [1, 0], (), 6, "lanzar", None, math.nan)
@@ -0,0 +1,58 @@
+"""Pruebas de paquete.cache_disco."""
+
+from paquete import cache_disco
+from paquete.cache_disco import CacheDisco, calentar_cache
+
+
+def test_calentar_lote_reporta_argumentos_no_numericos(tmp_path, capsys):
+    lote = tmp_path / "llamadas.txt"
+    lote.write_text("factorial 50\nes_primo abc\n# comentario\npotencia 2 100\n", encoding="utf-8")
+    ruta = str(tmp_path / "cache.db")
+
+    assert cache_disco.main([ruta, "calentar", "--lote", str(lote)]) == 1
+    salida = capsys.readouterr()
+    assert "llamada 1" in salida.err and "'abc'" in salida.err
+    assert "2 resultados guardados" in salida.out
+    assert CacheDisco(ruta).estadisticas()["entradas"] == 2
+
+
+def test_calentar_convierte_argumentos_de_texto(tmp_path):
+    cache = CacheDisco(str(tmp_path / "cache.db"))
+    reporte = []
+    assert calentar_cache(cache, [("potencia", ["2", "10"]), ("factorial", ["x"])], reporte) == 1
+    assert [indice for indice, _ in reporte] == [1]
+    assert calentar_cache(cache, [("potencia", [2, 10])]) == 0  # ya estaba guardado
+
+
+def _llenar(ruta, inicio):
+    cache = CacheDisco(ruta, max_bytes=200_000, umbral_compresion=10**9)
+    for i in range(inicio, inicio + 50):
+        cache.guardar(f"clave{i}", "x" * 1000)
+
+
+def test_limite_compartido_entre_procesos(tmp_path):
+    import multiprocessing
+
+    ruta = str(tmp_path / "cache.db")
+    CacheDisco(ruta)
+    procesos = [multiprocessing.Process(target=_llenar, args=(ruta, 1000 * i)) for i in range(6)]
+    for proceso in procesos:
+        proceso.start()
+    for proceso in procesos:
+        proceso.join()
+    assert all(proceso.exitcode == 0 for proceso in procesos)
+    assert CacheDisco(ruta).estadisticas()["bytes"] <= 200_000
+
+
+def test_reactivar_con_otra_ruta_cierra_la_anterior(tmp_path, monkeypatch):
+    cerradas = []
+    monkeypatch.setattr(CacheDisco, "cerrar", lambda self: cerradas.append(self.ruta))
+    try:
+        primera = cache_disco.activar_cache_disco(str(tmp_path / "a.db"), ["factorial"])
+        assert cache_disco.activar_cache_disco(str(tmp_path / "a.db"), ["factorial"]) is primera
+        assert cerradas == []
+        cache_disco.activar_cache_disco(str(tmp_path / "b.db"), ["factorial"])
+        assert cerradas == [primera.ruta]
+    finally:
+        cache_disco.desactivar_cache_disco()
+    assert cerradas == [primera.ruta, str(tmp_path / "b.db")]
@@ -0,0 +1,132 @@
+"""Pruebas de paquete.capas y de las capas sobre operaciones."""
+
+import pytest
+
+import paquete
+from paquete import capas, operaciones
+from paquete.cache import activar_cache, desactivar_cache
+from paquete.cache_disco import activar_cache_disco, calentar_cache, desactivar_cache_disco
+from paquete.instrumentacion import (activar_instrumentacion, desactivar_instrumentacion,
+                                     metricas_instrumentacion)
+
+
+@pytest.fixture(autouse=True)
+def _sin_capas():
+    yield
+    desactivar_cache()
+    desactivar_instrumentacion()
+    desactivar_cache_disco()
+
+
+def test_desactivar_restaura_la_original():
+    original = operaciones.factorial
+    activar_cache("factorial")
+    assert operaciones.factorial is not original
+    desactivar_cache("factorial")
+    assert operaciones.factorial is original
+    assert capas.capas_activas("factorial") == []
+
+
+def test_quitar_una_capa_conserva_las_demas():
+    original = operaciones.factorial
+    llamadas = []
+
+    def contar(funcion):
+        def envoltura(*args):
+            llamadas.append(args)
+            return funcion(*args)
+        return envoltura
+
+    capas.envolver("factorial", "prueba", contar)
+    cache = activar_cache("factorial")
+    operaciones.factorial(10)
+    operaciones.factorial(10)
+    assert len(llamadas) == 1 and cache.aciertos == 1
+
+    capas.quitar("factorial", "prueba")
+    assert capas.capas_activas("factorial") == ["cache"]
+    operaciones.factorial(10)
+    assert cache.aciertos == 2
+
+    activar_cache("factorial")  # reemplazar la caché no reinstala la capa quitada
+    desactivar_cache("factorial")
+    assert operaciones.factorial is original
+    assert len(llamadas) == 1
+
+
+def test_reactivar_reemplaza_en_su_lugar():
+    capas.envolver("factorial", "prueba", lambda funcion: funcion)
+    activar_cache("factorial")
+    capas.envolver("factorial", "prueba", lambda funcion: funcion)
+    assert capas.capas_activas("factorial") == ["prueba", "cache"]
+    capas.quitar("factorial", "prueba")
+
+
+def test_paquete_devuelve_la_funcion_vigente():
+    original = paquete.factorial
+    cache = activar_cache("factorial")
+    assert paquete.factorial is operaciones.factorial
+    paquete.factorial(12)
+    paquete.factorial(12)
+    assert cache.aciertos == 1
+    desactivar_cache("factorial")
+    assert paquete.factorial is original
+
+
+def test_nombre_invalido():
+    with pytest.raises(ValueError):
+        capas.envolver("_privada", "prueba", lambda funcion: funcion)
+    with pytest.raises(ValueError):
+        activar_cache("no_existe")
+
+
+def test_desactivar_cache_conserva_la_instrumentacion():
+    original = operaciones.factorial
+    activar_instrumentacion(["factorial"])
+    activar_cache("factorial")
+    desactivar_cache("factorial")
+    operaciones.factorial(5)
+    assert metricas_instrumentacion()["factorial"]["llamadas"] == 1
+    desactivar_instrumentacion(["factorial"])
+    assert operaciones.factorial is original
+
+
+def test_desactivar_instrumentacion_conserva_la_cache():
+    cache = activar_cache("factorial")
+    activar_instrumentacion(["factorial"])
+    desactivar_instrumentacion(["factorial"])
+    operaciones.factorial(7)
+    operaciones.factorial(7)
+    assert cache.aciertos == 1
+
+
+def test_instrumentacion_cuenta_llamadas_desde_el_paquete():
+    activar_instrumentacion(["factorial"])
+    paquete.factorial(6)
+    assert metricas_instrumentacion()["factorial"]["llamadas"] == 1
+
+
+def test_cache_en_memoria_y_en_disco_son_independientes(tmp_path):
+    original = operaciones.factorial
+    disco = activar_cache_disco(str(tmp_path / "cache.db"), ["factorial"], umbral_segundos=0)
+    memoria = activar_cache("factorial")
+
+    desactivar_cache("factorial")
+    assert capas.capas_activas("factorial") == ["cache_disco"]
+    operaciones.factorial(30)
+    assert disco.estadisticas()["entradas"] == 1
+
+    activar_cache("factorial")
+    desactivar_cache_disco(["factorial"])
+    assert capas.capas_activas("factorial") == ["cache"]
+    assert memoria.aciertos == 0  # la caché anterior no vuelve
+
+    desactivar_cache("factorial")
+    assert operaciones.factorial is original
+
+
+def test_calentar_usa_la_funcion_sin_capas(tmp_path):
+    disco = activar_cache_disco(str(tmp_path / "cache.db"), ["factorial"])
+    activar_instrumentacion(["factorial"])
+    assert calentar_cache(disco, [("factorial", [40])]) == 1
+    assert metricas_instrumentacion()["factorial"]["llamadas"] == 0
@@ -0,0 +1,64 @@
+"""Pruebas de paquete.columnas."""
+
+import os
+
+import pytest
+
+from paquete.columnas import EscritorColumnar, LectorColumnar
+
+
+COLUMNAS = [("n", "int64"), ("texto", "texto")]
+
+
+def _escribir(ruta, filas, agregar=False):
+    with EscritorColumnar(ruta, COLUMNAS, agregar=agregar) as escritor:
+        escritor.escribir_filas(filas)
+
+
+def test_ida_y_vuelta(tmp_path):
+    ruta = str(tmp_path / "datos.col")
+    _escribir(ruta, [(i, str(i)) for i in range(10)])
+    with LectorColumnar(ruta) as lector:
+        assert len(lector) == 10
+        assert lector[3] == (3, "3")
+        assert list(lector.columna("n")) == list(range(10))
+
+
+def test_bloque_final_cortado_se_ignora_al_leer(tmp_path):
+    ruta = str(tmp_path / "datos.col")
+    _escribir(ruta, [(1, "a")])
+    _escribir(ruta, [(2, "b")], agregar=True)
+    os.truncate(ruta, os.path.getsize(ruta) - 5)
+    with LectorColumnar(ruta) as lector:
+        assert list(lector) == [(1, "a")]
+
+
+def test_agregar_despues_de_bloque_cortado(tmp_path):
+    ruta = str(tmp_path / "datos.col")
+    _escribir(ruta, [(1, "a")])
+    _escribir(ruta, [(2, "b")], agregar=True)
+    os.truncate(ruta, os.path.getsize(ruta) - 5)
+    _escribir(ruta, [(3, "c")], agregar=True)
+    with LectorColumnar(ruta) as lector:
+        assert list(lector) == [(1, "a"), (3, "c")]
+
+
+def test_agregar_con_columnas_distintas_falla(tmp_path):
+    ruta = str(tmp_path / "datos.col")
+    _escribir(ruta, [(1, "a")])
+    with pytest.raises(ValueError):
+        EscritorColumnar(ruta, [("otra", "int64")], agregar=True)
+
+
+def test_error_de_codificacion_no_desalinea_columnas(tmp_path):
+    ruta = str(tmp_path / "datos.col")
+    escritor = EscritorColumnar(ruta, [("texto", "texto"), ("n", "int64")])
+    escritor.escribir_fila("a", "no es un entero")
+    with pytest.raises(TypeError):
+        escritor.vaciar()
+    assert [len(p) for p in escritor._pendientes] == [1, 1]
+    escritor._pendientes = [[], []]
+    escritor.escribir_fila("b", 2)
+    escritor.cerrar()
+    with LectorColumnar(ruta) as lector:
+        assert list(lector) == [("b", 2)]
@@ -0,0 +1,44 @@
+"""Pruebas de paquete.correos."""
+
+import pytest
+
+from paquete import correos
+from paquete.utilidades import validar_email
+
+EMAILS = [
+    "ana@ejemplo.com", "", "sin-arroba.com", "a@b@c.com", "ana@dominio",
+    "ana perez@ejemplo.com", "ana@ejemplo.com\n", "x@y.z", "ñ@ejemplo.com",
+]
+
+
+@pytest.mark.parametrize("procesos, tamano", [(0, 10), (1, 0)])
+def test_argumentos_invalidos_se_rechazan_al_llamar(procesos, tamano, tmp_path):
+    with pytest.raises(ValueError):
+        correos.validar_emails(iter(EMAILS), procesos, tamano)
+    with pytest.raises(ValueError):
+        correos.validar_archivo_emails(str(tmp_path / "no_existe.txt"), procesos, tamano)
+
+
+@pytest.mark.parametrize("procesos", [1, 2])
+def test_validar_emails_coincide_con_motivo_rechazo(procesos, monkeypatch):
+    # Forzar el reparto entre procesos aun con entradas chicas o una sola CPU
+    monkeypatch.setattr(correos, "MINIMO_PARALELO", 0)
+    monkeypatch.setattr(correos.os, "cpu_count", lambda: 2)
+    esperado = [(e, correos.motivo_rechazo(e) is None, correos.motivo_rechazo(e)) for e in EMAILS]
+    assert list(correos.validar_emails(EMAILS, procesos, tamano_bloque=4)) == esperado
+    assert [m for _, _, m in esperado] == [
+        None, "vacio", "arroba", "arroba", "dominio", "formato", None, "formato", "formato"]
+
+
+def test_filtrar_emails_coincide_con_validar_email():
+    assert list(correos.filtrar_emails(EMAILS)) == [e for e in EMAILS if validar_email(e)]
+
+
+def test_entradas_chicas_no_se_reparten_entre_procesos(monkeypatch):
+    def sin_procesos(*args, **kwargs):
+        raise AssertionError("no debía crear procesos")
+
+    monkeypatch.setattr(correos.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", sin_procesos)
+    assert [ok for _, ok, _ in correos.validar_emails(EMAILS, procesos=4)] == \
+        [validar_email(e) for e in EMAILS]
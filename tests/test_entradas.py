@@ -0,0 +1,33 @@
+"""Pruebas de paquete.entradas."""
+
+import pytest
+
+from paquete import entradas
+
+
+def test_fuente_base_es_abstracta():
+    with pytest.raises(TypeError):
+        entradas._Fuente()
+
+    class SinLeer(entradas._Fuente):
+        pass
+
+    with pytest.raises(TypeError):
+        SinLeer()
+
+
+def test_subclase_con_leer_hereda_el_comportamiento_comun():
+    class Fija(entradas._Fuente):
+        def __init__(self, respuestas):
+            super().__init__()
+            self._respuestas = list(respuestas)
+
+        def leer(self, mensaje=""):
+            if not self._respuestas:
+                raise EOFError
+            self.leidas += 1
+            return self._respuestas.pop(0)
+
+    fuente = Fija(["1 2", "x 3"])
+    assert [list(b) for b in fuente.numeros("int")] == [[1, 2, 3]]
+    assert len(fuente.reporte) == 1
@@ -0,0 +1,28 @@
+"""Pruebas de paquete.factoriales."""
+
+import math
+
+import pytest
+
+from paquete import factoriales
+
+
+@pytest.fixture(autouse=True)
+def _sin_puntos_control():
+    factoriales.limpiar_puntos_control()
+    yield
+    factoriales.limpiar_puntos_control()
+
+
+def test_punto_control_mayor_no_se_usa_para_dividir():
+    factoriales.factorial(5000)
+    assert factoriales._puntos.cercano(4500) == (0, 1)
+    assert factoriales.factorial(4500) == math.factorial(4500)
+
+
+def test_extiende_desde_el_punto_control_menor():
+    factoriales.factorial(4000)
+    factoriales.factorial(6000)
+    k, _ = factoriales._puntos.cercano(4500)
+    assert k == 4000
+    assert factoriales.factorial(4500) == math.factorial(4500)
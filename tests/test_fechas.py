@@ -0,0 +1,54 @@
+"""Pruebas de paquete.fechas."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from paquete.fechas import FORMATO_ISO, FORMATO_POR_DEFECTO, FormateadorFechas, formatear_fechas
+
+zoneinfo = pytest.importorskip("zoneinfo")
+
+
+def _zona(nombre):
+    try:
+        return zoneinfo.ZoneInfo(nombre)
+    except zoneinfo.ZoneInfoNotFoundError:
+        pytest.skip(f"sin datos de zona horaria para {nombre}")
+
+
+def _esperado(marca, zona, formato):
+    return datetime.fromtimestamp(marca, zona).strftime(formato)
+
+
+@pytest.mark.parametrize("nombre", ["Australia/Lord_Howe", "America/Santiago", "Asia/Kathmandu"])
+@pytest.mark.parametrize("paso", [-997, 613])
+def test_ventana_de_hora_respeta_cambios_de_horario(nombre, paso):
+    zona = _zona(nombre)
+    formateador = FormateadorFechas(FORMATO_ISO, zona)
+    inicio = int(datetime(2023, 1, 1, tzinfo=zona).timestamp())
+    fin = int(datetime(2024, 1, 1, tzinfo=zona).timestamp())
+    marcas = range(fin, inicio, paso) if paso < 0 else range(inicio, fin, paso)
+    assert formateador.formatear_lote(marcas) == [_esperado(m, zona, FORMATO_ISO) for m in marcas]
+
+
+def test_lord_howe_alrededor_del_cambio_de_media_hora():
+    zona = _zona("Australia/Lord_Howe")
+    # 2023-10-01 02:00 locales pasan a 02:30 (cambio de media hora)
+    cambio = int(datetime(2023, 10, 1, 2, 30, tzinfo=zona).timestamp())
+    marcas = list(range(cambio + 1800, cambio - 1800, -7))
+    formateador = FormateadorFechas(FORMATO_ISO, zona)
+    assert formateador.formatear_lote(marcas) == [_esperado(m, zona, FORMATO_ISO) for m in marcas]
+
+
+def test_reporte_y_mascara():
+    reporte = []
+    textos = formatear_fechas([0, "x"], FORMATO_ISO, zona=timezone.utc, reporte=reporte)
+    assert textos == ["1970-01-01T00:00:00", "x"]
+    assert [indice for indice, _ in reporte] == [1]
+
+
+def test_datetimes_con_zonas_distintas():
+    base = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    otra = base.astimezone(timezone(timedelta(hours=3)))
+    assert formatear_fechas([base, otra]) == [base.strftime(FORMATO_POR_DEFECTO),
+                                              otra.strftime(FORMATO_POR_DEFECTO)]
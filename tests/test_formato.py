@@ -0,0 +1,19 @@
+"""Pruebas de paquete.formato."""
+
+from array import array
+
+from paquete.formato import FormateadorNumeros
+
+
+def test_texto_no_numerico_no_se_traduce():
+    es = FormateadorNumeros(2, estilo="es")
+    assert es.formatear("x.y") == "x.y"
+    assert es.unir([1234.5, "x.y", 1000, None], " | ") == "1.234,50 | x.y | 1.000 | None"
+    assert es.formatear_lista(["a,b", 2.5]) == ["a,b", "2,50"]
+
+
+def test_colecciones_homogeneas_se_traducen():
+    es = FormateadorNumeros(1, estilo="es")
+    assert es.unir([1234.5, 0.25], ";") == "1.234,5;0,2"
+    assert es.formatear_lista(array("q", [1000, -2000000])) == ["1.000", "-2.000.000"]
+    assert es.unir(iter([1000, 2000])) == "1.000\n2.000"
@@ -0,0 +1,54 @@
+"""Pruebas de paquete.identificadores."""
+
+import os
+import sys
+
+import pytest
+
+from paquete import identificadores
+from paquete.identificadores import GeneradorIds, generar_ids, id_hex
+
+
+def _ids_en_hijo(funcion):
+    """Ejecuta `funcion` en un proceso hijo (fork) y devuelve su resultado."""
+    lectura, escritura = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.write(escritura, " ".join(funcion()).encode("ascii"))
+        finally:
+            os._exit(0)
+    os.close(escritura)
+    with os.fdopen(lectura, "rb") as f:
+        datos = f.read().decode("ascii")
+    os.waitpid(pid, 0)
+    return datos.split()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requiere os.fork")
+def test_fork_no_repite_ids_de_un_generador():
+    generador = GeneradorIds(8)
+    generador.generar(1)  # llena el buffer antes del fork
+    hijo = _ids_en_hijo(lambda: generador.generar(3))
+    padre = generador.generar(3)
+    assert len(hijo) == 3
+    assert not set(hijo) & set(padre)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requiere os.fork")
+def test_fork_no_repite_ids_hex_compartidos():
+    id_hex(8)
+    hijo = _ids_en_hijo(lambda: [id_hex(8) for _ in range(3)])
+    padre = [id_hex(8) for _ in range(3)]
+    assert not set(hijo) & set(padre)
+
+
+def test_generar_longitud_y_alfabeto():
+    ids = GeneradorIds(12, identificadores.ALFABETO_HEX).generar(100)
+    assert len(ids) == 100
+    assert all(len(i) == 12 and set(i) <= set("0123456789abcdef") for i in ids)
+
+
+def test_generar_ids_sin_colisiones_con_lote_mayor_que_la_ventana():
+    ids = generar_ids(150, 2, identificadores.ALFABETO_HEX, sin_colisiones=True, ventana=10)
+    assert len(set(ids)) == 150
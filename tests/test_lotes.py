@@ -0,0 +1,84 @@
+"""Pruebas de paquete.lotes."""
+
+import math
+from array import array
+
+import pytest
+
+from paquete.lotes import division_lote, porcentajes_columna, potencia_lote, redondear_columna
+
+
+def test_mayor_resto_suma_exactamente_cien():
+    porcentajes = porcentajes_columna([1, 1, 1], mayor_resto=True)
+    assert list(porcentajes) == [33.34, 33.33, 33.33]
+    assert round(math.fsum(porcentajes), 9) == 100
+
+
+@pytest.mark.parametrize("total, esperado", [(1.5, 200.0), (6, 50.0), (3, 100.0)])
+def test_mayor_resto_con_total_propio_reparte_contra_su_suma(total, esperado):
+    porcentajes = porcentajes_columna([1, 1, 1], mayor_resto=True, total=total)
+    assert round(math.fsum(porcentajes), 9) == esperado
+    exacto = 100 / total
+    assert all(abs(p - exacto) < 0.01 for p in porcentajes)
+
+
+@pytest.mark.parametrize("valores, total", [([1, math.inf], None), ([1, math.nan], None),
+                                            ([1, 2], 5e-324)])
+def test_mayor_resto_con_valores_no_finitos(valores, total):
+    with pytest.raises(ValueError, match="finitos|demasiado grande"):
+        porcentajes_columna(valores, 2, mayor_resto=True, total=total)
+
+
+def test_redondeo_arriba_desempata_lejos_de_cero():
+    assert list(redondear_columna([0.125, -0.125, 2.5, 0.1], 2, "arriba")) == [0.13, -0.13, 2.5, 0.1]
+    assert list(redondear_columna([2.5, -2.5], 0, "arriba")) == [3.0, -3.0]
+
+
+def test_redondeo_arriba_con_muchos_decimales_no_desborda():
+    valores = [0.125, 1e300, -3.5, 2.0 ** -401]
+    assert list(redondear_columna(valores, 400, "arriba")) == list(redondear_columna(valores, 400))
+
+
+def test_redondeo_arriba_con_infinitos():
+    resultado = redondear_columna([math.inf, -math.inf], 2, "arriba")
+    assert list(resultado) == [math.inf, -math.inf]
+
+
+def test_potencia_enmascara_cero_negativo_y_desborde():
+    reporte = []
+    resultado = potencia_lote([0, 2, 10.0, -8.0], [-1, 3, 400, 0.5], reporte=reporte)
+    assert math.isnan(resultado[0]) and resultado[1] == 8
+    assert math.isnan(resultado[2]) and math.isnan(resultado[3])
+    assert [indice for indice, _ in reporte] == [0, 2, 3]
+
+
+def test_potencia_con_exponentes_en_array():
+    reporte = []
+    resultado = potencia_lote(array("d", [2.0, -2.0, 0.0, 10.0]),
+                              array("d", [math.inf, 2.0, -1.0, 400.0]), reporte=reporte)
+    assert resultado[0] == math.inf and resultado[1] == 4.0
+    assert [indice for indice, _ in reporte] == [2, 3]
+
+
+def test_potencia_entera_que_no_cabe_en_el_array():
+    reporte = []
+    resultado = potencia_lote(array("q", [10, 2]), array("q", [400, 3]), reporte=reporte)
+    assert math.isnan(resultado[0]) and resultado[1] == 8.0
+    assert [indice for indice, _ in reporte] == [0]
+
+
+@pytest.mark.parametrize("base, exponente, excepcion", [
+    ([0], [-1], ZeroDivisionError),
+    ([10.0], [400], OverflowError),
+    ([-8.0], [0.5], ValueError),
+])
+def test_potencia_lanzar(base, exponente, excepcion):
+    with pytest.raises(excepcion, match="elemento 0"):
+        potencia_lote(base, exponente, errores="lanzar")
+
+
+def test_division_enmascara_ceros():
+    reporte = []
+    resultado = division_lote([1, 2], [0, 4], reporte=reporte)
+    assert math.isnan(resultado[0]) and resultado[1] == 0.5
+    assert reporte == [(0, "No se puede dividir por cero")]
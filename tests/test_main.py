@@ -0,0 +1,39 @@
+"""Pruebas del modo por lotes de main.py."""
+
+import io
+import json
+
+import main
+
+
+def _lote(lineas, formato="texto"):
+    destino = io.StringIO()
+    total, errores = main.ejecutar_lote(lineas, destino, formato)
+    return destino.getvalue().splitlines(), total, errores
+
+
+def test_entero_enorme_en_texto_no_aborta_el_lote():
+    salida, total, errores = _lote(["factorial 2000", "suma 1 2"])
+    assert (total, errores) == (2, 0)
+    assert salida[0].startswith("factorial 2000 = 0x")
+    assert int(salida[0].split(" = ")[1], 16) == main.obtener_operacion("factorial")(2000)
+    assert salida[1] == "suma 1 2 = 3"
+
+
+def test_entero_enorme_en_json_se_codifica_en_hexadecimal():
+    salida, total, errores = _lote(["potencia 10 5000", "resta 5 2"], "json")
+    assert (total, errores) == (2, 0)
+    primero = json.loads(salida[0])
+    assert int(primero["resultado"]["entero_hex"], 16) == 10 ** 5000
+    assert json.loads(salida[1])["resultado"] == 3
+
+
+def test_resultado_no_serializable_se_reporta_en_su_linea():
+    resultados = [
+        {"linea": 1, "operacion": "x", "argumentos": [], "resultado": object()},
+        {"linea": 2, "operacion": "suma", "argumentos": [1, 1], "resultado": 2},
+    ]
+    destino = io.StringIO()
+    assert main.escribir_resultados(resultados, destino, "json") == (2, 1)
+    lineas = [json.loads(l) for l in destino.getvalue().splitlines()]
+    assert "error" in lineas[0] and lineas[1]["resultado"] == 2
@@ -0,0 +1,22 @@
+"""Pruebas de paquete.operaciones."""
+
+import subprocess
+import sys
+
+from paquete import operaciones
+
+
+def test_importar_operaciones_no_carga_lotes():
+    codigo = (
+        "import sys\n"
+        "from paquete import suma\n"
+        "print('paquete.lotes' in sys.modules, 'paquete.raices' in sys.modules)\n"
+    )
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True,
+                            text=True, check=True).stdout
+    assert salida.split() == ["False", "False"]
+
+
+def test_raiz_cuadrada_entero_grande():
+    assert operaciones.raiz_cuadrada(16) == 4.0
+    assert operaciones.raiz_cuadrada(10 ** 400) == 1e200
@@ -0,0 +1,39 @@
+"""Pruebas de paquete.paralelo."""
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from paquete import operaciones
+from paquete.paralelo import mapa_paralelo
+
+
+def test_coincide_con_map_en_serie_y_conserva_el_orden():
+    argumentos = [3000, 5, 0, 1200, 7, 2500, 1, 40] * 3
+    esperado = list(map(operaciones.factorial, argumentos))
+    assert mapa_paralelo("factorial", argumentos, procesos=2, umbral=0) == esperado
+
+
+def test_argumentos_en_tuplas_con_pool_propio():
+    argumentos = [(n, 7) for n in range(-20, 20)]
+    esperado = [operaciones.potencia(*args) for args in argumentos]
+    with ThreadPoolExecutor(max_workers=3) as ejecutor:
+        assert mapa_paralelo("potencia", argumentos, ejecutor=ejecutor, umbral=0) == esperado
+
+
+def test_funcion_propia_en_serie_por_debajo_del_umbral():
+    assert mapa_paralelo(math.isqrt, range(10)) == list(map(math.isqrt, range(10)))
+    assert mapa_paralelo("suma", []) == []
+
+
+def test_propaga_la_primera_excepcion():
+    with ThreadPoolExecutor(max_workers=2) as ejecutor:
+        with pytest.raises(ZeroDivisionError):
+            mapa_paralelo("division", [(1, 2), (3, 0), (5, 6)], ejecutor=ejecutor, umbral=0)
+
+
+@pytest.mark.parametrize("funcion", ["_privada", "no_existe"])
+def test_nombre_invalido(funcion):
+    with pytest.raises(ValueError):
+        mapa_paralelo(funcion, [1])
@@ -0,0 +1,58 @@
+"""Pruebas de paquete.primos."""
+
+import math
+
+import pytest
+
+from paquete.primos import LIMITE_CRIBA, es_primo, es_primo_lote, limpiar_criba, primos_en_rango
+
+
+def _division_tentativa(n):
+    if n < 2:
+        return False
+    return all(n % d for d in range(2, math.isqrt(n) + 1))
+
+
+def test_criba_coincide_con_division_tentativa():
+    limpiar_criba()
+    numeros = list(range(-5, 5000))
+    esperado = [_division_tentativa(n) for n in numeros]
+    assert [es_primo(n) for n in numeros] == esperado
+    assert es_primo_lote(numeros) == esperado
+
+
+def test_alrededor_del_limite_de_la_criba():
+    numeros = list(range(LIMITE_CRIBA - 300, LIMITE_CRIBA + 300))
+    esperado = [_division_tentativa(n) for n in numeros]
+    assert [es_primo(n) for n in numeros] == esperado
+    assert es_primo_lote(reversed(numeros)) == esperado[::-1]
+
+
+@pytest.mark.parametrize("numero, primo", [
+    (561, False),                       # Carmichael
+    (3215031751, False),                # pseudoprimo fuerte en bases 2, 3, 5 y 7
+    (2 ** 61 - 1, True),
+    (2 ** 89 - 1, True),                # por encima del límite determinista
+    ((2 ** 61 - 1) * (2 ** 89 - 1), False),
+    (3825123056546413051, False),       # pseudoprimo fuerte en las bases hasta 23
+])
+def test_numeros_grandes(numero, primo):
+    assert es_primo(numero) is primo
+    assert es_primo_lote([numero]) == [primo]
+
+
+@pytest.mark.parametrize("a, b, tamano", [(0, 3000, 64), (1, 2, 8), (997, 1500, 7),
+                                          (LIMITE_CRIBA - 500, LIMITE_CRIBA + 500, 100)])
+def test_rango_segmentado_coincide_con_division_tentativa(a, b, tamano):
+    esperado = [n for n in range(a, b) if _division_tentativa(n)]
+    assert list(primos_en_rango(a, b, tamano)) == esperado
+    assert list(primos_en_rango(a, b)) == esperado
+
+
+def test_tipos_invalidos():
+    with pytest.raises(TypeError):
+        es_primo(7.0)
+    with pytest.raises(TypeError):
+        es_primo_lote([2, "3"])
+    with pytest.raises(ValueError):
+        list(primos_en_rango(0, 10, 0))
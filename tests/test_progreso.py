@@ -0,0 +1,69 @@
+"""Pruebas de paquete.progreso."""
+
+import io
+
+import pytest
+
+from paquete import progreso
+from paquete.progreso import Progreso, con_progreso
+
+
+class _Reloj:
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self):
+        return self.ahora
+
+
+@pytest.fixture
+def reloj(monkeypatch):
+    reloj = _Reloj()
+    monkeypatch.setattr(progreso.time, "perf_counter", reloj)
+    return reloj
+
+
+def test_terminal_redibuja_solo_al_cambiar_de_celda(reloj):
+    destino = io.StringIO()
+    with Progreso(total=100_000, destino=destino, ancho=10, tty=True) as barra:
+        for _ in range(100_000):
+            barra.tick()
+    # Una vez por celda (incluida la vacía) y el estado final
+    assert destino.getvalue().count("\r") == 12
+    assert "100.0% (100000/100000)" in destino.getvalue().split("\r")[-1]
+    assert destino.getvalue().endswith("\n")
+
+
+def test_terminal_redibuja_por_intervalo_sin_total(reloj):
+    destino = io.StringIO()
+    barra = Progreso(destino=destino, intervalo_minimo=0.5, tty=True)
+    for _ in range(100):
+        reloj.ahora += 0.1
+        barra.tick()
+    barra.cerrar()
+    dibujos = destino.getvalue().count("\r")
+    assert 18 <= dibujos <= 22
+
+
+def test_sin_terminal_escribe_lineas_por_intervalo(reloj):
+    destino = io.StringIO()
+    for _ in con_progreso(range(100), mensaje="Filas", destino=destino, intervalo_registro=10.0):
+        reloj.ahora += 1.0
+    lineas = destino.getvalue().splitlines()
+    assert "\r" not in destino.getvalue()
+    assert 10 <= len(lineas) <= 12
+    assert all(linea.startswith("Filas:") for linea in lineas)
+    assert "100/100" in lineas[-1]
+
+
+def test_sin_terminal_detectado_desde_el_destino():
+    destino = io.StringIO()
+    with Progreso(total=3, destino=destino) as barra:
+        barra.tick(3)
+    assert destino.getvalue().count("\n") == 1
+    assert "\r" not in destino.getvalue()
+
+
+def test_total_negativo():
+    with pytest.raises(ValueError):
+        Progreso(total=-1)
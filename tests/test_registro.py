@@ -0,0 +1,76 @@
+"""Pruebas de paquete.registro."""
+
+import math
+
+import pytest
+
+import main
+from paquete.registro import (NUMERO, buscar_operacion, eliminar_operacion, obtener_operacion,
+                              registrar_operacion)
+
+
+@pytest.fixture
+def hipotenusa():
+    llamadas = []
+
+    def hipotenusa(a, b):
+        llamadas.append((a, b))
+        return math.hypot(a, b)
+
+    def positivos(a, b):
+        if a < 0 or b < 0:
+            raise ValueError("Los catetos no pueden ser negativos")
+
+    registrar_operacion("hipotenusa", hipotenusa, tipos=(NUMERO, NUMERO), validador=positivos,
+                        descripcion="la hipotenusa")
+    yield llamadas
+    eliminar_operacion("hipotenusa")
+
+
+def test_operacion_registrada_se_valida_y_despacha(hipotenusa):
+    operacion = obtener_operacion("hipotenusa")
+    assert (operacion.minimo, operacion.maximo, operacion.parametros) == (2, 2, ("a", "b"))
+    assert operacion(3, 4) == 5.0
+    assert main.calcular("hipotenusa", 6, 8) == (10.0, "la hipotenusa")
+    assert hipotenusa == [(3, 4), (6, 8)]
+
+    with pytest.raises(ValueError, match="espera 2 argumentos"):
+        operacion(3)
+    with pytest.raises(TypeError, match="argumento 2 de hipotenusa"):
+        operacion(3, "4")
+    with pytest.raises(ValueError, match="negativos"):
+        operacion(-3, 4)
+    assert hipotenusa == [(3, 4), (6, 8)]
+
+
+def test_decorador_y_nombre_repetido():
+    @registrar_operacion("triple", tipos=(int,))
+    def triple(n):
+        return 3 * n
+
+    try:
+        assert triple(2) == 6
+        assert buscar_operacion("triple")(5) == 15
+        with pytest.raises(ValueError, match="ya está registrada"):
+            registrar_operacion("triple", triple, tipos=(int,))
+    finally:
+        eliminar_operacion("triple")
+    assert buscar_operacion("triple") is None
+
+
+def test_parametros_opcionales_y_tipos_que_no_coinciden():
+    redondear = obtener_operacion("redondear")
+    assert (redondear.minimo, redondear.maximo) == (1, 2)
+    assert redondear(2.345) == 2.35 and redondear(2.345, 1) == 2.3
+    with pytest.raises(ValueError):
+        registrar_operacion("mal", lambda a: a, tipos=(NUMERO, NUMERO))
+
+
+def test_integradas_usan_la_funcion_vigente_y_sus_validadores():
+    with pytest.raises(ZeroDivisionError):
+        obtener_operacion("division")(1, 0)
+    with pytest.raises(ValueError):
+        obtener_operacion("factorial")(-1)
+    assert obtener_operacion("factorial")(5) == 120
+    with pytest.raises(ValueError, match="desconocida"):
+        obtener_operacion("no_existe")
@@ -0,0 +1,46 @@
+"""Pruebas de paquete.salida."""
+
+import io
+import time
+
+import pytest
+
+from paquete import salida, utilidades
+
+
+@pytest.fixture
+def restaurar_salida():
+    sumidero, nivel = salida.obtener_sumidero(), salida.nivel_minimo()
+    yield
+    salida.configurar_salida(sumidero, nivel)
+
+
+def test_buffer_se_vacia_por_intervalo_sin_mas_mensajes():
+    destino = io.StringIO()
+    sumidero = salida.SumideroBuffer(destino, intervalo=0.05)
+    sumidero.escribir("hola", "info")
+    assert destino.getvalue() == ""
+    limite = time.monotonic() + 5
+    while not destino.getvalue() and time.monotonic() < limite:
+        time.sleep(0.01)
+    assert destino.getvalue() == "ℹ️ hola\n"
+
+
+def test_buffers_comparten_un_gancho_de_atexit(monkeypatch):
+    def registrar(*args, **kwargs):
+        raise AssertionError("cada sumidero no debe registrar su propio gancho")
+
+    monkeypatch.setattr(salida.atexit, "register", registrar)
+    destino = io.StringIO()
+    sumidero = salida.SumideroBuffer(destino, intervalo=None)
+    sumidero.escribir("pendiente", "warning")
+    salida._vaciar_buffers()
+    assert destino.getvalue() == "⚠️ pendiente\n"
+
+
+def test_imprimir_mensaje_usa_la_configuracion_publica(restaurar_salida):
+    destino = io.StringIO()
+    salida.configurar_salida(salida.SumideroConsola(destino), "warning")
+    utilidades.imprimir_mensaje("oculto", "info")
+    utilidades.imprimir_mensaje("visible", "error")
+    assert destino.getvalue() == "❌ visible\n"
@@ -0,0 +1,61 @@
+"""Pruebas de paquete.servidor."""
+
+import asyncio
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from paquete.servidor import ClienteCalculo, ErrorRemoto, ServidorCalculo
+
+
+def _con_servidor(prueba):
+    async def ejecutar():
+        with ThreadPoolExecutor(max_workers=2) as ejecutor:
+            servidor = ServidorCalculo(puerto=0, ejecutor=ejecutor)
+            await servidor.iniciar()
+            try:
+                return await prueba(servidor.puerto)
+            finally:
+                await servidor.cerrar()
+    return asyncio.run(ejecutar())
+
+
+def test_ida_y_vuelta_por_el_cliente():
+    async def prueba(puerto):
+        async with ClienteCalculo(puerto=puerto) as cliente:
+            return (await cliente.llamar("suma", 3, 4),
+                    await cliente.llamar("factorial", 2000),
+                    await cliente.llamar_muchos("potencia", [[2, n] for n in range(5)]))
+
+    suma, factorial, potencias = _con_servidor(prueba)
+    assert suma == 7
+    assert factorial == math.factorial(2000)
+    assert potencias == [1, 2, 4, 8, 16]
+
+
+def test_error_de_la_operacion_llega_como_error_remoto():
+    async def prueba(puerto):
+        async with ClienteCalculo(puerto=puerto) as cliente:
+            with pytest.raises(ErrorRemoto) as error:
+                await cliente.llamar("division", 1, 0)
+            return error.value.tipo, await cliente.llamar("resta", 5, 2)
+
+    assert _con_servidor(prueba) == ("ZeroDivisionError", 3)
+
+
+def test_linea_invalida_recibe_una_linea_de_error():
+    async def prueba(puerto):
+        lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+        escritor.write(b'{"id": 9, "funcion": "no_existe"}\n')
+        await escritor.drain()
+        respuesta = json.loads(await lector.readline())
+        escritor.close()
+        await escritor.wait_closed()
+        return respuesta
+
+    respuesta = _con_servidor(prueba)
+    assert respuesta["id"] == 9
+    assert respuesta["tipo"] == "PeticionInvalida"
+    assert "no_existe" in respuesta["error"]
@@ -0,0 +1,23 @@
+"""Pruebas de benchmarks/suite.py."""
+
+import importlib.util
+from pathlib import Path
+
+RUTA_SUITE = Path(__file__).resolve().parent.parent / "benchmarks" / "suite.py"
+
+
+def _cargar_suite():
+    especificacion = importlib.util.spec_from_file_location("suite", RUTA_SUITE)
+    modulo = importlib.util.module_from_spec(especificacion)
+    especificacion.loader.exec_module(modulo)
+    return modulo
+
+
+def test_todas_las_funciones_publicas_tienen_casos():
+    suite = _cargar_suite()
+    assert [f for f in suite.funciones_publicas() if f not in suite.CASOS] == []
+
+
+def test_caso_obtener_numeros_lee_de_memoria():
+    suite = _cargar_suite()
+    assert len(suite.CASOS[("utilidades", "obtener_numeros")]["pequeno"]()) == 10
@@ -0,0 +1,26 @@
+"""Pruebas de paquete.teoria_numeros."""
+
+import pytest
+
+from paquete.teoria_numeros import mcd_lote
+
+
+def test_mcd_lote_se_detiene_en_uno():
+    assert mcd_lote([12, 18, 5, 10]) == 1
+    assert mcd_lote([12, 18, 30]) == 6
+    assert mcd_lote([]) == 0
+
+
+@pytest.mark.parametrize("numeros", [[3, 4, "x"], [3, 4, 8, 2.0], iter([1, None])])
+def test_mcd_lote_valida_despues_de_llegar_a_uno(numeros):
+    with pytest.raises(TypeError):
+        mcd_lote(numeros)
+
+
+def test_mcd_lote_valida_el_resto_sin_materializarlo():
+    def numeros():
+        yield from (2, 3, "x")
+        raise AssertionError("se consumió más allá del primer valor inválido")
+
+    with pytest.raises(TypeError):
+        mcd_lote(numeros())